@@ -0,0 +1 @@
+"""Synthetic data and headless benchmarks for the dashboard."""
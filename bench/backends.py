@@ -0,0 +1,97 @@
+"""Compare compute backends on the page aggregations.
+
+    python -m bench.backends --rows 1000000 10000000 --repeat 3
+
+For each size, ingests a generated dataset once, builds the rollup cube and
+the value counts of every categorical column on each backend, checks the
+results agree, and reports the best-of-``--repeat`` timings as JSON.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from bench.generate import dataset_path
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(ROOT, "bench", "data")
+BACKENDS = ["pandas", "polars"]
+CUBE_ROLLUPS = ("by_region", "by_category", "by_subcategory", "by_product", "by_day")
+
+
+def _best_ms(call, repeat: int):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = call()
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return best, result
+
+
+def _same_rollup(left: pd.DataFrame, right: pd.DataFrame) -> bool:
+    if len(left) != len(right):
+        return False
+    left_keys = [tuple(map(str, key)) if isinstance(key, tuple) else str(key) for key in left.index]
+    right_keys = [tuple(map(str, key)) if isinstance(key, tuple) else str(key) for key in right.index]
+    return (left_keys == right_keys
+            and np.allclose(left["sum"], right["sum"], rtol=1e-9)
+            and (left["count"].to_numpy() == right["count"].to_numpy()).all())
+
+
+def _same_counts(left: pd.Series, right: pd.Series) -> bool:
+    return list(map(str, left.index)) == list(map(str, right.index)) and (left.to_numpy() == right.to_numpy()).all()
+
+
+def compare(rows: int, repeat: int, seed: int) -> dict:
+    from dashview import ingest
+    from dashview.backend import get_backend
+    from dashview.rollups import build_cube
+
+    with open(dataset_path(DATA_DIR, rows, seed), "rb") as handle:
+        df = ingest.load_dataset(handle.read()).dataset.df
+    columns = [col for col in df.columns if isinstance(df[col].dtype, pd.CategoricalDtype)]
+
+    timings, cubes, counts = {}, {}, {}
+    for name in BACKENDS:
+        backend = get_backend(name)
+        if backend.name != name:
+            print(f"skipping {name}: not installed", file=sys.stderr)
+            continue
+        cube_ms, cubes[name] = _best_ms(lambda: build_cube(df, backend), repeat)
+        counts_ms, counts[name] = _best_ms(lambda: {col: backend.value_counts(df[col]) for col in columns}, repeat)
+        timings[name] = {"cube_ms": cube_ms, "value_counts_ms": counts_ms}
+
+    matches = {}
+    if len(cubes) == 2:
+        reference, other = (cubes[name] for name in BACKENDS)
+        matches["cube"] = all(_same_rollup(getattr(reference, rollup), getattr(other, rollup)) for rollup in CUBE_ROLLUPS)
+        matches["value_counts"] = all(_same_counts(counts["pandas"][col], counts["polars"][col]) for col in columns)
+    return {"rows": len(df), "cpus": os.cpu_count(), "timings": timings, "results_match": matches}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=None)
+    args = parser.parse_args(argv)
+
+    report = [compare(rows, args.repeat, args.seed) for rows in args.rows]
+    for result in report:
+        line = " · ".join(f"{name}: cube {t['cube_ms']:.0f} ms, value_counts {t['value_counts_ms']:.0f} ms"
+                          for name, t in result["timings"].items())
+        print(f"{result['rows']:>12,} rows  {line}  match={result['results_match']}")
+    if args.out:
+        with open(args.out, "w") as handle:
+            json.dump(report, handle, indent=2)
+    mismatched = any(not ok for result in report for ok in result["results_match"].values())
+    return 1 if mismatched else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+"""Deterministic Superstore-schema CSV generator.
+
+    python -m bench.generate --rows 1000000 --out data/superstore_1m.csv
+
+The same ``--rows``/``--seed`` always produce the same bytes.  Region, State,
+Category and Sub-Category have the real Superstore cardinalities; products,
+customers and cities grow sublinearly with the row count, as they do in
+real exports.  Rows are written in chunks, so 50M-row files need no more
+memory than a 1M-row one.
+"""
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+CHUNK_ROWS = 1_000_000
+
+STATES_BY_REGION = {
+    "East": ["New York", "Pennsylvania", "Ohio", "Massachusetts", "New Jersey", "Delaware", "Connecticut", "Rhode Island",
+             "Maryland", "New Hampshire", "Vermont", "Maine", "District of Columbia", "West Virginia"],
+    "West": ["California", "Washington", "Arizona", "Colorado", "Oregon", "Utah", "Nevada", "New Mexico", "Idaho",
+             "Montana", "Wyoming"],
+    "Central": ["Texas", "Illinois", "Michigan", "Indiana", "Wisconsin", "Minnesota", "Missouri", "Oklahoma", "Iowa",
+                "Nebraska", "Kansas", "South Dakota", "North Dakota"],
+    "South": ["Florida", "North Carolina", "Virginia", "Tennessee", "Georgia", "Kentucky", "Alabama", "Mississippi",
+              "Louisiana", "South Carolina", "Arkansas"],
+}
+SUBCATEGORIES = {
+    "Furniture": ["Bookcases", "Chairs", "Furnishings", "Tables"],
+    "Office Supplies": ["Appliances", "Art", "Binders", "Envelopes", "Fasteners", "Labels", "Paper", "Storage", "Supplies"],
+    "Technology": ["Accessories", "Copiers", "Machines", "Phones"],
+}
+SEGMENTS = (["Consumer", "Corporate", "Home Office"], [0.52, 0.30, 0.18])
+SHIP_MODES = (["Standard Class", "Second Class", "First Class", "Same Day"], [0.60, 0.19, 0.15, 0.06])
+COLUMNS = ["Row ID", "Order ID", "Order Date", "Ship Date", "Ship Mode", "Customer ID", "Customer Name", "Segment",
+           "Country", "City", "State", "Postal Code", "Region", "Product ID", "Category", "Sub-Category",
+           "Product Name", "Sales"]
+START_DATE = np.datetime64("2015-01-01")
+DAYS = 4 * 365
+
+
+def cardinality(rows: int, at_10k: int, cap: int) -> int:
+    """Distinct count that matches the sample file at 10k rows and grows with sqrt(rows)."""
+    return int(min(max(at_10k * (rows / 10_000) ** 0.5, 10), cap))
+
+
+class Catalogue:
+    """Dimension tables drawn once per (rows, seed)."""
+
+    def __init__(self, rows: int, rng: np.random.Generator):
+        self.states = np.array([state for states in STATES_BY_REGION.values() for state in states])
+        self.state_region = np.array([region for region, states in STATES_BY_REGION.items() for _ in states])
+        state_weights = rng.pareto(1.2, len(self.states)) + 0.2
+        self.state_p = state_weights / state_weights.sum()
+
+        n_cities = cardinality(rows, 530, 20_000)
+        self.city_state = rng.choice(len(self.states), n_cities, p=self.state_p)
+        self.cities = np.array([f"City {i:05d}" for i in range(n_cities)])
+        self.city_postal = rng.integers(10_000, 99_999, n_cities)
+
+        sub_categories = [(category, sub) for category, subs in SUBCATEGORIES.items() for sub in subs]
+        n_products = cardinality(rows, 1_850, 500_000)
+        product_sub = rng.integers(0, len(sub_categories), n_products)
+        self.product_category = np.array([sub_categories[i][0] for i in product_sub])
+        self.product_sub = np.array([sub_categories[i][1] for i in product_sub])
+        self.product_names = np.array([f"{sub_categories[s][1]} Item {i:06d}" for i, s in enumerate(product_sub)])
+        self.product_ids = np.array([f"{sub_categories[s][0][:3].upper()}-{sub_categories[s][1][:2].upper()}-{10_000_000 + i}"
+                                     for i, s in enumerate(product_sub)])
+        self.product_price = rng.lognormal(3.5, 1.2, n_products)
+        # Zipf-like popularity over a shuffled ranking: a few best sellers, a long tail.
+        popularity = 1.0 / rng.permutation(np.arange(1, n_products + 1)) ** 1.1
+        self.product_p = popularity / popularity.sum()
+
+        n_customers = cardinality(rows, 790, 2_000_000)
+        self.customer_ids = np.array([f"CU-{i:07d}" for i in range(n_customers)])
+        self.customer_names = np.array([f"Customer {i:07d}" for i in range(n_customers)])
+        self.customer_segment = rng.choice(SEGMENTS[0], n_customers, p=SEGMENTS[1])
+        self.customer_city = rng.integers(0, n_cities, n_customers)
+
+
+def generate_chunk(catalogue: Catalogue, start: int, rows: int, rng: np.random.Generator) -> pd.DataFrame:
+    customers = rng.integers(0, len(catalogue.customer_ids), rows)
+    cities = catalogue.customer_city[customers]
+    states = catalogue.city_state[cities]
+    products = rng.choice(len(catalogue.product_ids), rows, p=catalogue.product_p)
+    order_dates = START_DATE + rng.integers(0, DAYS, rows).astype("timedelta64[D]")
+    ship_dates = order_dates + rng.integers(0, 8, rows).astype("timedelta64[D]")
+    years = order_dates.astype("datetime64[Y]").astype(int) + 1970
+    quantity = rng.integers(1, 10, rows)
+    sales = np.round(catalogue.product_price[products] * quantity * rng.uniform(0.8, 1.0, rows), 4)
+
+    order_dates = pd.to_datetime(order_dates)
+    ship_dates = pd.to_datetime(ship_dates)
+    row_ids = np.arange(start + 1, start + rows + 1)
+    return pd.DataFrame({
+        "Row ID": row_ids,
+        "Order ID": [f"US-{year}-{row_id:09d}" for year, row_id in zip(years, row_ids // 3)],
+        "Order Date": order_dates.strftime("%d/%m/%Y"),
+        "Ship Date": ship_dates.strftime("%d/%m/%Y"),
+        "Ship Mode": rng.choice(SHIP_MODES[0], rows, p=SHIP_MODES[1]),
+        "Customer ID": catalogue.customer_ids[customers],
+        "Customer Name": catalogue.customer_names[customers],
+        "Segment": catalogue.customer_segment[customers],
+        "Country": "United States",
+        "City": catalogue.cities[cities],
+        "State": catalogue.states[states],
+        "Postal Code": catalogue.city_postal[cities],
+        "Region": catalogue.state_region[states],
+        "Product ID": catalogue.product_ids[products],
+        "Category": catalogue.product_category[products],
+        "Sub-Category": catalogue.product_sub[products],
+        "Product Name": catalogue.product_names[products],
+        "Sales": sales,
+    }, columns=COLUMNS)
+
+
+def generate(path: str, rows: int, seed: int = 0, chunk_rows: int = CHUNK_ROWS) -> str:
+    """Write a ``rows``-row Superstore CSV to ``path`` and return the path."""
+    rng = np.random.default_rng(seed)
+    catalogue = Catalogue(rows, rng)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8", newline="") as out:
+        for start in range(0, rows, chunk_rows):
+            chunk = generate_chunk(catalogue, start, min(chunk_rows, rows - start), rng)
+            chunk.to_csv(out, index=False, header=start == 0)
+    return path
+
+
+def dataset_path(directory: str, rows: int, seed: int = 0) -> str:
+    """Generate (once) and return the cached CSV for ``rows``/``seed`` under ``directory``."""
+    path = os.path.join(directory, f"superstore_{rows}_{seed}.csv")
+    if not os.path.exists(path):
+        generate(path, rows, seed)
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=None, help="defaults to bench/data/superstore_<rows>_<seed>.csv")
+    args = parser.parse_args(argv)
+    out = args.out or os.path.join("bench", "data", f"superstore_{args.rows}_{args.seed}.csv")
+    print(generate(out, args.rows, args.seed))
+
+
+if __name__ == "__main__":
+    main()
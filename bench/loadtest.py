@@ -0,0 +1,247 @@
+"""Concurrent-session load test.
+
+    python -m bench.loadtest --sessions 30 --rows 1000000 --rounds 3
+
+Streamlit serves every browser session from one server process, sharing
+its ``DatasetStore``; this harness does the same, with every simulated
+analyst a thread in this process driving its own ``AppTest``.  Each
+session uploads a dataset through ``session.receive_upload`` (``main.py``'s
+upload handler; shared when ``--distinct-files`` is below ``--sessions``),
+opens ``main.py`` and then clicks through the region/category selectboxes,
+the moving-average slider and the Data Table search box.
+
+``AppTest`` cannot upload files, and its script runs share Streamlit's
+process-global state, so concurrent runs in one process fail at random.
+Script runs therefore take turns on ``SCRIPT_LOCK``; uploads, the
+background prefetch and DuckDB queries outside a run still overlap.  Each
+action's latency includes its wait for the lock (what an analyst waits
+for on a saturated server) and the wait is also reported on its own.
+
+Reports throughput, p50/p95/p99 interaction latency (overall and per
+action), queueing, the store's sharing counters and this process's RSS
+sampled over the run.  Nothing leaves the machine.
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+
+import numpy as np
+
+from bench.generate import dataset_path
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(ROOT, "bench", "data")
+PAGES = os.path.join(ROOT, "pages")
+SEARCH_QUERIES = ["c", "ca", "cal", "new", "west", "tex", ""]
+MOVING_AVERAGE_WINDOWS = [7, 14, 30, 60, 90]
+
+# One AppTest script run at a time (see the module docstring).
+SCRIPT_LOCK = threading.Lock()
+
+
+def current_rss_mb() -> float:
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / 1024 ** 2
+    except ImportError:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    return float("nan")
+
+
+class RssSampler(threading.Thread):
+    def __init__(self, interval: float):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.samples = []
+        self._done = threading.Event()
+        self._start = time.perf_counter()
+
+    def run(self):
+        while not self._done.is_set():
+            self.samples.append((round(time.perf_counter() - self._start, 3), round(current_rss_mb(), 1)))
+            self._done.wait(self.interval)
+
+    def stop(self):
+        self._done.set()
+        self.join()
+
+
+def _widget(widgets, label_prefix: str):
+    return next(widget for widget in widgets if widget.label.startswith(label_prefix))
+
+
+class Session:
+    """One simulated analyst; records ``(action, ms, queued_ms)`` for every interaction."""
+
+    def __init__(self, number: int, csv_path: str, timeout: float):
+        self.number = number
+        self.csv_path = csv_path
+        self.timeout = timeout
+        self.state = {}
+        self.latencies = []
+        self.errors = []
+
+    def _timed(self, action: str, call, locked: bool = True):
+        start = time.perf_counter()
+        queued_ms = 0.0
+        if locked:
+            with SCRIPT_LOCK:
+                queued_ms = (time.perf_counter() - start) * 1000
+                result = call()
+        else:
+            result = call()
+        self.latencies.append((action, (time.perf_counter() - start) * 1000, queued_ms))
+        return result
+
+    def _open(self, script: str):
+        from streamlit.testing.v1 import AppTest
+
+        def run():
+            app = AppTest.from_file(script, default_timeout=self.timeout)
+            for key, value in self.state.items():
+                app.session_state[key] = value
+            return app.run()
+
+        app = self._timed(f"open {os.path.basename(script)}", run)
+        if app.exception:
+            raise RuntimeError(f"{script}: {app.exception[0].value}")
+        return app
+
+    def _interact(self, action: str, app, widget_change):
+        self._timed(action, lambda: widget_change().run())
+        if app.exception:
+            raise RuntimeError(f"{action}: {app.exception[0].value}")
+
+    def upload(self):
+        from dashview import session
+
+        with open(self.csv_path, "rb") as handle:
+            data = handle.read()
+        # main.py's handler runs outside the script lock: concurrent uploads meet in the shared store.
+        self._timed("upload", lambda: session.receive_upload(self.state, data, upload_id=(self.csv_path, "auto")),
+                    locked=False)
+        self._open(os.path.join(ROOT, "main.py"))
+
+    def click_through(self):
+        app = self._open(os.path.join(PAGES, "2_Region_Sales.py"))
+        region = _widget(app.selectbox, "Select a region")
+        for option in region.options:
+            self._interact("select region", app, lambda: _widget(app.selectbox, "Select a region").select(option))
+
+        app = self._open(os.path.join(PAGES, "3_Treemap.py"))
+        for option in _widget(app.selectbox, "Select a category").options:
+            self._interact("select category", app, lambda: _widget(app.selectbox, "Select a category").select(option))
+
+        app = self._open(os.path.join(PAGES, "4_Time_Series.py"))
+        for window in MOVING_AVERAGE_WINDOWS:
+            self._interact("move slider", app, lambda: _widget(app.slider, "Select Moving Average").set_value(window))
+
+        app = self._open(os.path.join(PAGES, "5_Hierarchical.py"))
+        for option in _widget(app.selectbox, "Select a category to analyze").options:
+            self._interact("select category", app,
+                           lambda: _widget(app.selectbox, "Select a category to analyze").select(option))
+
+        app = self._open(os.path.join(PAGES, "6_Data_Table.py"))
+        for query in SEARCH_QUERIES:
+            self._interact("search", app, lambda: _widget(app.text_input, "🔍 Search").input(query))
+
+    def run(self, rounds: int):
+        try:
+            self.upload()
+            for _ in range(rounds):
+                self.click_through()
+        except Exception as exc:  # noqa: BLE001 - a failed session is reported, not fatal
+            self.errors.append(repr(exc))
+
+
+def _percentiles(samples: list) -> dict:
+    if not samples:
+        return {}
+    return {
+        "count": len(samples),
+        "p50_ms": float(np.percentile(samples, 50)),
+        "p95_ms": float(np.percentile(samples, 95)),
+        "p99_ms": float(np.percentile(samples, 99)),
+        "max_ms": float(max(samples)),
+    }
+
+
+def run(sessions: int, rows: int, distinct_files: int, rounds: int, ramp: float, timeout: float, interval: float) -> dict:
+    paths = [dataset_path(DATA_DIR, rows, seed) for seed in range(max(1, min(distinct_files, sessions)))]
+    simulated = [Session(number, paths[number % len(paths)], timeout) for number in range(sessions)]
+    threads = [threading.Thread(target=session.run, args=(rounds,), name=f"session-{session.number}")
+               for session in simulated]
+
+    sampler = RssSampler(interval)
+    sampler.start()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+        time.sleep(ramp)
+    for thread in threads:
+        thread.join()
+    wall_s = time.perf_counter() - start
+    sampler.stop()
+
+    by_action = defaultdict(list)
+    for session in simulated:
+        for action, ms, _ in session.latencies:
+            by_action[action].append(ms)
+    interactions = [ms for session in simulated for action, ms, _ in session.latencies if action != "upload"]
+    queued = [queued_ms for session in simulated for action, _, queued_ms in session.latencies if action != "upload"]
+
+    from dashview.store import get_store
+    return {
+        "config": {"sessions": sessions, "rows": rows, "distinct_files": len(paths), "rounds": rounds, "ramp_s": ramp},
+        "wall_s": wall_s,
+        "throughput_per_s": len(interactions) / wall_s if wall_s else 0.0,
+        "latency": _percentiles(interactions),
+        "queued": _percentiles(queued),
+        "by_action": {action: _percentiles(samples) for action, samples in sorted(by_action.items())},
+        "rss_mb": {"peak": max(mb for _, mb in sampler.samples), "timeline": sampler.samples},
+        "store": get_store().stats(),
+        "errors": [error for session in simulated for error in session.errors],
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=10)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--distinct-files", type=int, default=1, help="how many different files the sessions upload")
+    parser.add_argument("--rounds", type=int, default=2, help="click-throughs per session after the upload")
+    parser.add_argument("--ramp", type=float, default=0.2, help="seconds between session starts")
+    parser.add_argument("--timeout", type=float, default=600.0)
+    parser.add_argument("--interval", type=float, default=0.5, help="RSS sampling interval in seconds")
+    parser.add_argument("--out", default=None)
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("DASHVIEW_TIMING_LOG", "")
+    report = run(args.sessions, args.rows, args.distinct_files, args.rounds, args.ramp, args.timeout, args.interval)
+
+    latency = report["latency"]
+    print(f"{args.sessions} sessions · {report['wall_s']:.1f} s · {report['throughput_per_s']:.1f} interactions/s")
+    if latency:
+        print(f"latency p50 {latency['p50_ms']:.1f} ms · p95 {latency['p95_ms']:.1f} ms · p99 {latency['p99_ms']:.1f} ms "
+              f"(queued p95 {report['queued']['p95_ms']:.1f} ms)")
+    for action, stats in report["by_action"].items():
+        print(f"  {action:<28} n={stats['count']:<6} p50 {stats['p50_ms']:9.1f} ms  p99 {stats['p99_ms']:9.1f} ms")
+    store = report["store"]
+    print(f"store: {store['datasets']} datasets · {store['hits']} hits · {store['misses']} misses · {store['evictions']} evictions")
+    print(f"peak RSS {report['rss_mb']['peak']:.0f} MB · {len(report['errors'])} failed sessions")
+
+    if args.out:
+        with open(args.out, "w") as handle:
+            json.dump(report, handle, indent=2)
+    return 1 if report["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
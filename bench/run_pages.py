@@ -0,0 +1,202 @@
+"""Headless benchmark of ingestion and every page.
+
+    python -m bench.run_pages --rows 10000 100000 1000000 --repeat 5
+    python -m bench.run_pages --compare bench/results/old.json bench/results/new.json
+
+Each dataset size runs in a fresh worker process, so its peak RSS belongs
+to that size only.  The worker ingests the generated CSV through
+``dashview.ingest``, seeds the session state the way ``main.py`` does, and
+drives ``main.py`` and every ``pages/*.py`` with Streamlit's ``AppTest``.
+``AppTest`` cannot upload files, so ``main.py`` is timed before an upload.
+``startup`` reports each script's import and first-paint time on its first
+run, the cold-start cost after a deploy.
+
+Results are written as JSON; ``--compare`` prints the change per metric and
+exits non-zero when any metric regresses by more than ``--threshold``.
+"""
+import argparse
+import glob
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+from bench.generate import dataset_path
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(ROOT, "bench", "data")
+RESULTS_DIR = os.path.join(ROOT, "bench", "results")
+DEFAULT_ROWS = [10_000, 100_000, 1_000_000]
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return peak / 1024 ** 2 if sys.platform == "darwin" else peak / 1024
+
+
+def _summary(samples: list) -> dict:
+    return {
+        "p50_ms": float(np.percentile(samples, 50)),
+        "p95_ms": float(np.percentile(samples, 95)),
+        "max_ms": float(max(samples)),
+        "runs_ms": [round(sample, 3) for sample in samples],
+    }
+
+
+def time_script(path: str, state: dict, repeat: int, timeout: float) -> dict:
+    """First-run and steady-state rerun latency of one script under ``AppTest``."""
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(path, default_timeout=timeout)
+    for key, value in state.items():
+        app.session_state[key] = value
+
+    start = time.perf_counter()
+    app.run()
+    first_ms = (time.perf_counter() - start) * 1000
+    if app.exception:
+        return {"error": str(app.exception[0].value)}
+
+    reruns = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        app.run()
+        reruns.append((time.perf_counter() - start) * 1000)
+    return dict(first_ms=first_ms, **_summary(reruns))
+
+
+def run_worker(csv_path: str, repeat: int, timeout: float) -> dict:
+    from dashview import bootstrap, ingest, prefetch, session
+
+    with open(csv_path, "rb") as handle:
+        data = handle.read()
+
+    start = time.perf_counter()
+    dataset_handle = ingest.load_dataset(data)
+    ingest_ms = (time.perf_counter() - start) * 1000
+
+    state = {}
+    start = time.perf_counter()
+    session.publish(state, dataset_handle)
+    prefetch.wait(dataset_handle.dataset)
+    aggregate_ms = (time.perf_counter() - start) * 1000
+
+    scripts = {"main": time_script(os.path.join(ROOT, "main.py"), {}, repeat, timeout)}
+    for page in sorted(glob.glob(os.path.join(ROOT, "pages", "*.py"))):
+        name = os.path.splitext(os.path.basename(page))[0]
+        scripts[name] = time_script(page, state, repeat, timeout)
+
+    return {
+        "rows": dataset_handle.dataset.rows,
+        "file_mb": len(data) / 1024 ** 2,
+        "ingest_ms": ingest_ms,
+        "aggregate_ms": aggregate_ms,
+        "frame_mb": dataset_handle.dataset.nbytes / 1024 ** 2,
+        "peak_rss_mb": peak_rss_mb(),
+        "scripts": scripts,
+        # Import and first-paint time of each script's first run in this fresh process.
+        "startup": {
+            page: {f"{phase}_ms": round(timer.phases[phase]["ms"], 3) for phase in ("import", "first_paint") if phase in timer.phases}
+            for page, timer in bootstrap.first_runs.items()
+        },
+    }
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(rows: list, repeat: int, seed: int, timeout: float) -> dict:
+    results = []
+    env = dict(os.environ, DASHVIEW_TIMING_LOG=os.environ.get("DASHVIEW_TIMING_LOG", ""))
+    for count in rows:
+        csv_path = dataset_path(DATA_DIR, count, seed)
+        print(f"▶ {count:,} rows ({csv_path})", file=sys.stderr)
+        output = subprocess.check_output(
+            [sys.executable, "-m", "bench.run_pages", "--worker", csv_path, "--repeat", str(repeat), "--timeout", str(timeout)],
+            cwd=ROOT, env=env, text=True,
+        )
+        results.append(json.loads(output))
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+            "seed": seed,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def flatten(report: dict) -> dict:
+    """``{(rows, metric): value}`` for every comparable number in a report."""
+    metrics = {}
+    for result in report["results"]:
+        rows = result["rows"]
+        for key in ("ingest_ms", "aggregate_ms", "frame_mb", "peak_rss_mb"):
+            metrics[(rows, key)] = result[key]
+        for script, timings in result["scripts"].items():
+            for key in ("first_ms", "p50_ms", "p95_ms"):
+                if key in timings:
+                    metrics[(rows, f"{script}.{key}")] = timings[key]
+        for page, timings in result.get("startup", {}).items():
+            for key, value in timings.items():
+                metrics[(rows, f"{page}.{key}")] = value
+    return metrics
+
+
+def compare(old_path: str, new_path: str, threshold: float) -> int:
+    with open(old_path) as old_file, open(new_path) as new_file:
+        old, new = flatten(json.load(old_file)), flatten(json.load(new_file))
+    regressions = 0
+    for key in sorted(old.keys() & new.keys()):
+        before, after = old[key], new[key]
+        change = (after - before) / before if before else 0.0
+        flag = ""
+        if change > threshold:
+            flag, regressions = "  ⚠ regression", regressions + 1
+        print(f"{key[0]:>11,} rows  {key[1]:<32} {before:12.1f} → {after:12.1f}  ({change:+.1%}){flag}")
+    return 1 if regressions else 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=DEFAULT_ROWS)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=600.0, help="seconds allowed per script run")
+    parser.add_argument("--out", default=None)
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"))
+    parser.add_argument("--threshold", type=float, default=0.10)
+    parser.add_argument("--worker", metavar="CSV", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        return compare(*args.compare, args.threshold)
+    if args.worker:
+        print(json.dumps(run_worker(args.worker, args.repeat, args.timeout)))
+        return 0
+
+    report = run(args.rows, args.repeat, args.seed, args.timeout)
+    out = args.out or os.path.join(RESULTS_DIR, f"pages_{time.strftime('%Y%m%d-%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, "w") as handle:
+        json.dump(report, handle, indent=2)
+    print(out)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+"""Shared data layer for the Superstore dashboard pages."""
@@ -0,0 +1,130 @@
+"""Appending a delta upload (e.g. one day of orders) to a loaded dataset.
+
+Stored datasets are shared between sessions and read-only, so an append
+builds a new dataset keyed by the base key and the delta's hash.  Only the
+delta is parsed and aggregated; its rollups, per-value totals and profile
+are merged into copies of the base's, so the aggregation work grows with
+the delta (and the number of groups), not with the history.  The frame
+itself is concatenated column by column; the group index appends the
+delta's row positions to each group without re-sorting the base.
+"""
+import copy
+
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from dashview import outofcore, prefetch
+from dashview.dataset import Dataset
+from dashview.encoding import sniff_encoding
+from dashview.index import GroupIndex
+from dashview.ingest import content_hash, parse_csv
+from dashview.profile import _kind
+from dashview.search import SearchIndex
+from dashview.store import DatasetHandle, get_store
+from dashview.timeseries import DailySeries
+
+
+class SchemaMismatch(ValueError):
+    """The delta's columns or column types do not match the dataset it is appended to."""
+
+
+def _family(kind: str) -> str:
+    # Categorical and free-text columns both hold labels; the compaction choice may differ per file.
+    return kind if kind in ("numeric", "datetime") else "label"
+
+
+def coerce(base_kinds: dict, date_formats: dict, delta: pd.DataFrame) -> pd.DataFrame:
+    """Parse the delta's text columns that the base holds as dates, with the base's formats.
+
+    Only declared date columns are parsed on ingestion, but DuckDB types
+    every date-like column of a spilled upload (e.g. Ship Date) itself.
+    Columns where no value parses are left as text for ``validate`` to reject.
+    """
+    for col, kind in base_kinds.items():
+        if kind != "datetime" or col not in delta.columns or _family(_kind(delta[col])) != "label":
+            continue
+        values = delta[col].astype("object")
+        parsed = pd.to_datetime(values, format=date_formats.get(col), errors="coerce")
+        if parsed.notna().any():
+            delta[col] = parsed
+    return delta
+
+
+def validate(base_kinds: dict, delta: pd.DataFrame) -> pd.DataFrame:
+    """Return ``delta`` with its columns in the base's order, or raise ``SchemaMismatch``."""
+    missing = [col for col in base_kinds if col not in delta.columns]
+    extra = [col for col in delta.columns if col not in base_kinds]
+    if missing or extra:
+        problems = []
+        if missing:
+            problems.append(f"missing columns {missing}")
+        if extra:
+            problems.append(f"unexpected columns {extra}")
+        raise SchemaMismatch("The delta does not match the loaded data: " + "; ".join(problems))
+
+    mismatched = [
+        f"{col} ({_family(kind)} in the data, {_family(_kind(delta[col]))} in the delta)"
+        for col, kind in base_kinds.items()
+        if _family(kind) != _family(_kind(delta[col])) and delta[col].notna().any()
+    ]
+    if mismatched:
+        raise SchemaMismatch("Column types differ: " + ", ".join(mismatched))
+    return delta[list(base_kinds)]
+
+
+def _append_column(base: pd.Series, delta: pd.Series) -> pd.Series:
+    if isinstance(base.dtype, pd.CategoricalDtype):
+        # Base categories keep their codes; new values are added after them.
+        delta = delta if isinstance(delta.dtype, pd.CategoricalDtype) else delta.astype("category")
+        return pd.Series(union_categoricals([base, delta], ignore_order=True), name=base.name)
+    if delta.dtype != base.dtype:
+        # Keep the base's compacted dtype when the delta fits in it exactly.
+        try:
+            narrowed = delta.astype(base.dtype)
+            if bool(((narrowed.astype(delta.dtype) == delta) | delta.isna()).all()):
+                delta = narrowed
+        except (TypeError, ValueError):
+            pass
+    return pd.concat([base, delta], ignore_index=True)
+
+
+def _append_frame(base: pd.DataFrame, delta: pd.DataFrame) -> pd.DataFrame:
+    return pd.DataFrame({col: _append_column(base[col], delta[col]) for col in base.columns})
+
+
+def append_in_memory(base: Dataset, delta: pd.DataFrame, key: str) -> Dataset:
+    """``base`` with the validated ``delta`` rows appended, its aggregates merged rather than rebuilt."""
+    delta_set = Dataset.from_frame(f"{key}-delta", delta)
+    df = _append_frame(base.df, delta)
+
+    merged = Dataset(key=key, df=df, nbytes=base.nbytes + delta_set.nbytes, encoding=base.encoding,
+                     date_formats=base.date_formats)
+    cube = base.cube.merged(delta_set.cube)
+    index = GroupIndex.from_columns(df, {
+        col: base.index[col].merged(delta_set.index[col], base.rows) for col in base.index.columns
+    })
+    profile = copy.deepcopy(base.profile)
+    profile.update(delta)
+    # Seed the cached properties so nothing is rebuilt from the full frame.
+    merged.__dict__.update(cube=cube, index=index, search=SearchIndex(index),
+                           timeseries=DailySeries.from_cube(cube), profile=profile)
+    return merged
+
+
+def append_dataset(handle: DatasetHandle, data: bytes, on_progress=None) -> DatasetHandle:
+    """Return a handle on ``handle``'s dataset with the rows of the CSV ``data`` appended."""
+    base = handle.dataset
+    spilled = isinstance(base, outofcore.OutOfCoreDataset)
+    key = content_hash(f"{base.key}+{content_hash(data)}".encode()) + ("-ooc" if spilled else "")
+
+    def load():
+        prefetch.wait(base)  # merge into the base's aggregates rather than building them a second time
+        # A delta's few dates cannot tell day-first from month-first; parse them the way the base was.
+        parsed = parse_csv(data, sniff_encoding(data), on_progress=on_progress, date_formats=dict(base.date_formats))
+        base_kinds = base.column_kinds()
+        delta = validate(base_kinds, coerce(base_kinds, base.date_formats, parsed))
+        if spilled:
+            return outofcore.append(base, delta, key)
+        return append_in_memory(base, delta, key)
+
+    return get_store().acquire(key, load)
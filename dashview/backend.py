@@ -0,0 +1,135 @@
+"""Compute backends for the aggregations behind the pages.
+
+pandas is the default.  Setting ``DASHVIEW_BACKEND=polars`` runs the same
+operations on Polars, which spreads group-bys over every core; results are
+returned as pandas objects with the same index, columns and order, so the
+rest of the app cannot tell which backend produced them.  If Polars is not
+installed the pandas backend is used with a warning.
+
+Drill-down filters and moving averages do not go through a backend: they
+are already served by the group index and the daily prefix sums.
+"""
+import os
+import threading
+import warnings
+import weakref
+
+import pandas as pd
+
+BACKEND = os.environ.get("DASHVIEW_BACKEND", "pandas")
+
+
+def _sorted_counts(counts: pd.Series) -> pd.Series:
+    # Count descending, ties by label, so both backends order equal counts the same way.
+    frame = counts.rename("count").reset_index()
+    label = frame.columns[0]
+    frame = frame.sort_values(["count", label], ascending=[False, True], key=lambda col: col if col.name == "count" else col.astype(str))
+    return pd.Series(frame["count"].to_numpy(), index=pd.Index(frame[label].to_numpy(), name=counts.index.name), name="count")
+
+
+class PandasBackend:
+    name = "pandas"
+
+    def group_sales(self, df: pd.DataFrame, keys: list, value: str = "Sales") -> pd.DataFrame:
+        """``sum``/``count`` (rows)/``valid`` (non-null) of ``value`` per ``keys``, sorted by key."""
+        by = [df[key] for key in keys] if len(keys) > 1 else df[keys[0]]
+        grouped = df[value].astype("float64").groupby(by, observed=True, sort=True).agg(["sum", "size", "count"])
+        grouped.columns = ["sum", "count", "valid"]
+        return grouped
+
+    def daily_sales(self, df: pd.DataFrame, date: str = "Order Date", value: str = "Sales") -> pd.DataFrame:
+        day = df[date].dt.normalize().rename(date)
+        grouped = df[value].astype("float64").groupby(day, sort=True).agg(["sum", "size", "count"])
+        grouped.columns = ["sum", "count", "valid"]
+        return grouped
+
+    def value_counts(self, series: pd.Series) -> pd.Series:
+        counts = series.value_counts()
+        return _sorted_counts(counts[counts > 0])
+
+
+class PolarsBackend:
+    name = "polars"
+
+    def __init__(self):
+        import polars
+        self.pl = polars
+        self._frames = {}
+        self._lock = threading.Lock()
+
+    def _frame(self, df: pd.DataFrame, columns: list):
+        """Polars copy of ``columns`` of ``df``, converted once per frame and column."""
+        with self._lock:
+            entry = self._frames.get(id(df))
+            if entry is None:
+                entry = self._frames[id(df)] = {}
+                weakref.finalize(df, self._frames.pop, id(df), None)
+            missing = [col for col in columns if col not in entry]
+        if missing:
+            converted = self.pl.from_pandas(df[missing])
+            with self._lock:
+                for col in missing:
+                    entry[col] = converted[col]
+        return self.pl.DataFrame([entry[col] for col in columns])
+
+    def _to_pandas(self, result, keys: list) -> pd.DataFrame:
+        frame = result.to_pandas()
+        for key in keys:
+            if isinstance(frame[key].dtype, pd.CategoricalDtype):
+                frame[key] = frame[key].astype(str)
+        frame = frame.set_index(keys).sort_index()
+        frame["sum"] = frame["sum"].astype("float64")
+        frame[["count", "valid"]] = frame[["count", "valid"]].astype("int64")
+        return frame[["sum", "count", "valid"]]
+
+    def _aggregations(self, value: str) -> list:
+        pl = self.pl
+        return [
+            pl.col(value).cast(pl.Float64).sum().alias("sum"),
+            pl.len().alias("count"),
+            pl.col(value).is_not_null().sum().alias("valid"),
+        ]
+
+    def group_sales(self, df: pd.DataFrame, keys: list, value: str = "Sales") -> pd.DataFrame:
+        pl = self.pl
+        frame = self._frame(df, keys + [value])
+        result = frame.filter(pl.all_horizontal([pl.col(key).is_not_null() for key in keys]))
+        result = result.group_by(keys).agg(self._aggregations(value))
+        return self._to_pandas(result, keys)
+
+    def daily_sales(self, df: pd.DataFrame, date: str = "Order Date", value: str = "Sales") -> pd.DataFrame:
+        pl = self.pl
+        frame = self._frame(df, [date, value]).filter(pl.col(date).is_not_null())
+        result = frame.group_by(pl.col(date).dt.truncate("1d")).agg(self._aggregations(value))
+        return self._to_pandas(result, [date])
+
+    def value_counts(self, series: pd.Series) -> pd.Series:
+        name = series.name
+        counts = self.pl.from_pandas(series).drop_nulls().value_counts()
+        pandas_counts = counts.to_pandas().set_index(name).iloc[:, 0]
+        if isinstance(pandas_counts.index.dtype, pd.CategoricalDtype):
+            pandas_counts.index = pandas_counts.index.astype(str)
+        return _sorted_counts(pandas_counts)
+
+
+_backends = {}
+_backends_lock = threading.Lock()
+
+
+def get_backend(name: str = None):
+    """The backend called ``name`` (default ``DASHVIEW_BACKEND``), created once per process."""
+    name = name or BACKEND
+    with _backends_lock:
+        if name not in _backends:
+            if name == "polars":
+                try:
+                    _backends[name] = PolarsBackend()
+                except ImportError:
+                    warnings.warn("DASHVIEW_BACKEND=polars but polars is not installed; using pandas")
+                    _backends[name] = _backends.setdefault("pandas", PandasBackend())
+            elif name == "pandas":
+                _backends[name] = PandasBackend()
+            else:
+                raise ValueError(f"Unknown compute backend: {name!r}")
+        return _backends[name]
+
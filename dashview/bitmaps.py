@@ -0,0 +1,74 @@
+"""Packed row bitmaps for the global filter bar.
+
+One bitmap per (column, value) and per order month, one bit per row, built
+on first use from the group index's row positions.  A filter is then a
+bitwise OR within each column and a bitwise AND across columns over
+``rows / 8`` bytes, whatever the number of selected values.
+"""
+import threading
+
+import numpy as np
+import pandas as pd
+
+from dashview.index import ColumnIndex, GroupIndex, build_column_index
+
+MONTH_COLUMN = "Order Date"
+
+
+class BitmapIndex:
+    def __init__(self, index: GroupIndex):
+        self.index = index
+        self.rows = len(index.df)
+        self._bitmaps = {}
+        self._months = None
+        self._lock = threading.Lock()
+
+    @property
+    def nbytes(self) -> int:
+        months = self._months.nbytes if self._months is not None else 0
+        return months + sum(bitmap.nbytes for bitmap in list(self._bitmaps.values()))
+
+    def _pack(self, positions: np.ndarray) -> np.ndarray:
+        mask = np.zeros(self.rows, dtype=bool)
+        mask[positions] = True
+        return np.packbits(mask)
+
+    def _cached(self, key: tuple, positions) -> np.ndarray:
+        with self._lock:
+            bitmap = self._bitmaps.get(key)
+        if bitmap is None:
+            bitmap = self._pack(positions())
+            with self._lock:
+                self._bitmaps[key] = bitmap
+        return bitmap
+
+    def bitmap(self, column: str, value) -> np.ndarray:
+        return self._cached((column, value), lambda: self.index[column].rows(value))
+
+    def months(self) -> ColumnIndex:
+        """Rows grouped by order month (a ``PeriodIndex`` of values), built once."""
+        if self._months is None:
+            df = self.index.df
+            sales = df["Sales"] if "Sales" in df.columns else pd.Series(np.nan, index=df.index)
+            self._months = build_column_index(df[MONTH_COLUMN].dt.to_period("M"), sales)
+        return self._months
+
+    def any_of(self, column: str, values) -> np.ndarray:
+        """Rows where ``column`` is any of ``values``."""
+        result = np.zeros((self.rows + 7) // 8, dtype=np.uint8)
+        for value in values:
+            np.bitwise_or(result, self.bitmap(column, value), out=result)
+        return result
+
+    def between_months(self, first: str, last: str) -> np.ndarray:
+        """Rows ordered from month ``first`` to month ``last`` inclusive ("YYYY-MM")."""
+        months = self.months()
+        result = np.zeros((self.rows + 7) // 8, dtype=np.uint8)
+        start, end = pd.Period(first, "M"), pd.Period(last, "M")
+        for month in months.values:
+            if start <= month <= end:
+                np.bitwise_or(result, self._cached(("month", month), lambda: months.rows(month)), out=result)
+        return result
+
+    def positions(self, bitmap: np.ndarray) -> np.ndarray:
+        return np.flatnonzero(np.unpackbits(bitmap, count=self.rows))
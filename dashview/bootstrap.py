@@ -0,0 +1,43 @@
+"""Shared start of ``main.py`` and every page.
+
+``start`` replaces the preamble each script used to repeat: page config,
+rerun timer, theme CSS and the page header, after which it records
+``first_paint``, the time from the start of the run until the header has
+been sent.  Chart libraries are imported through ``lazy`` so a cold
+process paints the page before paying for them.
+
+Streamlit drops every element a rerun does not send again, so the theme
+cannot be sent only once per session; instead it is assembled and
+minified once per process (see ``themes``) and re-sent as one compact
+string.
+"""
+import time
+
+import streamlit as st
+
+from dashview import themes
+from dashview.instrument import RerunTimer
+from dashview.lazy import set_timer
+
+# The first run in a process charges the time from this import until
+# ``start`` (the script's own top-level imports) to its ``import`` phase.
+_startup = {"since": time.perf_counter()}
+
+# Timer of each page's first run in this process, for cold-start reporting (see bench.run_pages).
+first_runs = {}
+
+
+def start(page: str, page_title: str, page_icon: str, theme: str, header: str) -> RerunTimer:
+    """Configure the page, apply ``theme`` and send ``header``; returns the run's timer."""
+    st.set_page_config(page_title=page_title, page_icon=page_icon, layout="wide")
+    timer = RerunTimer(page)
+    set_timer(timer)
+    since = _startup.pop("since", None)
+    if since is not None:
+        timer.add("import", (timer.started - since) * 1000)
+    with timer.phase("css"):
+        st.markdown(themes.style_tag(theme), unsafe_allow_html=True)
+    st.markdown(header, unsafe_allow_html=True)
+    timer.add("first_paint", (time.perf_counter() - timer.started) * 1000)
+    first_runs.setdefault(page, timer)
+    return timer
@@ -0,0 +1,186 @@
+"""Building the Plotly figures the pages send to the browser.
+
+Every figure is built through a ``ChartBudget``, which records its size and
+timings.  Figures larger than ``webgl_bytes`` are rebuilt with WebGL traces
+(``scattergl``) where the factory supports it; figures still larger than
+``max_bytes`` have their data reduced by the chart's ``reduce`` callback and
+are rebuilt.
+
+``st.plotly_chart`` serializes every figure on every rerun, so the budget
+does not serialize it a second time: the payload is estimated from the
+length and dtype of the trace arrays.  Only while timing is logged
+(``DASHVIEW_TIMING_LOG``) are figures serialized to report exact sizes.
+"""
+import inspect
+import os
+import time
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from dashview import instrument
+from dashview.downsample import downsample
+
+WEBGL_BYTES = int(os.environ.get("DASHVIEW_WEBGL_KB", "512")) * 1024
+MAX_BYTES = int(os.environ.get("DASHVIEW_FIGURE_BUDGET_KB", "2048")) * 1024
+MAX_REDUCTIONS = 3
+
+# Trace attributes that carry one value per point; everything else is a handful of bytes.
+DATA_ATTRIBUTES = ("x", "y", "z", "values", "labels", "ids", "parents", "text", "hovertext", "customdata",
+                   "lat", "lon", "r", "theta")
+# Approximate JSON bytes per value by dtype kind (digits plus separator).
+BYTES_PER_VALUE = {"f": 18, "i": 8, "u": 8, "b": 6, "M": 24, "m": 12}
+SAMPLE_VALUES = 100
+
+
+@dataclass
+class FigureStats:
+    json_bytes: int
+    build_ms: float
+    serialize_ms: float
+    points: int = 0
+    estimated: bool = False
+
+
+@dataclass
+class ChartRecord:
+    name: str
+    stats: FigureStats
+    rows: int
+    webgl: bool = False
+    reductions: int = 0
+
+
+def _array_bytes(values) -> tuple:
+    """(values, estimated JSON bytes) of one trace data attribute."""
+    if values is None or isinstance(values, str):
+        return 0, 0
+    array = np.asarray(values)
+    if array.size == 0:
+        return 0, 0
+    per_value = BYTES_PER_VALUE.get(array.dtype.kind)
+    if per_value is None:
+        # Labels: quoted strings, sized from a sample.
+        sample = array.ravel()[:SAMPLE_VALUES]
+        per_value = sum(len(str(value)) for value in sample) / len(sample) + 3
+    return array.size, int(array.size * per_value)
+
+
+def estimate(fig) -> tuple:
+    """(points, approximate JSON bytes) of ``fig``'s trace data, without serializing it."""
+    points = size = 0
+    for trace in fig.data:
+        counts = {}
+        for name in DATA_ATTRIBUTES:
+            counts[name], nbytes = _array_bytes(getattr(trace, name, None))
+            size += nbytes
+        points += max(counts["x"], counts["y"], counts["values"], counts["labels"])
+    return points, size
+
+
+def measure(fig, build_ms: float = 0.0, exact: bool = False) -> FigureStats:
+    """Size of ``fig``'s payload: estimated from its traces, or serialized like ``st.plotly_chart`` when ``exact``."""
+    start = time.perf_counter()
+    points, estimated_bytes = estimate(fig)
+    if not exact:
+        return FigureStats(json_bytes=estimated_bytes, build_ms=build_ms,
+                           serialize_ms=(time.perf_counter() - start) * 1000, points=points, estimated=True)
+    payload = fig.to_json()
+    serialize_ms = (time.perf_counter() - start) * 1000
+    return FigureStats(json_bytes=len(payload.encode("utf-8")), build_ms=build_ms, serialize_ms=serialize_ms,
+                       points=points)
+
+
+def describe(stats: FigureStats) -> str:
+    size = f"~{stats.json_bytes / 1024:,.1f} KB estimated" if stats.estimated else f"{stats.json_bytes / 1024:,.1f} KB"
+    return (f"{size} figure JSON ({stats.points:,} points) · built in {stats.build_ms:.1f} ms · "
+            f"measured in {stats.serialize_ms:.1f} ms")
+
+
+def _supports_webgl(factory) -> bool:
+    try:
+        return "render_mode" in inspect.signature(factory).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+class ChartBudget:
+    """Builds a page's figures within a payload budget and keeps a record of each."""
+
+    def __init__(self, webgl_bytes: int = WEBGL_BYTES, max_bytes: int = MAX_BYTES, timer=None, exact: bool = None):
+        self.webgl_bytes = webgl_bytes
+        self.max_bytes = max_bytes
+        self.timer = timer
+        self.exact = bool(instrument.LOG_PATH) if exact is None else exact
+        self.records = []
+
+    def _build(self, factory, frame, style, kwargs):
+        start = time.perf_counter()
+        fig = factory(frame, **kwargs)
+        if style is not None:
+            style(fig)
+        stats = measure(fig, build_ms=(time.perf_counter() - start) * 1000, exact=self.exact)
+        if self.timer is not None:
+            self.timer.add("figure", stats.build_ms)
+            self.timer.add("serialize", stats.serialize_ms)
+        return fig, stats
+
+    def build(self, name: str, factory, frame: pd.DataFrame, style=None, reduce=None, **kwargs):
+        """Call ``factory(frame, **kwargs)`` (e.g. ``px.line``), then ``style(fig)``, within the budget.
+
+        ``reduce(frame, ratio)`` must return a smaller frame, ``ratio`` being the
+        fraction of the current payload that fits the budget.
+        """
+        fig, stats = self._build(factory, frame, style, kwargs)
+        record = ChartRecord(name=name, stats=stats, rows=len(frame))
+
+        if stats.json_bytes > self.webgl_bytes and _supports_webgl(factory):
+            kwargs = dict(kwargs, render_mode="webgl")
+            fig, stats = self._build(factory, frame, style, kwargs)
+            record.webgl, record.stats = True, stats
+
+        while reduce is not None and stats.json_bytes > self.max_bytes and record.reductions < MAX_REDUCTIONS:
+            smaller = reduce(frame, self.max_bytes / stats.json_bytes)
+            if len(smaller) >= len(frame):
+                break
+            frame = smaller
+            fig, stats = self._build(factory, frame, style, kwargs)
+            record.stats, record.rows = stats, len(frame)
+            record.reductions += 1
+
+        self.records.append(record)
+        return fig
+
+    def frame(self) -> pd.DataFrame:
+        return pd.DataFrame([{
+            "chart": record.name,
+            "rows": record.rows,
+            "points": record.stats.points,
+            "JSON KB": round(record.stats.json_bytes / 1024, 1),
+            "estimated": record.stats.estimated,
+            "build ms": round(record.stats.build_ms, 1),
+            "serialize ms": round(record.stats.serialize_ms, 1),
+            "WebGL": record.webgl,
+            "reductions": record.reductions,
+        } for record in self.records])
+
+
+def downsample_reducer(x: str, y: str):
+    """``reduce`` callback for line charts: thin the points in proportion to the overshoot."""
+    def reduce(frame: pd.DataFrame, ratio: float) -> pd.DataFrame:
+        return downsample(frame, x, y, max(int(len(frame) * ratio * 0.9), 3))
+    return reduce
+
+
+def top_k_reducer(label: str, value: str, other: str = "Other"):
+    """``reduce`` callback for pie/bar charts: keep the largest slices and fold the rest."""
+    def reduce(frame: pd.DataFrame, ratio: float) -> pd.DataFrame:
+        keep = max(int(len(frame) * ratio * 0.9), 1)
+        ranked = frame.sort_values(value, ascending=False)
+        head, tail = ranked.iloc[:keep], ranked.iloc[keep:]
+        if tail.empty:
+            return frame
+        folded = pd.DataFrame({label: [other], value: [tail[value].sum()]})
+        return pd.concat([head[[label, value]], folded], ignore_index=True)
+    return reduce
@@ -0,0 +1,114 @@
+"""Post-ingestion dtype compaction and the memory report shown on the home page.
+
+Runs after the schema-driven parse: remaining low-cardinality text becomes
+categorical, high-cardinality text moves to Arrow-backed strings when
+pyarrow is installed, and numbers are downcast only where the round trip
+is exact.
+"""
+import importlib.util
+import sys
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+CATEGORY_RATIO = 0.5
+SAMPLE_ROWS = 10_000
+ARROW_STRINGS = importlib.util.find_spec("pyarrow") is not None
+
+
+@dataclass
+class ColumnMemory:
+    column: str
+    before_dtype: str
+    after_dtype: str
+    before_bytes: int
+    after_bytes: int
+
+
+@dataclass
+class MemoryReport:
+    columns: list = field(default_factory=list)
+
+    @property
+    def before_bytes(self) -> int:
+        return sum(column.before_bytes for column in self.columns)
+
+    @property
+    def after_bytes(self) -> int:
+        return sum(column.after_bytes for column in self.columns)
+
+    def frame(self) -> pd.DataFrame:
+        return pd.DataFrame([vars(column) for column in self.columns])
+
+
+def inferred_dtype(series: pd.Series) -> str:
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        return "object"
+    if pd.api.types.is_float_dtype(dtype):
+        return "float64"
+    if pd.api.types.is_integer_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype):
+        return "int64"
+    return str(dtype)
+
+
+def inferred_bytes(series: pd.Series) -> int:
+    """What ``series`` would cost with the dtype plain ``read_csv`` infers (object strings, 64-bit numbers)."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        counts = series.cat.codes.value_counts()
+        counts = counts[counts.index >= 0]
+        sizes = np.array([sys.getsizeof(value) for value in series.cat.categories])
+        return int(8 * len(series) + (sizes[counts.index.to_numpy()] * counts.to_numpy()).sum())
+    if pd.api.types.is_numeric_dtype(series.dtype) or pd.api.types.is_datetime64_any_dtype(series.dtype):
+        return 8 * len(series)
+    return int(series.memory_usage(index=False, deep=True))
+
+
+def _is_low_cardinality(series: pd.Series) -> bool:
+    sample = series.head(SAMPLE_ROWS)
+    if sample.nunique() > CATEGORY_RATIO * len(sample):
+        return False
+    return series.nunique() <= CATEGORY_RATIO * len(series)
+
+
+def _downcast_float(series: pd.Series) -> pd.Series:
+    if series.dtype != np.float64:
+        return series
+    narrowed = series.astype(np.float32)
+    widened = narrowed.astype(np.float64)
+    lossless = (widened == series) | (series.isna() & widened.isna())
+    return narrowed if bool(lossless.all()) else series
+
+
+def compact_column(series: pd.Series) -> pd.Series:
+    dtype = series.dtype
+    if pd.api.types.is_object_dtype(dtype):
+        if _is_low_cardinality(series):
+            return series.astype("category")
+        if ARROW_STRINGS and pd.api.types.infer_dtype(series, skipna=True) == "string":
+            return series.astype("string[pyarrow]")
+        return series
+    if pd.api.types.is_integer_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype):
+        return pd.to_numeric(series, downcast="integer")
+    if pd.api.types.is_float_dtype(dtype):
+        return _downcast_float(series)
+    return series
+
+
+def compact(df: pd.DataFrame):
+    """Return ``(compacted frame, MemoryReport)``; columns are converted one at a time."""
+    report = MemoryReport()
+    columns = {}
+    for name in df.columns:
+        original = df[name]
+        compacted = compact_column(original)
+        report.columns.append(ColumnMemory(
+            column=name,
+            before_dtype=inferred_dtype(original),
+            after_dtype=str(compacted.dtype),
+            before_bytes=inferred_bytes(original),
+            after_bytes=int(compacted.memory_usage(index=False, deep=True)),
+        ))
+        columns[name] = compacted
+    return pd.DataFrame(columns, index=df.index), report
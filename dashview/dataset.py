@@ -0,0 +1,89 @@
+"""The parsed upload shared between ``main.py`` and the pages."""
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Optional
+
+import pandas as pd
+
+from dashview import export
+from dashview.backend import get_backend
+from dashview.bitmaps import BitmapIndex
+from dashview.compact import MemoryReport
+from dashview.encoding import EncodingReport
+from dashview.index import GroupIndex
+from dashview.profile import DatasetProfile, _kind, build_profile
+from dashview.rollups import RollupCube, build_cube
+from dashview.search import SearchIndex
+from dashview.timeseries import DailySeries
+
+
+DERIVED = ("cube", "index", "search", "timeseries", "profile", "bitmaps")
+
+
+@dataclass(eq=False)
+class Dataset:
+    """A parsed upload, identified by the hash of its raw bytes."""
+
+    key: str
+    df: pd.DataFrame
+    nbytes: int
+    encoding: Optional[EncodingReport] = None
+    memory: Optional[MemoryReport] = None
+    date_formats: dict = field(default_factory=dict)  # format each date column was parsed with at ingestion
+
+    @classmethod
+    def from_frame(cls, key: str, df: pd.DataFrame) -> "Dataset":
+        return cls(key=key, df=df, nbytes=int(df.memory_usage(deep=True).sum()))
+
+    @property
+    def footprint(self) -> int:
+        """Bytes held by the frame plus every derived structure built so far."""
+        built = (self.__dict__[name] for name in DERIVED if name in self.__dict__)
+        return self.nbytes + sum(structure.nbytes for structure in built)
+
+    @property
+    def rows(self) -> int:
+        return len(self.df)
+
+    def close(self) -> None:
+        """Called by the store on eviction; an in-memory dataset holds nothing beyond the GC's reach."""
+
+    @property
+    def columns(self) -> list:
+        return list(self.df.columns)
+
+    def column_kinds(self) -> dict:
+        return {col: _kind(self.df[col]) for col in self.df.columns}
+
+    def preview(self, n: int = 5) -> pd.DataFrame:
+        return self.df.head(n)
+
+    def value_counts(self, column: str) -> pd.Series:
+        return get_backend().value_counts(self.df[column])
+
+    def export_bytes(self, query: str, fmt: export.ExportFormat) -> bytes:
+        return export.render(self.search.filter(query), fmt)
+
+    @cached_property
+    def cube(self) -> RollupCube:
+        return build_cube(self.df)
+
+    @cached_property
+    def index(self) -> GroupIndex:
+        return GroupIndex(self.df)
+
+    @cached_property
+    def search(self) -> SearchIndex:
+        return SearchIndex(self.index)
+
+    @cached_property
+    def timeseries(self) -> DailySeries:
+        return DailySeries.from_cube(self.cube)
+
+    @cached_property
+    def profile(self) -> DatasetProfile:
+        return build_profile(self.df)
+
+    @cached_property
+    def bitmaps(self) -> BitmapIndex:
+        return BitmapIndex(self.index)
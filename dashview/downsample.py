@@ -0,0 +1,74 @@
+"""Point-count reduction for line charts.
+
+Both methods return sorted positions into the input so several aligned
+series (e.g. sales and its moving average) can be thinned with the same
+selection.  The first and last points are always kept.
+"""
+import numpy as np
+import pandas as pd
+
+DEFAULT_MAX_POINTS = 1500
+
+
+def _as_float(values) -> np.ndarray:
+    values = pd.Series(values)
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values.astype("int64").to_numpy(dtype="float64")
+    return values.to_numpy(dtype="float64", na_value=np.nan)
+
+
+def lttb(x, y, max_points: int) -> np.ndarray:
+    """Largest-triangle-three-buckets: keep the point per bucket that best preserves the shape."""
+    n = len(x)
+    if max_points >= n or max_points < 3:
+        return np.arange(n)
+    xs, ys = _as_float(x), np.nan_to_num(_as_float(y))
+
+    every = (n - 2) / (max_points - 2)
+    selected = np.empty(max_points, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    anchor = 0
+    for bucket in range(max_points - 2):
+        start = int(bucket * every) + 1
+        end = int((bucket + 1) * every) + 1
+        next_end = min(int((bucket + 2) * every) + 1, n)
+        if next_end > end:
+            avg_x, avg_y = xs[end:next_end].mean(), ys[end:next_end].mean()
+        else:
+            avg_x, avg_y = xs[-1], ys[-1]
+
+        area = np.abs((xs[anchor] - avg_x) * (ys[start:end] - ys[anchor])
+                      - (xs[anchor] - xs[start:end]) * (avg_y - ys[anchor]))
+        anchor = start + int(np.argmax(area))
+        selected[bucket + 1] = anchor
+    return selected
+
+
+def min_max(x, y, max_points: int) -> np.ndarray:
+    """Keep the minimum and maximum of each bucket, so no spike is lost."""
+    n = len(x)
+    if max_points >= n or max_points < 4:
+        return np.arange(n)
+    ys = _as_float(y)
+    # Two points per bucket plus the two endpoints must fit in ``max_points``.
+    buckets = (max_points - 2) // 2
+    edges = np.linspace(0, n, buckets + 1).astype(np.int64)
+    keep = [0, n - 1]
+    for start, end in zip(edges[:-1], edges[1:]):
+        if end > start:
+            window = ys[start:end]
+            if np.isnan(window).all():
+                continue
+            keep.extend((start + int(np.nanargmin(window)), start + int(np.nanargmax(window))))
+    return np.unique(keep)
+
+
+METHODS = {"lttb": lttb, "minmax": min_max}
+
+
+def downsample(frame: pd.DataFrame, x: str, y: str, max_points: int = DEFAULT_MAX_POINTS, method: str = "lttb") -> pd.DataFrame:
+    """Rows of ``frame`` selected by ``method`` on columns ``x``/``y``."""
+    positions = METHODS[method](frame[x], frame[y], max_points)
+    if len(positions) == len(frame):
+        return frame
+    return frame.iloc[positions]
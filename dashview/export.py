@@ -0,0 +1,108 @@
+"""On-demand downloads for the Data Table page.
+
+Files are only built when asked for, written chunk by chunk so the whole
+CSV never exists as one Python string, and kept in a small LRU keyed by
+(dataset hash, search query, format).
+"""
+import gzip
+import importlib.util
+import io
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import pandas as pd
+
+CHUNK_ROWS = 100_000
+DEFAULT_BUDGET_BYTES = int(os.environ.get("DASHVIEW_EXPORT_CACHE_MB", "256")) * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class ExportFormat:
+    label: str
+    extension: str
+    mime: str
+
+
+CSV = ExportFormat("CSV", "csv", "text/csv")
+CSV_GZIP = ExportFormat("CSV (gzip)", "csv.gz", "application/gzip")
+PARQUET = ExportFormat("Parquet", "parquet", "application/vnd.apache.parquet")
+
+
+def available_formats() -> list:
+    formats = [CSV, CSV_GZIP]
+    if importlib.util.find_spec("pyarrow") is not None:
+        formats.append(PARQUET)
+    return formats
+
+
+def write_csv(df: pd.DataFrame, stream, chunk_rows: int = CHUNK_ROWS) -> None:
+    for start in range(0, max(len(df), 1), chunk_rows):
+        chunk = df.iloc[start:start + chunk_rows]
+        stream.write(chunk.to_csv(index=False, header=start == 0).encode("utf-8"))
+
+
+def render(df: pd.DataFrame, fmt: ExportFormat) -> bytes:
+    buffer = io.BytesIO()
+    if fmt == CSV:
+        write_csv(df, buffer)
+    elif fmt == CSV_GZIP:
+        # Level 6 is gzip's default trade-off; higher levels cost far more time for little size.
+        with gzip.GzipFile(fileobj=buffer, mode="wb", compresslevel=6, mtime=0) as stream:
+            write_csv(df, stream)
+    elif fmt == PARQUET:
+        df.to_parquet(buffer, index=False, engine="pyarrow", compression="zstd")
+    else:
+        raise ValueError(f"Unknown export format: {fmt.label}")
+    return buffer.getvalue()
+
+
+class ExportCache:
+    def __init__(self, budget_bytes: int = DEFAULT_BUDGET_BYTES):
+        self.budget_bytes = budget_bytes
+        self._entries: "OrderedDict[tuple, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.used_bytes = 0
+
+    def get(self, key: tuple):
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+            return payload
+
+    def put(self, key: tuple, payload: bytes) -> None:
+        if len(payload) > self.budget_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.used_bytes -= len(previous)
+            self._entries[key] = payload
+            self.used_bytes += len(payload)
+            while self.used_bytes > self.budget_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.used_bytes -= len(evicted)
+
+
+_cache = ExportCache()
+
+
+def cache_key(dataset_key: str, query: str, fmt: ExportFormat) -> tuple:
+    # Search is case-insensitive, so case variants of a query share an export.
+    return dataset_key, query.lower(), fmt.extension
+
+
+def cached_export(dataset_key: str, query: str, fmt: ExportFormat):
+    return _cache.get(cache_key(dataset_key, query, fmt))
+
+
+def export(dataset, query: str, fmt: ExportFormat) -> bytes:
+    """The rows of ``dataset`` matching ``query`` as ``fmt``, built by ``dataset.export_bytes`` on a cache miss."""
+    key = cache_key(dataset.key, query, fmt)
+    payload = _cache.get(key)
+    if payload is None:
+        payload = dataset.export_bytes(query, fmt)
+        _cache.put(key, payload)
+    return payload
@@ -0,0 +1,107 @@
+"""The global filter shared by every page.
+
+A ``Filter`` lives in ``st.session_state["filter"]``.  Applying it to a
+dataset yields a filtered dataset that is stored in the ``DatasetStore``
+under the base key plus the filter's signature, so its rollups, indexes and
+profile are built once and shared by every page and every session using
+the same filter.  In-memory rows are selected with the bitmap index;
+out-of-core datasets get the filter as a pushed-down SQL predicate.
+"""
+import dataclasses
+import hashlib
+from dataclasses import dataclass
+from typing import Optional
+
+import pandas as pd
+
+from dashview import outofcore
+from dashview.dataset import Dataset
+from dashview.store import DatasetHandle, get_store
+
+# Filter field per column, in the order the filter bar shows them.
+FIELDS = {"Region": "regions", "Segment": "segments", "Category": "categories", "State": "states"}
+
+
+@dataclass(frozen=True)
+class Filter:
+    regions: tuple = ()
+    segments: tuple = ()
+    categories: tuple = ()
+    states: tuple = ()
+    months: Optional[tuple] = None  # (first, last) order months as "YYYY-MM", inclusive
+
+    def columns(self) -> dict:
+        """Selected values per column, for the columns with a selection."""
+        return {column: getattr(self, name) for column, name in FIELDS.items() if getattr(self, name)}
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.columns() and self.months is None
+
+    def signature(self) -> str:
+        parts = [f"{column}={sorted(map(str, values))}" for column, values in self.columns().items()]
+        parts.append(f"months={self.months}")
+        return hashlib.blake2b("|".join(parts).encode("utf-8"), digest_size=8).hexdigest()
+
+
+def months(dataset) -> list:
+    """Order months present in ``dataset`` as "YYYY-MM" strings, for the date range slider."""
+    by_day = dataset.cube.by_day
+    if by_day.empty:
+        return []
+    return [str(month) for month in by_day.index.to_period("M").unique()]
+
+
+def view_key(dataset, flt: Filter) -> str:
+    return f"{dataset.key}:{flt.signature()}"
+
+
+def _select_in_memory(dataset: Dataset, flt: Filter, key: str) -> Dataset:
+    bitmaps = dataset.bitmaps
+    selected = None
+    for column, values in flt.columns().items():
+        if column not in dataset.index.columns:
+            continue
+        bits = bitmaps.any_of(column, values)
+        selected = bits if selected is None else selected & bits
+    if flt.months is not None and "Order Date" in dataset.df.columns:
+        bits = bitmaps.between_months(*flt.months)
+        selected = bits if selected is None else selected & bits
+
+    df = dataset.df if selected is None else dataset.df.take(bitmaps.positions(selected))
+    df = df.reset_index(drop=True)
+    for col in df.columns:
+        # Drop categories with no rows left so drill-down selectboxes only offer reachable values.
+        if isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].cat.remove_unused_categories()
+    filtered = Dataset.from_frame(key, df)
+    filtered.encoding = dataset.encoding
+    filtered.date_formats = dataset.date_formats
+    return filtered
+
+
+def _predicate(flt: Filter, columns) -> str:
+    quote, literal = outofcore._quote, outofcore._literal
+    clauses = [
+        f"{quote(column)} IN ({', '.join(literal(value) for value in values)})"
+        for column, values in flt.columns().items() if column in columns
+    ]
+    if flt.months is not None and "Order Date" in columns:
+        start = pd.Period(flt.months[0], "M").start_time
+        end = (pd.Period(flt.months[1], "M") + 1).start_time
+        clauses.append(f"{quote('Order Date')} >= {literal(start)} AND {quote('Order Date')} < {literal(end)}")
+    return " AND ".join(clauses) or "TRUE"
+
+
+def _select_out_of_core(dataset: "outofcore.OutOfCoreDataset", flt: Filter, key: str):
+    predicate = _predicate(flt, dataset.columns)
+    where = predicate if dataset.where == "TRUE" else f"({dataset.where}) AND ({predicate})"
+    return dataclasses.replace(dataset, key=key, where=where)
+
+
+def apply(dataset, flt: Filter) -> DatasetHandle:
+    """Handle on ``dataset`` restricted to ``flt``, built once per (dataset, filter) across sessions."""
+    key = view_key(dataset, flt)
+    if isinstance(dataset, outofcore.OutOfCoreDataset):
+        return get_store().acquire(key, lambda: _select_out_of_core(dataset, flt, key))
+    return get_store().acquire(key, lambda: _select_in_memory(dataset, flt, key))
@@ -0,0 +1,51 @@
+"""Bounded-size product hierarchies for the sunburst.
+
+Only the ``top_n`` products of each sub-category are drawn; the rest are
+folded into one "Other" slice, so the figure has at most
+``sub-categories x (top_n + 1)`` leaves however many products there are.
+"""
+import pandas as pd
+
+from dashview.rollups import sales_frame
+
+OTHER_LABEL = "Other"
+PARENTS = ["Category", "Sub-Category"]
+
+
+def _fold_tail(products: pd.DataFrame, top_n: int) -> pd.DataFrame:
+    products = products.sort_values("Sales", ascending=False, kind="stable")
+    rank = products.groupby(PARENTS, sort=False).cumcount()
+    head = products[rank < top_n]
+    tail = products[rank >= top_n]
+    if tail.empty:
+        return head
+
+    other = tail.groupby(PARENTS, sort=False).agg(Sales=("Sales", "sum"), products=("Sales", "size")).reset_index()
+    other["Product Name"] = OTHER_LABEL + " (" + other.pop("products").astype(str) + " products)"
+    return pd.concat([head, other[head.columns]], ignore_index=True)
+
+
+def top_products(by_product: pd.DataFrame, top_n: int) -> pd.DataFrame:
+    """Category/Sub-Category/Product Name frame with the tail of each sub-category folded."""
+    products = sales_frame(by_product)
+    return _fold_tail(products, top_n)
+
+
+def subcategory_products(by_product: pd.DataFrame, category, sub_category, top_n: int) -> pd.DataFrame:
+    """Products of one sub-category only, computed when that sub-category is drilled into."""
+    try:
+        products = by_product.xs((category, sub_category), level=[0, 1], drop_level=False)
+    except KeyError:
+        return pd.DataFrame(columns=["Category", "Sub-Category", "Product Name", "Sales"])
+    return _fold_tail(sales_frame(products), top_n)
+
+
+def reducer(by_product: pd.DataFrame, drill=None):
+    """``ChartBudget`` reduce callback: show fewer products per sub-category, in proportion to the overshoot."""
+    def reduce(frame: pd.DataFrame, ratio: float) -> pd.DataFrame:
+        shown = int(frame.groupby(PARENTS, sort=False).size().max()) if len(frame) else 1
+        smaller_n = max(int(shown * ratio), 1)
+        if drill is None:
+            return top_products(by_product, smaller_n)
+        return subcategory_products(by_product, drill[0], drill[1], smaller_n)
+    return reduce
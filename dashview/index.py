@@ -0,0 +1,139 @@
+"""Inverted indexes for the selectbox drill-downs.
+
+Each indexed column is dictionary-encoded once; every distinct value maps to
+the row positions holding it, so selecting a value is a gather over that
+group instead of a string comparison against every row.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+INDEXED_COLUMNS = ("Region", "Category", "Sub-Category", "Segment", "State")
+
+
+@dataclass
+class ColumnIndex:
+    values: pd.Index
+    codes: np.ndarray
+    offsets: np.ndarray
+    positions: np.ndarray
+    sales_sum: np.ndarray
+    sales_count: np.ndarray
+    sales_valid: np.ndarray
+
+    @property
+    def nbytes(self) -> int:
+        arrays = (self.codes, self.offsets, self.positions, self.sales_sum, self.sales_count, self.sales_valid)
+        return sum(array.nbytes for array in arrays)
+
+    def rows(self, value) -> np.ndarray:
+        """Row positions where the column equals ``value`` (empty if absent)."""
+        code = self.values.get_indexer([value])[0]
+        if code < 0:
+            return self.positions[:0]
+        return self.positions[self.offsets[code]:self.offsets[code + 1]]
+
+    def totals(self, value) -> dict:
+        code = self.values.get_indexer([value])[0]
+        if code < 0:
+            return {"sum": 0.0, "count": 0, "mean": float("nan")}
+        valid = self.sales_valid[code]
+        return {
+            "sum": float(self.sales_sum[code]),
+            "count": int(self.sales_count[code]),
+            "mean": float(self.sales_sum[code] / valid) if valid else float("nan"),
+        }
+
+    def merged(self, delta: "ColumnIndex", base_rows: int) -> "ColumnIndex":
+        """This index with ``delta``'s rows appended as rows ``base_rows`` onwards.
+
+        Values new in the delta are added after the existing ones, matching
+        ``union_categoricals``.  Every group keeps its base positions first and
+        the delta's after them, so the base is moved, never re-sorted.
+        """
+        values = self.values.append(delta.values.difference(self.values, sort=False))
+        remap = values.get_indexer(delta.values)
+
+        def widen(array):
+            return np.concatenate([array, np.zeros(len(values) - len(array), dtype=array.dtype)])
+
+        base_counts = widen(np.diff(self.offsets))
+        delta_counts = np.zeros(len(values), dtype=base_counts.dtype)
+        delta_counts[remap] = np.diff(delta.offsets)
+        offsets = np.concatenate([[0], np.cumsum(base_counts + delta_counts)])
+
+        positions = np.empty(offsets[-1], dtype=np.intp)
+        base_shift = np.repeat(offsets[:len(self.values)] - self.offsets[:-1], np.diff(self.offsets))
+        positions[np.arange(len(self.positions)) + base_shift] = self.positions
+        delta_shift = np.repeat(offsets[remap] + base_counts[remap] - delta.offsets[:-1], np.diff(delta.offsets))
+        positions[np.arange(len(delta.positions)) + delta_shift] = delta.positions + base_rows
+
+        delta_codes = np.where(delta.codes >= 0, remap[delta.codes], -1)
+        sales = {}
+        for name in ("sales_sum", "sales_count", "sales_valid"):
+            merged = widen(getattr(self, name))
+            merged[remap] += getattr(delta, name)
+            sales[name] = merged
+        return ColumnIndex(values=values, codes=np.concatenate([self.codes, delta_codes]), offsets=offsets,
+                           positions=positions, **sales)
+
+
+def build_column_index(column: pd.Series, sales: pd.Series) -> ColumnIndex:
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        codes = column.cat.codes.to_numpy()
+        values = column.cat.categories
+    else:
+        codes, values = pd.factorize(column, sort=True)
+        values = pd.Index(values)
+
+    # Missing values get code -1; they are left out of every group.
+    order = np.argsort(codes, kind="stable")
+    sorted_codes = codes[order]
+    first = np.searchsorted(sorted_codes, 0)
+    positions = order[first:]
+    counts = np.bincount(sorted_codes[first:], minlength=len(values))
+    offsets = np.concatenate([[0], np.cumsum(counts)])
+
+    amounts = sales.to_numpy(dtype="float64", na_value=np.nan)
+    present = codes >= 0
+    valid_mask = present & ~np.isnan(amounts)
+    sales_sum = np.bincount(codes[valid_mask], weights=amounts[valid_mask], minlength=len(values))
+    sales_valid = np.bincount(codes[valid_mask], minlength=len(values))
+
+    return ColumnIndex(values=values, codes=codes, offsets=offsets, positions=positions,
+                       sales_sum=sales_sum, sales_count=counts, sales_valid=sales_valid)
+
+
+class GroupIndex:
+    """Per-column inverted indexes over one dataset's frame."""
+
+    def __init__(self, df: pd.DataFrame, columns=INDEXED_COLUMNS):
+        self.df = df
+        sales = df["Sales"] if "Sales" in df.columns else pd.Series(np.nan, index=df.index)
+        self.columns = {col: build_column_index(df[col], sales) for col in columns if col in df.columns}
+
+    @classmethod
+    def from_columns(cls, df: pd.DataFrame, columns: dict) -> "GroupIndex":
+        """An index over ``df`` made of already-built ``ColumnIndex`` objects."""
+        index = cls.__new__(cls)
+        index.df = df
+        index.columns = columns
+        return index
+
+    @property
+    def nbytes(self) -> int:
+        return sum(column.nbytes for column in self.columns.values())
+
+    def __getitem__(self, column: str) -> ColumnIndex:
+        return self.columns[column]
+
+    def values(self, column: str) -> pd.Index:
+        return self.columns[column].values
+
+    def select(self, column: str, value) -> pd.DataFrame:
+        """Rows where ``column == value``, gathered by position."""
+        return self.df.take(self.columns[column].rows(value))
+
+    def totals(self, column: str, value) -> dict:
+        return self.columns[column].totals(value)
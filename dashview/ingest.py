@@ -0,0 +1,100 @@
+"""Upload ingestion.
+
+Streamlit reruns ``main.py`` on every interaction while the uploader keeps
+its file, so parsing is keyed by a hash of the uploaded bytes and the parsed
+datasets are kept in the process-wide ``DatasetStore``.
+"""
+import hashlib
+import io
+import os
+
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from dashview import compact, outofcore, schema
+from dashview.dataset import Dataset
+from dashview.encoding import EncodingReport, sniff_encoding
+from dashview.store import DatasetHandle, get_store
+
+CHUNK_ROWS = int(os.environ.get("DASHVIEW_CHUNK_ROWS", "250000"))
+
+# "auto" spills uploads over DASHVIEW_OUT_OF_CORE_MB to disk when DuckDB is installed.
+MODES = ("auto", "memory", "out-of-core")
+
+
+def content_hash(data: bytes) -> str:
+    """Stable key for an upload's raw bytes."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _concat_chunks(chunks: list) -> pd.DataFrame:
+    if len(chunks) == 1:
+        return chunks[0]
+    # Each chunk infers its own categories; align them so concat keeps the categorical dtype.
+    first = chunks[0]
+    for col in first.columns:
+        if isinstance(first[col].dtype, pd.CategoricalDtype):
+            categories = union_categoricals([chunk[col] for chunk in chunks], ignore_order=True).categories
+            for chunk in chunks:
+                chunk[col] = chunk[col].cat.set_categories(categories)
+    return pd.concat(chunks, ignore_index=True, copy=False)
+
+
+def parse_csv(data: bytes, report: EncodingReport = None, chunk_rows: int = CHUNK_ROWS, on_progress=None,
+              date_formats: dict = None) -> pd.DataFrame:
+    """Parse ``data`` in ``chunk_rows`` chunks against the Superstore schema.
+
+    Each chunk is converted to its compact dtypes before the next one is read,
+    so the raw object-typed columns never exist for the whole file at once.
+    ``on_progress`` is called with the fraction of bytes consumed.
+
+    Date columns are parsed with the format given in ``date_formats``; a
+    column missing from it gets the format that best fits its first chunk,
+    which is recorded in ``date_formats``.
+    """
+    report = report or sniff_encoding(data)
+    buffer = io.BytesIO(data)
+    reader = pd.read_csv(buffer, encoding=report.encoding, encoding_errors=report.errors,
+                         dtype=schema.read_dtypes(), chunksize=chunk_rows)
+
+    date_formats = {} if date_formats is None else date_formats
+    chunks = []
+    with reader:
+        for chunk in reader:
+            for col in schema.DATE_COLUMNS:
+                if col not in chunk.columns:
+                    continue
+                if col not in date_formats:
+                    date_formats[col] = schema.pick_date_format(chunk[col])
+                chunk[col] = pd.to_datetime(chunk[col], format=date_formats[col], errors="coerce")
+            chunks.append(chunk)
+            if on_progress is not None:
+                on_progress(min(buffer.tell() / max(len(data), 1), 1.0))
+
+    if not chunks:
+        return pd.read_csv(io.BytesIO(data), encoding=report.encoding, encoding_errors=report.errors)
+    return _concat_chunks(chunks)
+
+
+def parse_dataset(data: bytes, key: str, on_progress=None) -> Dataset:
+    report = sniff_encoding(data)
+    date_formats = {}
+    df, memory = compact.compact(parse_csv(data, report, on_progress=on_progress, date_formats=date_formats))
+    dataset = Dataset.from_frame(key, df)
+    dataset.encoding = report
+    dataset.memory = memory
+    dataset.date_formats = date_formats
+    return dataset
+
+
+def load_dataset(data: bytes, key: str = None, on_progress=None, mode: str = "auto") -> DatasetHandle:
+    """Return a handle on the parsed dataset for ``data``, parsing only if no session holds it.
+
+    In out-of-core mode (see ``MODES``) the dataset stays on disk as Parquet
+    and its aggregates are queried from it instead of a frame in memory.
+    """
+    key = key or content_hash(data)
+    if outofcore.wanted(len(data), mode):
+        key = f"{key}-ooc"
+        return get_store().acquire(key, lambda: outofcore.spill(data, key, on_progress))
+    return get_store().acquire(key, lambda: parse_dataset(data, key, on_progress))
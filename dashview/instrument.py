@@ -0,0 +1,104 @@
+"""Per-rerun phase timing.
+
+Each script run creates a ``RerunTimer``, wraps its phases (parsing,
+aggregation, figure building, serialization, CSS injection, ...) and calls
+``finish()`` at the end.  Logging is opt-in: when ``DASHVIEW_TIMING_LOG`` is
+set, one JSON record per phase is appended to that file.  Every rerun of
+every page writes to it, so enable it for profiling sessions rather than
+leaving it on in a long-running deployment.
+
+``python -m dashview.instrument [log]`` prints p50/p99 per page and phase.
+"""
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+from collections import OrderedDict, defaultdict
+from contextlib import contextmanager
+
+
+LOG_PATH = os.environ.get("DASHVIEW_TIMING_LOG", "")
+DEFAULT_LOG = "dashview_timings.jsonl"  # what the summary reads when no log is named or configured
+
+_write_lock = threading.Lock()
+
+
+class RerunTimer:
+    def __init__(self, page: str, dataset: str = None, rows: int = None, log_path: str = LOG_PATH):
+        self.page = page
+        self.dataset = dataset
+        self.rows = rows
+        self.log_path = log_path
+        self.run_id = uuid.uuid4().hex[:12]
+        self.phases: "OrderedDict[str, dict]" = OrderedDict()
+        self.started = time.perf_counter()
+        self.total_ms = None
+
+    def attach(self, dataset) -> None:
+        """Tag the run's records with the dataset it rendered."""
+        self.dataset, self.rows = dataset.key, dataset.rows
+
+    def add(self, name: str, ms: float, rows: int = None) -> None:
+        """Record ``ms`` against phase ``name``; repeated phases accumulate."""
+        entry = self.phases.setdefault(name, {"ms": 0.0, "rows": None, "calls": 0})
+        entry["ms"] += ms
+        entry["calls"] += 1
+        if rows is not None:
+            entry["rows"] = rows
+
+    @contextmanager
+    def phase(self, name: str, rows: int = None):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, (time.perf_counter() - start) * 1000, rows)
+
+    def records(self) -> list:
+        stamp = time.time()
+        base = {"ts": stamp, "run": self.run_id, "page": self.page, "dataset": self.dataset}
+        records = [dict(base, phase=name, ms=round(entry["ms"], 3), rows=entry["rows"] if entry["rows"] is not None else self.rows)
+                   for name, entry in self.phases.items()]
+        if self.total_ms is not None:
+            records.append(dict(base, phase="total", ms=round(self.total_ms, 3), rows=self.rows))
+        return records
+
+    def finish(self) -> None:
+        """Close the run and append its records to the log; safe to call more than once."""
+        if self.total_ms is not None:
+            return
+        self.total_ms = (time.perf_counter() - self.started) * 1000
+        if not self.log_path:
+            return
+        lines = "".join(json.dumps(record) + "\n" for record in self.records())
+        try:
+            with _write_lock, open(self.log_path, "a", encoding="utf-8") as log:
+                log.write(lines)
+        except OSError:
+            # Timing must never break a page; a read-only deployment simply loses the log.
+            pass
+
+
+def summarize(path: str = LOG_PATH or DEFAULT_LOG) -> list:
+    """p50/p99/max per (page, phase) from a timing log."""
+    import numpy as np
+
+    samples = defaultdict(list)
+    with open(path, encoding="utf-8") as log:
+        for line in log:
+            if line.strip():
+                record = json.loads(line)
+                samples[(record["page"], record["phase"])].append(record["ms"])
+    return [
+        {"page": page, "phase": phase, "runs": len(values),
+         "p50_ms": float(np.percentile(values, 50)), "p99_ms": float(np.percentile(values, 99)), "max_ms": max(values)}
+        for (page, phase), values in sorted(samples.items())
+    ]
+
+
+if __name__ == "__main__":
+    for row in summarize(sys.argv[1] if len(sys.argv) > 1 else LOG_PATH or DEFAULT_LOG):
+        print(f"{row['page']:<24} {row['phase']:<12} n={row['runs']:<6} "
+              f"p50={row['p50_ms']:9.1f} ms  p99={row['p99_ms']:9.1f} ms  max={row['max_ms']:9.1f} ms")
@@ -0,0 +1,55 @@
+"""Deferred imports for heavy chart libraries.
+
+``lazy("plotly.express")`` returns a stand-in that imports the module on
+first attribute access, so a script only pays for Plotly or matplotlib
+once it actually builds a chart.  Time spent importing is charged to the
+``import`` phase of the rerun timer registered for the current thread
+(Streamlit runs each session's script on its own thread).
+"""
+import importlib
+import sys
+import threading
+import time
+
+_local = threading.local()
+
+
+def set_timer(timer) -> None:
+    _local.timer = timer
+
+
+def current_timer():
+    return getattr(_local, "timer", None)
+
+
+def import_module(name: str):
+    """``importlib.import_module`` that charges a first import to the current run's ``import`` phase.
+
+    Always goes through ``importlib``: a module another session's thread is
+    still importing is already in ``sys.modules`` but only partly
+    initialised, and the import lock makes this call wait for it.
+    """
+    loaded = name in sys.modules
+    start = time.perf_counter()
+    module = importlib.import_module(name)
+    timer = current_timer()
+    if timer is not None and not loaded:
+        timer.add("import", (time.perf_counter() - start) * 1000)
+    return module
+
+
+class LazyModule:
+    """Stand-in for module ``name`` that imports it on first attribute access."""
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr: str):
+        if self._module is None:
+            self._module = import_module(self._name)
+        return getattr(self._module, attr)
+
+
+def lazy(name: str) -> LazyModule:
+    return LazyModule(name)
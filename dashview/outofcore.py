@@ -0,0 +1,532 @@
+"""Out-of-core datasets for uploads larger than the memory budget.
+
+The upload is converted once into Parquet under ``DASHVIEW_SPILL_DIR``,
+partitioned by Region and keyed by the upload's content hash, and every
+aggregation the pages need is pushed down to DuckDB as a query over those
+files.  Only results come back into Python: the rollups, per-value totals,
+search previews and profile, all bounded by the number of groups rather
+than the number of rows.  Exports are written by DuckDB straight to a file.
+
+The spill directory doubles as a cache of conversions and is kept under
+``DASHVIEW_SPILL_MB`` by ``prune``: after each spill or append the least
+recently used directories no live dataset reads from are deleted.
+
+DuckDB is optional; without it every upload is parsed into memory.
+"""
+import codecs
+import csv
+import gc
+import importlib.util
+import json
+import os
+import shutil
+import tempfile
+import threading
+import weakref
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Optional
+
+import pandas as pd
+
+from dashview import export, schema
+from dashview.backend import _sorted_counts, get_backend
+from dashview.compact import MemoryReport
+from dashview.encoding import EncodingReport, sniff_encoding
+from dashview.index import INDEXED_COLUMNS
+from dashview.profile import ColumnProfile, DatasetProfile
+from dashview.rollups import PRODUCT_LEVELS, RollupCube, _empty, build_cube, _finish, _roll_up, merge_rollups
+from dashview.search import SearchIndex
+from dashview.timeseries import DailySeries
+
+SPILL_DIR = os.environ.get("DASHVIEW_SPILL_DIR") or os.path.join(tempfile.gettempdir(), "dashview")
+THRESHOLD_BYTES = int(os.environ.get("DASHVIEW_OUT_OF_CORE_MB", "1024")) * 1024 * 1024
+SPILL_BUDGET_BYTES = int(os.environ.get("DASHVIEW_SPILL_MB", "51200")) * 1024 * 1024
+MEMORY_LIMIT = os.environ.get("DASHVIEW_DUCKDB_MEMORY", "1GB")
+PARTITION_COLUMN = "Region"
+TRANSCODE_BYTES = 16 * 1024 * 1024
+DATE_SAMPLE_ROWS = 1000
+PREVIEW_ROWS = 20  # first rows of the upload, kept beside the partitions (these lose the file order)
+ROW_COLUMN = "__row"
+
+DERIVED = ("cube", "index", "search", "timeseries", "profile")
+
+# Spill directories being written, and the datasets reading them; ``prune`` keeps both.
+_writing = set()
+_live = weakref.WeakSet()
+_spill_lock = threading.Lock()
+
+_EXPORT_OPTIONS = {
+    export.CSV: "FORMAT CSV, HEADER",
+    export.CSV_GZIP: "FORMAT CSV, HEADER, COMPRESSION gzip",
+    export.PARQUET: "FORMAT PARQUET, COMPRESSION zstd",
+}
+
+
+def available() -> bool:
+    return importlib.util.find_spec("duckdb") is not None
+
+
+def wanted(size: int, mode: str = "auto") -> bool:
+    """Whether an upload of ``size`` bytes is spilled to disk in ``mode`` ("auto", "memory" or "out-of-core")."""
+    if mode == "memory":
+        return False
+    if mode == "out-of-core":
+        if not available():
+            raise RuntimeError("Out-of-core mode needs duckdb, which is not installed")
+        return True
+    return size > THRESHOLD_BYTES and available()
+
+
+def _quote(name: str) -> str:
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _literal(text: str) -> str:
+    return "'" + str(text).replace("'", "''") + "'"
+
+
+def _sql_kind(column_type: str) -> str:
+    column_type = column_type.upper()
+    if column_type == "BOOLEAN":
+        return "categorical"
+    if column_type.startswith(("TIMESTAMP", "DATE")):
+        return "datetime"
+    if column_type.startswith(("TINYINT", "SMALLINT", "INTEGER", "BIGINT", "HUGEINT", "UTINYINT", "USMALLINT",
+                               "UINTEGER", "UBIGINT", "FLOAT", "DOUBLE", "DECIMAL", "REAL")):
+        return "numeric"
+    return "text"
+
+
+def _transcode(data: bytes, report: EncodingReport, path: str, on_progress=None) -> None:
+    # DuckDB reads UTF-8 only; decoding incrementally keeps one slice of text in memory at a time.
+    decoder = codecs.getincrementaldecoder(report.encoding)(errors=report.errors)
+    view = memoryview(data)
+    with open(path, "w", encoding="utf-8", newline="") as out:
+        for start in range(0, len(data), TRANSCODE_BYTES):
+            out.write(decoder.decode(view[start:start + TRANSCODE_BYTES]))
+            if on_progress is not None:
+                on_progress(min(start + TRANSCODE_BYTES, len(data)) / len(data) / 2)
+        out.write(decoder.decode(b"", final=True))
+
+
+def _connect(directory: str):
+    import duckdb
+
+    conn = duckdb.connect()
+    conn.execute(f"SET memory_limit = {_literal(MEMORY_LIMIT)}")
+    conn.execute(f"SET temp_directory = {_literal(os.path.join(directory, 'tmp'))}")
+    # Row order is irrelevant to every query here; dropping it lets COPY stream.
+    conn.execute("SET preserve_insertion_order = false")
+    return conn
+
+
+def _sniffed_date_formats(conn, csv_path: str, source: str) -> dict:
+    """Formats DuckDB's CSV sniffer chose for the date columns it detected in ``source``, by column."""
+    date_format, timestamp_format = conn.execute(
+        f"SELECT DateFormat, TimestampFormat FROM sniff_csv({_literal(csv_path)})"
+    ).fetchone()
+    formats = {}
+    for name, column_type, *_ in conn.execute(f"DESCRIBE SELECT * FROM {source}").fetchall():
+        if column_type.upper() == "DATE":
+            formats[name] = date_format or None
+        elif column_type.upper().startswith("TIMESTAMP"):
+            formats[name] = timestamp_format or None
+    return formats
+
+
+def convert(data: bytes, directory: str, report: EncodingReport, on_progress=None) -> tuple:
+    """Write ``data`` as Parquet under ``directory``/parquet; returns its column names and date formats."""
+    os.makedirs(directory, exist_ok=True)
+    csv_path = os.path.join(directory, "upload.csv")
+    _transcode(data, report, csv_path, on_progress)
+
+    with open(csv_path, encoding="utf-8", newline="") as handle:
+        columns = next(csv.reader(handle), [])
+
+    types = {col: "DOUBLE" for col in schema.FLOAT32_COLUMNS if col in columns}
+    date_formats = {}
+    select = []
+    for col in columns:
+        if col in schema.DATE_COLUMNS:
+            types[col] = "VARCHAR"
+            sample = pd.read_csv(csv_path, usecols=[col], dtype=str, nrows=DATE_SAMPLE_ROWS)[col]
+            fmt = date_formats[col] = schema.pick_date_format(sample)
+            parsed = f"try_strptime({_quote(col)}, {_literal(fmt)})" if fmt else f"TRY_CAST({_quote(col)} AS TIMESTAMP)"
+            select.append(f"{parsed} AS {_quote(col)}")
+        else:
+            select.append(_quote(col))
+
+    types_sql = "{" + ", ".join(f"{_literal(col)}: {_literal(kind)}" for col, kind in types.items()) + "}"
+    options = "FORMAT PARQUET, COMPRESSION zstd"
+    if PARTITION_COLUMN in columns:
+        options += f", PARTITION_BY ({_quote(PARTITION_COLUMN)}), OVERWRITE_OR_IGNORE"
+
+    source = f"read_csv({_literal(csv_path)}, header = true, types = {types_sql})"
+    conn = _connect(directory)
+    try:
+        # Columns such as Ship Date are typed by DuckDB; appends parse them with the same format.
+        date_formats = {**_sniffed_date_formats(conn, csv_path, source), **date_formats}
+        conn.execute(f"COPY (SELECT {', '.join(select)} FROM {source}) "
+                     f"TO {_literal(os.path.join(directory, 'parquet'))} ({options})")
+        # The partitioned files come back in no particular order; keep the file's first rows, numbered.
+        conn.execute("SET preserve_insertion_order = true")
+        conn.execute(f"COPY (SELECT row_number() OVER () AS {_quote(ROW_COLUMN)}, * FROM "
+                     f"(SELECT {', '.join(select)} FROM {source} LIMIT {PREVIEW_ROWS})) "
+                     f"TO {_literal(os.path.join(directory, 'preview.parquet'))} (FORMAT PARQUET)")
+    finally:
+        conn.close()
+        os.remove(csv_path)
+    if on_progress is not None:
+        on_progress(1.0)
+    return columns, date_formats
+
+
+def _directory_bytes(directory: str) -> int:
+    total = 0
+    for root, _, names in os.walk(directory):
+        for name in names:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total
+
+
+def _in_use() -> set:
+    directories = set(_writing)
+    for dataset in list(_live):
+        directories.add(dataset.path)
+        directories.update(os.path.dirname(part) for part in dataset.parts)
+    return {os.path.abspath(directory) for directory in directories}
+
+
+def prune(spill_dir: str = SPILL_DIR, budget_bytes: int = SPILL_BUDGET_BYTES) -> list:
+    """Delete the least recently used spill directories until ``spill_dir`` fits ``budget_bytes``.
+
+    Directories read by a live dataset, or still being written, are kept
+    even when that leaves the total over budget; once the store has evicted
+    their datasets and no session holds them, a later prune removes them.
+    Returns the deleted paths.
+    """
+    with _spill_lock:
+        try:
+            entries = [os.path.abspath(os.path.join(spill_dir, name)) for name in os.listdir(spill_dir)]
+        except FileNotFoundError:
+            return []
+        directories = {directory: os.path.getmtime(directory) for directory in entries if os.path.isdir(directory)}
+        sizes = {directory: _directory_bytes(directory) for directory in directories}
+        used = sum(sizes.values())
+        if used <= budget_bytes:
+            return []
+        # Evicted datasets sit in reference cycles (search -> dataset); collect them before checking.
+        gc.collect()
+        in_use = _in_use()
+        removed = []
+        for directory in sorted(directories, key=directories.get):
+            if used <= budget_bytes:
+                break
+            if directory in in_use:
+                continue
+            shutil.rmtree(directory, ignore_errors=True)
+            used -= sizes[directory]
+            removed.append(directory)
+    return removed
+
+
+def _claim(directory: str) -> None:
+    with _spill_lock:
+        _writing.add(os.path.abspath(directory))
+
+
+def _unclaim(directory: str) -> None:
+    with _spill_lock:
+        _writing.discard(os.path.abspath(directory))
+
+
+def spill(data: bytes, key: str, on_progress=None, spill_dir: str = SPILL_DIR) -> "OutOfCoreDataset":
+    """Return the out-of-core dataset for ``data``, converting it unless a previous run already did."""
+    report = sniff_encoding(data)
+    directory = os.path.join(spill_dir, key)
+    marker = os.path.join(directory, "_SUCCESS")
+    _claim(directory)
+    try:
+        if os.path.exists(marker):
+            with open(marker, encoding="utf-8") as handle:
+                converted = json.load(handle)
+            columns, date_formats = converted["columns"], converted.get("date_formats", {})
+            os.utime(directory)  # a reused conversion counts as recently used
+        else:
+            shutil.rmtree(directory, ignore_errors=True)
+            columns, date_formats = convert(data, directory, report, on_progress)
+            with open(marker, "w", encoding="utf-8") as handle:
+                json.dump({"columns": columns, "date_formats": date_formats}, handle)
+        prune(spill_dir)
+    finally:
+        _unclaim(directory)
+    return OutOfCoreDataset(key=key, path=directory, columns=columns, encoding=report, date_formats=date_formats)
+
+
+def append(base: "OutOfCoreDataset", delta: pd.DataFrame, key: str, spill_dir: str = SPILL_DIR) -> "OutOfCoreDataset":
+    """``base`` plus the (validated, in-memory) ``delta`` rows, written as one more Parquet directory.
+
+    The base files are shared, not rewritten.  Rollups and per-value totals
+    are merged from the delta's; the profile is recomputed on first use.
+    """
+    directory = os.path.join(spill_dir, key)
+    _claim(directory)
+    try:
+        return _append(base, delta, key, directory)
+    finally:
+        prune(spill_dir)
+        _unclaim(directory)
+
+
+def _append(base: "OutOfCoreDataset", delta: pd.DataFrame, key: str, directory: str) -> "OutOfCoreDataset":
+    shutil.rmtree(directory, ignore_errors=True)
+    os.makedirs(directory)
+    parquet = os.path.join(directory, "parquet")
+
+    # Categoricals would become DuckDB ENUMs; the base files hold plain strings.
+    frame = delta.astype({col: "object" for col in delta.columns if isinstance(delta[col].dtype, pd.CategoricalDtype)})
+    select = ", ".join(f"CAST({_quote(col)} AS DOUBLE) AS {_quote(col)}" if col in schema.FLOAT32_COLUMNS else _quote(col)
+                       for col in frame.columns)
+    options = "FORMAT PARQUET, COMPRESSION zstd"
+    if PARTITION_COLUMN in frame.columns:
+        options += f", PARTITION_BY ({_quote(PARTITION_COLUMN)})"
+    conn = _connect(directory)
+    try:
+        conn.register("delta", frame)
+        conn.execute(f"COPY (SELECT {select} FROM delta) TO {_literal(parquet)} ({options})")
+    finally:
+        conn.close()
+
+    parts = base.parts or (os.path.join(base.path, "parquet"),)
+    merged = OutOfCoreDataset(key=key, path=directory, columns=base.columns, encoding=base.encoding,
+                              date_formats=base.date_formats, parts=parts + (parquet,))
+    cube = base.cube.merged(build_cube(delta))
+    index = RollupIndex({
+        col: merge_rollups(rollup, _finish(get_backend().group_sales(delta, [col])))
+        for col, rollup in base.index.columns.items()
+    })
+    merged.__dict__.update(rows=base.rows + len(delta), cube=cube, index=index,
+                           search=SqlSearch(merged, index), timeseries=DailySeries.from_cube(cube))
+    return merged
+
+
+class RollupIndex:
+    """``GroupIndex`` stand-in answering ``values``/``totals`` from per-column rollups."""
+
+    def __init__(self, rollups: dict):
+        self.columns = rollups
+
+    @property
+    def nbytes(self) -> int:
+        return int(sum(rollup.memory_usage(deep=True).sum() for rollup in self.columns.values()))
+
+    def values(self, column: str) -> pd.Index:
+        return self.columns[column].index
+
+    def totals(self, column: str, value) -> dict:
+        rollup = self.columns[column]
+        if value not in rollup.index:
+            return {"sum": 0.0, "count": 0, "mean": float("nan")}
+        row = rollup.loc[value]
+        return {"sum": float(row["sum"]), "count": int(row["count"]), "mean": float(row["mean"])}
+
+
+class SqlSearch(SearchIndex):
+    """``SearchIndex`` whose matches are turned into a predicate and run by DuckDB."""
+
+    def __init__(self, dataset: "OutOfCoreDataset", index: RollupIndex):
+        super().__init__(index)
+        self.dataset = dataset
+
+    def where(self, query: str) -> str:
+        if not query:
+            return "TRUE"
+        clauses = [
+            f"{_quote(col)} IN ({', '.join(_literal(value) for value in values)})"
+            for col, values in self.matching_values(query).items() if values
+        ]
+        return " OR ".join(clauses) or "FALSE"
+
+    def filter(self, query: str) -> pd.DataFrame:
+        return self.dataset.select(self.where(query))
+
+    def head(self, query: str, n: int = 5) -> pd.DataFrame:
+        return self.dataset.select(self.where(query), limit=n)
+
+
+@dataclass(eq=False)
+class OutOfCoreDataset:
+    """A spilled upload: Parquet files on disk plus the query results built from them."""
+
+    key: str
+    path: str
+    columns: list
+    encoding: Optional[EncodingReport] = None
+    memory: Optional[MemoryReport] = None
+    df: Optional[pd.DataFrame] = None
+    nbytes: int = 0
+    date_formats: dict = field(default_factory=dict)  # format each date column was parsed with at conversion
+    parts: tuple = ()  # Parquet directories read together; defaults to ``path``/parquet
+    where: str = "TRUE"  # row predicate of a filtered view, pushed down into every query
+
+    def __post_init__(self):
+        with _spill_lock:
+            _live.add(self)
+
+    @property
+    def footprint(self) -> int:
+        built = (self.__dict__[name] for name in DERIVED if name in self.__dict__)
+        return sum(structure.nbytes for structure in built)
+
+    @cached_property
+    def _conn(self):
+        conn = _connect(self.path)
+        parts = self.parts or (os.path.join(self.path, "parquet"),)
+        files = ", ".join(_literal(os.path.join(part, "**", "*.parquet")) for part in parts)
+        conn.execute(f"CREATE VIEW sales AS SELECT {', '.join(map(_quote, self.columns))} "
+                     f"FROM read_parquet([{files}], hive_partitioning = true, union_by_name = true) WHERE {self.where}")
+        return conn
+
+    def close(self) -> None:
+        """Close the DuckDB connection (and free its buffers); the next query opens a new one."""
+        conn = self.__dict__.pop("_conn", None)
+        if conn is not None:
+            conn.close()
+
+    def query(self, sql: str) -> pd.DataFrame:
+        # One cursor per query so concurrent sessions do not share statement state.
+        cursor = self._conn.cursor()
+        try:
+            return cursor.execute(sql).df()
+        finally:
+            cursor.close()
+
+    def select(self, where: str = "TRUE", limit: int = None) -> pd.DataFrame:
+        sql = f"SELECT * FROM sales WHERE {where}"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        return self.query(sql)
+
+    @cached_property
+    def rows(self) -> int:
+        return int(self.query("SELECT count(*) AS n FROM sales")["n"].iloc[0])
+
+    def column_kinds(self) -> dict:
+        described = self.query("DESCRIBE sales")
+        return dict(zip(described["column_name"], map(_sql_kind, described["column_type"])))
+
+    def preview(self, n: int = 5) -> pd.DataFrame:
+        """The upload's first ``n`` rows; a filtered view (or an old spill) gets ``n`` matching rows in no set order."""
+        first_part = (self.parts or (os.path.join(self.path, "parquet"),))[0]
+        path = os.path.join(os.path.dirname(first_part), "preview.parquet")
+        if self.where != "TRUE" or n > PREVIEW_ROWS or not os.path.exists(path):
+            return self.select(limit=n)
+        return self.query(f"SELECT * EXCLUDE ({_quote(ROW_COLUMN)}) FROM read_parquet({_literal(path)}) "
+                          f"ORDER BY {_quote(ROW_COLUMN)} LIMIT {int(n)}")
+
+    def group_sales(self, keys: list, value: str = "Sales") -> pd.DataFrame:
+        """Same frame as ``PandasBackend.group_sales``, computed by DuckDB."""
+        columns = ", ".join(map(_quote, keys))
+        present = " AND ".join(f"{_quote(key)} IS NOT NULL" for key in keys)
+        frame = self.query(
+            f"SELECT {columns}, coalesce(sum(CAST({_quote(value)} AS DOUBLE)), 0) AS sum, "
+            f"count(*) AS count, count({_quote(value)}) AS valid FROM sales WHERE {present} GROUP BY {columns}"
+        )
+        return self._sales_frame(frame, keys)
+
+    def daily_sales(self, date: str = "Order Date", value: str = "Sales") -> pd.DataFrame:
+        frame = self.query(
+            f"SELECT CAST(date_trunc('day', {_quote(date)}) AS TIMESTAMP) AS {_quote(date)}, "
+            f"coalesce(sum(CAST({_quote(value)} AS DOUBLE)), 0) AS sum, count(*) AS count, "
+            f"count({_quote(value)}) AS valid FROM sales WHERE {_quote(date)} IS NOT NULL GROUP BY 1"
+        )
+        frame[date] = pd.to_datetime(frame[date])
+        return self._sales_frame(frame, [date])
+
+    @staticmethod
+    def _sales_frame(frame: pd.DataFrame, keys: list) -> pd.DataFrame:
+        frame = frame.set_index(keys).sort_index()
+        frame["sum"] = frame["sum"].astype("float64")
+        frame[["count", "valid"]] = frame[["count", "valid"]].astype("int64")
+        return frame[["sum", "count", "valid"]]
+
+    def value_counts(self, column: str) -> pd.Series:
+        frame = self.query(f"SELECT {_quote(column)}, count(*) AS count FROM sales "
+                           f"WHERE {_quote(column)} IS NOT NULL GROUP BY 1")
+        return _sorted_counts(frame.set_index(column)["count"])
+
+    def export_bytes(self, query: str, fmt: export.ExportFormat) -> bytes:
+        """The rows matching ``query`` as ``fmt``, written by DuckDB to a temporary file."""
+        if fmt not in _EXPORT_OPTIONS:
+            raise ValueError(f"Unknown export format: {fmt.label}")
+        fd, path = tempfile.mkstemp(suffix=f".{fmt.extension}", dir=self.path)
+        os.close(fd)
+        try:
+            self.query(f"COPY (SELECT * FROM sales WHERE {self.search.where(query)}) "
+                       f"TO {_literal(path)} ({_EXPORT_OPTIONS[fmt]})")
+            with open(path, "rb") as handle:
+                return handle.read()
+        finally:
+            os.remove(path)
+
+    @cached_property
+    def cube(self) -> RollupCube:
+        if all(level in self.columns for level in PRODUCT_LEVELS):
+            by_product = _finish(self.group_sales(PRODUCT_LEVELS))
+            by_subcategory = _roll_up(by_product, PRODUCT_LEVELS[:2])
+            by_category = _roll_up(by_subcategory, PRODUCT_LEVELS[:1])
+        else:
+            by_product = _empty(PRODUCT_LEVELS)
+            by_subcategory = _empty(PRODUCT_LEVELS[:2])
+            by_category = _finish(self.group_sales(["Category"])) if "Category" in self.columns else _empty(["Category"])
+
+        by_region = _finish(self.group_sales(["Region"])) if "Region" in self.columns else _empty(["Region"])
+        by_day = _finish(self.daily_sales()) if "Order Date" in self.columns else _empty(["Order Date"])
+
+        row = self.query("SELECT coalesce(sum(CAST(\"Sales\" AS DOUBLE)), 0) AS sum, count(*) AS count, "
+                         "count(\"Sales\") AS valid FROM sales").iloc[0]
+        valid = int(row["valid"])
+        total = pd.Series({
+            "sum": float(row["sum"]),
+            "count": int(row["count"]),
+            "mean": float(row["sum"]) / valid if valid else float("nan"),
+            "valid": valid,
+        })
+        return RollupCube(total=total, by_region=by_region, by_category=by_category,
+                          by_subcategory=by_subcategory, by_product=by_product, by_day=by_day)
+
+    @cached_property
+    def index(self) -> RollupIndex:
+        return RollupIndex({col: _finish(self.group_sales([col])) for col in INDEXED_COLUMNS if col in self.columns})
+
+    @cached_property
+    def search(self) -> SqlSearch:
+        return SqlSearch(self, self.index)
+
+    @cached_property
+    def timeseries(self) -> DailySeries:
+        return DailySeries.from_cube(self.cube)
+
+    @cached_property
+    def profile(self) -> DatasetProfile:
+        # SUMMARIZE scans every column once; distinct counts are HyperLogLog estimates.
+        summary = self.query("SUMMARIZE sales")
+        rows = self.rows
+        profile = DatasetProfile(rows=rows)
+        for _, stats in summary.iterrows():
+            kind = _sql_kind(stats["column_type"])
+            null_share = float(stats["null_percentage"]) / 100 if pd.notna(stats["null_percentage"]) else 0.0
+            nulls = int(round(rows * null_share))
+            column = ColumnProfile(name=stats["column_name"], kind=kind, rows=rows, nulls=nulls,
+                                   known_distinct=int(stats["approx_unique"]) if pd.notna(stats["approx_unique"]) else 0)
+            if kind == "numeric" and pd.notna(stats["avg"]):
+                column.count = rows - nulls
+                column.mean = float(stats["avg"])
+                std = float(stats["std"]) if pd.notna(stats["std"]) else 0.0
+                column.m2 = std * std * max(column.count - 1, 0)
+            profile.columns[column.name] = column
+        return profile
@@ -0,0 +1,77 @@
+"""Sidebar panels shared by the pages: the global filter bar and optional diagnostics."""
+import streamlit as st
+
+from dashview import filters, prefetch
+from dashview.charts import ChartBudget
+from dashview.instrument import RerunTimer
+
+
+def filter_bar(state):
+    """Global filters in the sidebar; returns the dataset the page should show, or None if none is loaded.
+
+    The selection is kept in ``state["filter"]`` rather than in widget keys,
+    so it survives switching pages.  The filtered dataset's handle is kept in
+    ``state["filter_handle"]`` while the selection is unchanged.
+    """
+    if "dataset" not in state or not state["dataset"].rows:
+        return None
+    dataset = state["dataset"]
+    wait_for(dataset, "cube", "index")  # the filter options come from them
+    current = state.get("filter", filters.Filter())
+
+    st.sidebar.markdown("### 🔎 Global Filters")
+    picked = {}
+    for column, name in filters.FIELDS.items():
+        if column not in dataset.index.columns:
+            continue
+        options = [str(value) for value in dataset.index.values(column)]
+        chosen = [value for value in getattr(current, name) if value in options]
+        picked[name] = tuple(st.sidebar.multiselect(column, options, default=chosen))
+
+    months = filters.months(dataset)
+    if len(months) > 1:
+        first, last = current.months or (months[0], months[-1])
+        if first not in months or last not in months:
+            first, last = months[0], months[-1]
+        first, last = st.sidebar.select_slider("Order month", options=months, value=(first, last))
+        picked["months"] = None if (first, last) == (months[0], months[-1]) else (first, last)
+
+    flt = state["filter"] = filters.Filter(**picked)
+    if flt.is_empty:
+        state.pop("filter_handle", None)
+        return dataset
+    handle = state.get("filter_handle")
+    if handle is None or handle.key != filters.view_key(dataset, flt):
+        handle = state["filter_handle"] = filters.apply(dataset, flt)
+        prefetch.warm(handle.dataset)
+    st.sidebar.caption(f"{handle.dataset.rows:,} of {dataset.rows:,} rows match")
+    return handle.dataset
+
+
+def wait_for(dataset, *names) -> None:
+    """Show a placeholder while the background prefetch is still building ``names`` of ``dataset``."""
+    pending = prefetch.pending(dataset, names)
+    if pending:
+        with st.spinner(f"⏳ Preparing {', '.join(pending)}..."):
+            prefetch.wait(dataset, pending)
+
+
+def chart_debug_panel(budget: ChartBudget) -> None:
+    """Figure size and serialization time of every chart on the page, behind a sidebar toggle."""
+    if not st.sidebar.checkbox("🛠 Chart debug panel", key="chart_debug_panel"):
+        return
+    with st.sidebar.expander("📦 Chart payloads", expanded=True):
+        if budget.records:
+            st.dataframe(budget.frame(), hide_index=True)
+        else:
+            st.caption("No charts on this page.")
+
+
+def timing_panel(timer: RerunTimer) -> None:
+    """Phase breakdown of the current rerun, behind a sidebar toggle; also closes the run."""
+    timer.finish()
+    if not st.sidebar.checkbox("⏱ Timing panel", key="timing_panel"):
+        return
+    with st.sidebar.expander(f"⏱ {timer.page}: {timer.total_ms:,.1f} ms", expanded=True):
+        st.dataframe([{"phase": record["phase"], "ms": record["ms"], "rows": record["rows"]} for record in timer.records()],
+                     hide_index=True)
@@ -0,0 +1,97 @@
+"""Background precomputation of page aggregates.
+
+``warm(dataset)`` runs as soon as a dataset is published.  A small thread
+pool builds every derived structure, plus the chart data the pages show
+by default (period rollups, the default moving average), so that by the
+time the user opens a page its aggregates are usually ready.  Pages
+``wait`` for the structures they read: while a build is still running
+they show a placeholder instead of starting a second build of their own.
+
+Threads rather than processes: the structures are cached on the shared
+dataset object, and pandas/numpy release the GIL for most of the work.
+"""
+import os
+import threading
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from dashview.rollups import GRANULARITIES
+
+WORKERS = int(os.environ.get("DASHVIEW_PREFETCH_WORKERS", "2"))
+DEFAULT_WINDOW = 30  # the Time Series page's initial moving-average window
+
+# Structures built in order within a task depend on the ones before them.
+TASKS = (
+    ("cube", "timeseries"),
+    ("index", "search"),
+    ("profile",),
+)
+
+
+def _chart_data(dataset, name: str) -> None:
+    if name == "cube":
+        for granularity in GRANULARITIES:
+            dataset.cube.by_period(granularity)
+    elif name == "timeseries":
+        dataset.timeseries.moving_average(DEFAULT_WINDOW)
+
+
+class Prefetcher:
+    def __init__(self, workers: int = WORKERS):
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dashview-prefetch")
+        self._futures = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def warm(self, dataset) -> dict:
+        """Start building ``dataset``'s structures unless already started; returns a future per structure."""
+        with self._lock:
+            futures = self._futures.get(dataset)
+            if futures is not None:
+                return futures
+            futures = self._futures[dataset] = {name: Future() for task in TASKS for name in task}
+        for task in TASKS:
+            self._executor.submit(self._build, dataset, task, {name: futures[name] for name in task})
+        return futures
+
+    @staticmethod
+    def _build(dataset, names: tuple, futures: dict) -> None:
+        for name in names:
+            try:
+                getattr(dataset, name)
+                _chart_data(dataset, name)
+            except BaseException as exc:
+                futures[name].set_exception(exc)
+            else:
+                futures[name].set_result(name)
+
+    def pending(self, dataset, names) -> list:
+        with self._lock:
+            futures = self._futures.get(dataset, {})
+        return [name for name in names if name in futures and not futures[name].done()]
+
+    def wait(self, dataset, names=None, timeout: float = None) -> None:
+        """Block until ``names`` (default: all) are built; re-raises a failed build."""
+        with self._lock:
+            futures = self._futures.get(dataset, {})
+        for name in names or list(futures):
+            if name in futures:
+                futures[name].result(timeout)
+
+
+_prefetcher = Prefetcher()
+
+
+def get_prefetcher() -> Prefetcher:
+    return _prefetcher
+
+
+def warm(dataset) -> dict:
+    return _prefetcher.warm(dataset)
+
+
+def pending(dataset, names) -> list:
+    return _prefetcher.pending(dataset, names)
+
+
+def wait(dataset, names=None, timeout: float = None) -> None:
+    _prefetcher.wait(dataset, names, timeout)
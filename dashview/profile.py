@@ -0,0 +1,160 @@
+"""Column statistics for the Data Insights page, computed in one pass.
+
+Rows are consumed in chunks and every statistic is mergeable: null counts,
+streaming mean/variance (Chan et al.'s parallel update), min/max, and
+distinct counts.  Distinct counts are exact for categorical columns and
+estimated with a HyperLogLog sketch for free text, so high-cardinality
+columns such as Order ID or Customer Name cost no hash table.
+"""
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+CHUNK_ROWS = 1_000_000
+HLL_PRECISION = 14  # 16384 registers, ~0.8% standard error
+
+
+class HyperLogLog:
+    def __init__(self, precision: int = HLL_PRECISION):
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def add_hashes(self, hashes: np.ndarray) -> None:
+        if len(hashes) == 0:
+            return
+        p = self.precision
+        buckets = (hashes >> np.uint64(64 - p)).astype(np.int64)
+        rest = (hashes << np.uint64(p)) >> np.uint64(p)
+        # Rank = position of the leftmost 1-bit in the remaining 64 - p bits.
+        width = 64 - p
+        highest = np.floor(np.log2(np.maximum(rest, 1).astype(np.float64))).astype(np.int64)
+        ranks = np.where(rest == 0, width + 1, width - highest).astype(np.uint8)
+        np.maximum.at(self.registers, buckets, ranks)
+
+    def merge(self, other: "HyperLogLog") -> None:
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def estimate(self) -> int:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros:
+            return int(round(m * np.log(m / zeros)))
+        return int(round(raw))
+
+
+def _kind(series: pd.Series) -> str:
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype) or pd.api.types.is_bool_dtype(dtype):
+        return "categorical"
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return "datetime"
+    if pd.api.types.is_numeric_dtype(dtype):
+        return "numeric"
+    return "text"
+
+
+@dataclass
+class ColumnProfile:
+    name: str
+    kind: str
+    rows: int = 0
+    nulls: int = 0
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    minimum: Optional[object] = None
+    maximum: Optional[object] = None
+    values: Optional[set] = None
+    sketch: Optional[HyperLogLog] = None
+    known_distinct: Optional[int] = None  # set when the count comes from elsewhere (e.g. a SQL engine)
+
+    def __post_init__(self):
+        if self.known_distinct is not None:
+            return
+        if self.kind == "categorical" and self.values is None:
+            self.values = set()
+        elif self.kind != "categorical" and self.sketch is None:
+            self.sketch = HyperLogLog()
+
+    @property
+    def distinct(self) -> int:
+        if self.known_distinct is not None:
+            return self.known_distinct
+        return len(self.values) if self.values is not None else self.sketch.estimate()
+
+    @property
+    def distinct_is_exact(self) -> bool:
+        return self.values is not None
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.count - 1) if self.count > 1 else float("nan")
+
+    def update(self, series: pd.Series) -> None:
+        present = series.dropna()
+        self.rows += len(series)
+        self.nulls += len(series) - len(present)
+        if present.empty:
+            return
+
+        if self.values is not None:
+            self.values.update(present.unique())
+        else:
+            self.sketch.add_hashes(pd.util.hash_pandas_object(present, index=False).to_numpy())
+
+        if self.kind in ("numeric", "datetime"):
+            low, high = present.min(), present.max()
+            self.minimum = low if self.minimum is None else min(self.minimum, low)
+            self.maximum = high if self.maximum is None else max(self.maximum, high)
+
+        if self.kind == "numeric":
+            values = present.to_numpy(dtype="float64")
+            n, chunk_mean = len(values), float(values.mean())
+            chunk_m2 = float(((values - chunk_mean) ** 2).sum())
+            total = self.count + n
+            delta = chunk_mean - self.mean
+            self.mean += delta * n / total
+            self.m2 += chunk_m2 + delta * delta * self.count * n / total
+            self.count = total
+
+
+@dataclass
+class DatasetProfile:
+    rows: int = 0
+    columns: dict = field(default_factory=dict)
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        self.rows += len(chunk)
+        for name in chunk.columns:
+            column = self.columns.get(name)
+            if column is None:
+                column = self.columns[name] = ColumnProfile(name=name, kind=_kind(chunk[name]))
+            column.update(chunk[name])
+
+    @property
+    def nbytes(self) -> int:
+        return sum(column.sketch.registers.nbytes for column in self.columns.values() if column.sketch is not None)
+
+    def of_kind(self, *kinds) -> list:
+        return [column for column in self.columns.values() if column.kind in kinds]
+
+    @property
+    def categorical_columns(self) -> list:
+        return [column.name for column in self.of_kind("categorical", "text")]
+
+    @property
+    def numerical_columns(self) -> list:
+        return [column.name for column in self.of_kind("numeric")]
+
+
+def build_profile(df: pd.DataFrame, chunk_rows: int = CHUNK_ROWS) -> DatasetProfile:
+    profile = DatasetProfile()
+    for start in range(0, len(df), chunk_rows):
+        profile.update(df.iloc[start:start + chunk_rows])
+    if not profile.columns:
+        profile.columns = {name: ColumnProfile(name=name, kind=_kind(df[name])) for name in df.columns}
+    return profile
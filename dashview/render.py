@@ -0,0 +1,111 @@
+"""Cached matplotlib rendering.
+
+Charts are drawn on standalone ``Figure`` objects (never registered with
+pyplot, so nothing accumulates in its global figure manager), saved to PNG
+and released immediately.  The PNGs are kept in a byte-bounded LRU keyed by
+(dataset hash, column, theme), so a rerun with the same selection only
+sends the cached image.
+"""
+import io
+import os
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+from dashview.lazy import import_module
+
+DEFAULT_BUDGET_BYTES = int(os.environ.get("DASHVIEW_RENDER_CACHE_MB", "64")) * 1024 * 1024
+DPI = 150
+MAX_BARS = 40  # bars beyond these are folded into one "Other" bar
+OTHER_LABEL = "Other"
+
+THEMES = {
+    "insights": {"bar_color": "yellow", "grid_alpha": 0.7},
+}
+
+
+class RenderCache:
+    def __init__(self, budget_bytes: int = DEFAULT_BUDGET_BYTES):
+        self.budget_bytes = budget_bytes
+        self._entries: "OrderedDict[tuple, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple):
+        with self._lock:
+            image = self._entries.get(key)
+            if image is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return image
+
+    def put(self, key: tuple, image: bytes) -> None:
+        if len(image) > self.budget_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.used_bytes -= len(previous)
+            self._entries[key] = image
+            self.used_bytes += len(image)
+            while self.used_bytes > self.budget_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.used_bytes -= len(evicted)
+
+
+_cache = RenderCache()
+
+
+def get_cache() -> RenderCache:
+    return _cache
+
+
+def _to_png(fig) -> bytes:
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    buffer = io.BytesIO()
+    try:
+        FigureCanvasAgg(fig).print_png(buffer)
+    finally:
+        # Drop artists and canvas references right away instead of waiting for the GC.
+        fig.clear()
+    return buffer.getvalue()
+
+
+def top_counts(counts: pd.Series, max_bars: int = MAX_BARS) -> pd.Series:
+    """The ``max_bars - 1`` largest of the (descending) ``counts`` plus the rest folded into "Other"."""
+    if len(counts) <= max_bars:
+        return counts
+    head = counts.iloc[:max_bars - 1]
+    other = pd.Series([counts.iloc[max_bars - 1:].sum()], index=[OTHER_LABEL], name=counts.name)
+    return pd.concat([pd.Series(head.to_numpy(), index=head.index.astype(str), name=counts.name), other])
+
+
+def value_counts_bar(counts: pd.Series, column: str, theme: dict) -> bytes:
+    # A bar per value of a column like Order ID would take minutes to draw and be unreadable.
+    counts = top_counts(counts)
+    # matplotlib is only imported once a chart misses the cache.
+    Figure = import_module("matplotlib.figure").Figure
+    fig = Figure(figsize=(10, 5), dpi=DPI, layout="tight")
+    ax = fig.add_subplot()
+    counts.plot(kind="bar", color=theme["bar_color"], ax=ax)
+    ax.set_title(f"Distribution of {column}", fontsize=16, fontweight="bold")
+    ax.set_ylabel("Count")
+    ax.set_xlabel(column)
+    ax.grid(axis="y", linestyle="--", alpha=theme["grid_alpha"])
+    return _to_png(fig)
+
+
+def cached_value_counts_bar(dataset, column: str, theme: str = "insights") -> bytes:
+    """Bar chart of ``dataset.value_counts(column)``; the counts are only computed on a cache miss."""
+    key = (dataset.key, column, theme)
+    image = _cache.get(key)
+    if image is None:
+        image = value_counts_bar(dataset.value_counts(column), column, THEMES[theme])
+        _cache.put(key, image)
+    return image
@@ -0,0 +1,126 @@
+"""Sales rollups shared by every page.
+
+The cube is built once per dataset; pages read their totals from it instead
+of grouping the row-level frame on every rerun.  Each rollup is indexed by
+its dimension(s) and has ``sum``, ``count`` (rows) and ``mean`` columns.
+"""
+from dataclasses import dataclass, field
+
+import pandas as pd
+
+from dashview.backend import get_backend
+
+PRODUCT_LEVELS = ["Category", "Sub-Category", "Product Name"]
+
+# Resample rules for the time-series granularities; Day is ``by_day`` itself.
+GRANULARITIES = {"Day": None, "Week": "W-MON", "Month": "MS", "Quarter": "QS"}
+
+
+@dataclass
+class RollupCube:
+    total: pd.Series
+    by_region: pd.DataFrame
+    by_category: pd.DataFrame
+    by_subcategory: pd.DataFrame
+    by_product: pd.DataFrame
+    by_day: pd.DataFrame
+    _periods: dict = field(default_factory=dict, repr=False)
+
+    def by_period(self, granularity: str) -> pd.DataFrame:
+        """Sales by ``granularity`` (a key of ``GRANULARITIES``), rolled up from ``by_day`` on first use."""
+        rule = GRANULARITIES[granularity]
+        if rule is None or self.by_day.empty:
+            return self.by_day
+        if granularity not in self._periods:
+            resampled = self.by_day[["sum", "count", "valid"]].resample(rule, label="left", closed="left").sum()
+            self._periods[granularity] = _finish(resampled)
+        return self._periods[granularity]
+
+    def merged(self, delta: "RollupCube") -> "RollupCube":
+        """A new cube covering this cube's rows plus ``delta``'s; neither input is modified."""
+        total = self.total[["sum", "count", "valid"]] + delta.total[["sum", "count", "valid"]]
+        total["mean"] = total["sum"] / total["valid"] if total["valid"] else float("nan")
+        return RollupCube(
+            total=total[["sum", "count", "mean", "valid"]],
+            by_region=merge_rollups(self.by_region, delta.by_region),
+            by_category=merge_rollups(self.by_category, delta.by_category),
+            by_subcategory=merge_rollups(self.by_subcategory, delta.by_subcategory),
+            by_product=merge_rollups(self.by_product, delta.by_product),
+            by_day=merge_rollups(self.by_day, delta.by_day),
+        )
+
+    @property
+    def nbytes(self) -> int:
+        frames = (self.by_region, self.by_category, self.by_subcategory, self.by_product, self.by_day)
+        return int(sum(frame.memory_usage(deep=True).sum() for frame in frames))
+
+
+def sales_frame(rollup: pd.DataFrame) -> pd.DataFrame:
+    """One row per group with the dimension columns and a ``Sales`` total, ready to plot.
+
+    Categorical levels become plain strings so Plotly Express does not expand
+    unobserved category combinations when it groups the frame itself.
+    """
+    frame = rollup["sum"].rename("Sales").reset_index()
+    for col in frame.columns:
+        if isinstance(frame[col].dtype, pd.CategoricalDtype):
+            frame[col] = frame[col].astype(str)
+    return frame
+
+
+def _finish(grouped: pd.DataFrame) -> pd.DataFrame:
+    # ``valid`` counts non-null Sales so ``mean`` matches Series.mean().
+    grouped = grouped.copy()
+    grouped["mean"] = grouped["sum"] / grouped["valid"].where(grouped["valid"] > 0)
+    return grouped[["sum", "count", "mean", "valid"]]
+
+
+def _roll_up(finer: pd.DataFrame, levels) -> pd.DataFrame:
+    grouped = finer[["sum", "count", "valid"]].groupby(level=levels, observed=True, sort=True).sum()
+    return _finish(grouped)
+
+
+def merge_rollups(base: pd.DataFrame, delta: pd.DataFrame) -> pd.DataFrame:
+    """Combine two rollups of the same dimensions; the work is proportional to their group counts."""
+    if delta.empty:
+        return base
+    combined = pd.concat([base[["sum", "count", "valid"]], delta[["sum", "count", "valid"]]])
+    return _roll_up(combined, list(range(combined.index.nlevels)))
+
+
+def _empty(names) -> pd.DataFrame:
+    index = pd.MultiIndex.from_arrays([[]] * len(names), names=names) if len(names) > 1 else pd.Index([], name=names[0])
+    return pd.DataFrame({"sum": [], "count": [], "mean": [], "valid": []}, index=index)
+
+
+def build_cube(df: pd.DataFrame, backend=None) -> RollupCube:
+    """Aggregate ``df`` once at every grain the pages display, on ``backend`` (default: configured one)."""
+    backend = backend or get_backend()
+    # Accumulate in float64 whatever the storage dtype of Sales is.
+    sales = df["Sales"].astype("float64")
+
+    if all(level in df.columns for level in PRODUCT_LEVELS):
+        by_product = _finish(backend.group_sales(df, PRODUCT_LEVELS))
+        by_subcategory = _roll_up(by_product, PRODUCT_LEVELS[:2])
+        by_category = _roll_up(by_subcategory, PRODUCT_LEVELS[:1])
+    else:
+        by_product = _empty(PRODUCT_LEVELS)
+        by_subcategory = _empty(PRODUCT_LEVELS[:2])
+        by_category = _finish(backend.group_sales(df, ["Category"])) if "Category" in df.columns else _empty(["Category"])
+
+    by_region = _finish(backend.group_sales(df, ["Region"])) if "Region" in df.columns else _empty(["Region"])
+
+    if "Order Date" in df.columns:
+        by_day = _finish(backend.daily_sales(df, "Order Date"))
+    else:
+        by_day = _empty(["Order Date"])
+
+    valid = int(sales.count())
+    total = pd.Series({
+        "sum": float(sales.sum()),
+        "count": len(df),
+        "mean": float(sales.sum()) / valid if valid else float("nan"),
+        "valid": valid,
+    })
+    return RollupCube(total=total, by_region=by_region, by_category=by_category,
+                      by_subcategory=by_subcategory, by_product=by_product, by_day=by_day)
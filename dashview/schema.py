@@ -0,0 +1,36 @@
+"""Declared column types for Superstore exports.
+
+Columns not listed here keep whatever ``read_csv`` infers, so uploads with
+extra or missing columns still load.
+"""
+import pandas as pd
+
+CATEGORICAL_COLUMNS = ("Region", "State", "Category", "Sub-Category", "Segment", "Ship Mode", "Country")
+FLOAT32_COLUMNS = ("Sales",)
+DATE_COLUMNS = ("Order Date",)
+
+# Superstore exports write day-first dates; the others are tried if most values fail to parse.
+DATE_FORMATS = ("%d/%m/%Y", "%m/%d/%Y", "%Y-%m-%d", "%d-%m-%Y", "%m-%d-%Y")
+
+
+def read_dtypes() -> dict:
+    """``dtype=`` mapping for ``read_csv``; dates are parsed separately with an explicit format."""
+    dtypes = {col: "category" for col in CATEGORICAL_COLUMNS}
+    dtypes.update({col: "float32" for col in FLOAT32_COLUMNS})
+    dtypes.update({col: "object" for col in DATE_COLUMNS})
+    return dtypes
+
+
+def pick_date_format(values: pd.Series):
+    """Return the format in ``DATE_FORMATS`` that parses the most of ``values``, or None."""
+    sample = values.dropna().head(1000)
+    if sample.empty:
+        return None
+    best, best_parsed = None, 0
+    for fmt in DATE_FORMATS:
+        parsed = pd.to_datetime(sample, format=fmt, errors="coerce").notna().sum()
+        if parsed > best_parsed:
+            best, best_parsed = fmt, parsed
+        if parsed == len(sample):
+            break
+    return best
@@ -0,0 +1,72 @@
+"""Substring search for the Data Table page.
+
+The searched columns have a few dozen distinct values over millions of rows,
+so a query is matched against the lowercased dictionary of each column and
+the hits are mapped back to rows through the group index.
+"""
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from dashview.index import GroupIndex
+
+SEARCH_COLUMNS = ("State", "Region")
+QUERY_CACHE_SIZE = 64
+
+
+class SearchIndex:
+    def __init__(self, index: GroupIndex, columns=SEARCH_COLUMNS, cache_size: int = QUERY_CACHE_SIZE):
+        self.index = index
+        self.columns = [col for col in columns if col in index.columns]
+        self.dictionaries = {col: [str(value).lower() for value in index.values(col)] for col in self.columns}
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def nbytes(self) -> int:
+        # The dictionaries are tiny; the cached row positions are what grows.
+        return sum(positions.nbytes for positions in list(self._cache.values()))
+
+    def matching_values(self, query: str) -> dict:
+        """Distinct values per column containing ``query``, case-insensitively."""
+        needle = query.lower()
+        return {
+            col: [value for value, lowered in zip(self.index.values(col), dictionary) if needle in lowered]
+            for col, dictionary in self.dictionaries.items()
+        }
+
+    def rows(self, query: str) -> np.ndarray:
+        """Sorted row positions matching ``query`` in any searched column."""
+        key = query.lower()
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
+
+        groups = [
+            self.index[col].rows(value)
+            for col, values in self.matching_values(query).items()
+            for value in values
+        ]
+        positions = np.unique(np.concatenate(groups)) if groups else np.empty(0, dtype=np.intp)
+
+        with self._lock:
+            self._cache[key] = positions
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return positions
+
+    def filter(self, query: str) -> pd.DataFrame:
+        if not query:
+            return self.index.df
+        return self.index.df.take(self.rows(query))
+
+    def head(self, query: str, n: int = 5) -> pd.DataFrame:
+        """First ``n`` matching rows without gathering the whole result."""
+        if not query:
+            return self.index.df.head(n)
+        return self.index.df.take(self.rows(query)[:n])
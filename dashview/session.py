@@ -0,0 +1,38 @@
+"""The session-state keys a loaded dataset exposes to the pages.
+
+``main.py`` hands an upload to ``receive_upload``, which loads it and
+publishes it through ``publish``; the benchmarks call the same functions
+to seed pages run headlessly.
+"""
+from contextlib import nullcontext
+
+from dashview import ingest, prefetch
+from dashview.store import DatasetHandle
+
+
+def publish(state, handle: DatasetHandle, upload_id=None) -> None:
+    """Store ``handle``'s dataset in ``state`` (e.g. ``st.session_state``) and start building its aggregates.
+
+    Pages read the aggregates from ``state["dataset"]`` once the background
+    prefetch has built them (see ``panels.wait_for``).
+    """
+    dataset = handle.dataset
+    # Shared read-only with every session that uploaded the same file.
+    state["upload_id"] = upload_id
+    state["dataset_handle"] = handle
+    state["dataset"] = dataset
+    state["df"] = dataset.df  # None for out-of-core datasets
+    prefetch.warm(dataset)
+
+
+def is_loaded(state, upload_id) -> bool:
+    return state.get("upload_id") == upload_id and "dataset" in state
+
+
+def receive_upload(state, data: bytes, upload_id, mode: str = "auto", on_progress=None, timer=None) -> None:
+    """``main.py``'s upload handler: load ``data`` through the shared store and publish it to ``state``."""
+    with timer.phase("parse") if timer is not None else nullcontext():
+        handle = ingest.load_dataset(data, on_progress=on_progress, mode=mode)
+    with timer.phase("aggregate") if timer is not None else nullcontext():
+        publish(state, handle, upload_id)
+    state["appended"] = []
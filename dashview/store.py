@@ -0,0 +1,123 @@
+"""Process-wide store of parsed datasets, shared by every browser session.
+
+Datasets are keyed by the content hash of the upload, so analysts uploading
+the same extract share one frame and one set of derived aggregates.  Each
+session holds a ``DatasetHandle``; the store counts live handles and only
+evicts datasets nobody references once the total footprint (frames plus
+whatever aggregates have been built) exceeds the memory budget.
+
+Shared frames are read-only by convention: pages must never assign into
+``st.session_state["df"]`` or anything derived from it.
+"""
+import os
+import threading
+import weakref
+from collections import Counter, OrderedDict
+
+from dashview.dataset import Dataset
+
+DEFAULT_BUDGET_BYTES = int(os.environ.get("DASHVIEW_STORE_MB", "2048")) * 1024 * 1024
+
+
+class DatasetHandle:
+    """A session's reference to a shared dataset; released when dropped or on ``release()``."""
+
+    def __init__(self, store: "DatasetStore", dataset: Dataset):
+        self.key = dataset.key
+        self.dataset = dataset
+        self._finalizer = weakref.finalize(self, store.release, dataset.key)
+
+    def release(self) -> None:
+        self._finalizer()
+
+    @property
+    def released(self) -> bool:
+        return not self._finalizer.alive
+
+
+class DatasetStore:
+    def __init__(self, budget_bytes: int = DEFAULT_BUDGET_BYTES):
+        self.budget_bytes = budget_bytes
+        self._entries: "OrderedDict[str, Dataset]" = OrderedDict()
+        self._refs = Counter()
+        # Re-entrant: a handle can be garbage-collected (and released) while this thread holds the lock.
+        self._lock = threading.RLock()
+        self._loading = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def acquire(self, key: str, load) -> DatasetHandle:
+        """Return a handle on dataset ``key``, calling ``load()`` to build it if it is not stored.
+
+        Concurrent sessions asking for the same missing key wait for a single load.
+        """
+        with self._lock:
+            key_lock = self._loading.setdefault(key, threading.Lock())
+
+        with key_lock:
+            try:
+                with self._lock:
+                    dataset = self._entries.get(key)
+                    if dataset is not None:
+                        self._entries.move_to_end(key)
+                        self.hits += 1
+                if dataset is None:
+                    dataset = load()
+                    with self._lock:
+                        self.misses += 1
+                        self._entries[key] = dataset
+                with self._lock:
+                    self._refs[key] += 1
+                    self._evict()
+            finally:
+                # Also on a failed load, so rejected uploads do not leave their lock behind.
+                with self._lock:
+                    self._loading.pop(key, None)
+        return DatasetHandle(self, dataset)
+
+    def release(self, key: str) -> None:
+        with self._lock:
+            self._refs[key] -= 1
+            if self._refs[key] <= 0:
+                del self._refs[key]
+            self._evict()
+
+    def _evict(self) -> None:
+        # Footprints grow as aggregates are built lazily, so they are re-measured on every check.
+        used = sum(dataset.footprint for dataset in self._entries.values())
+        for key in list(self._entries):
+            if used <= self.budget_bytes:
+                break
+            if self._refs[key] > 0:
+                continue
+            evicted = self._entries.pop(key)
+            used -= evicted.footprint
+            evicted.close()
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "datasets": len(self._entries),
+                "referenced": sum(1 for key in self._entries if self._refs[key] > 0),
+                "handles": sum(self._refs.values()),
+                "used_bytes": sum(dataset.footprint for dataset in self._entries.values()),
+                "budget_bytes": self.budget_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_store = DatasetStore()
+
+
+def get_store() -> DatasetStore:
+    return _store
@@ -0,0 +1,201 @@
+"""Page themes: the CSS every script used to inline, deduplicated.
+
+``BASE_CSS`` holds the rules all pages share; each theme adds its colours
+and any page-specific rules.  ``style_tag`` assembles and minifies a theme
+once per process, so a rerun only re-sends a compact cached string.
+"""
+import functools
+import re
+from dataclasses import dataclass
+
+BASE_CSS = """
+/* ✨ Section Heading */
+.section-title {
+    text-align: center;
+    font-size: 50px;
+    font-weight: bold;
+    text-shadow: 2px 2px 10px rgba(0, 0, 0, 0.7);
+    animation: fadeIn 2s ease-in-out;
+}
+
+/* 📜 Explanation Box */
+.explanation-box {
+    background: rgba(255, 255, 255, 0.2);
+    padding: 20px;
+    border-radius: 12px;
+    box-shadow: 0px 4px 10px rgba(0, 0, 0, 0.3);
+    font-size: 18px;
+    line-height: 1.6;
+    text-align: justify;
+    margin-top: 20px;
+}
+
+/* 📊 Chart & Table Containers */
+.chart-container, .table-container {
+    background: rgba(255, 255, 255, 0.1);
+    padding: 20px;
+    border-radius: 12px;
+    box-shadow: 0px 4px 10px rgba(0, 0, 0, 0.3);
+    transition: 0.3s;
+    text-align: center;
+}
+
+.chart-container:hover, .table-container:hover {
+    transform: scale(1.02);
+    background: rgba(255, 255, 255, 0.2);
+}
+
+/* 🔄 Fade-In Animation */
+@keyframes fadeIn {
+    0% { opacity: 0; transform: translateY(-20px); }
+    100% { opacity: 1; transform: translateY(0); }
+}
+"""
+
+
+@dataclass(frozen=True)
+class Theme:
+    background: str
+    color: str
+    title_color: str = "white"
+    extra_css: str = ""
+
+
+HOME_CSS = """
+/* 🌟 Smooth Background Animation */
+html, body, [data-testid="stAppViewContainer"] {
+    background-size: 300% 300%;
+    animation: gradientBG 8s ease infinite;
+}
+
+@keyframes gradientBG {
+    0% { background-position: 0% 50%; }
+    50% { background-position: 100% 50%; }
+    100% { background-position: 0% 50%; }
+}
+
+/* 🔹 MASSIVE Title Styling */
+.title {
+    text-align: center;
+    font-size: 200px; /* 9x the original size */
+    font-weight: bold;
+    color: white;
+    text-shadow: 5px 5px 25px rgba(0, 0, 0, 0.7);
+}
+
+/* ✨ Animated Heading Effect */
+@keyframes glow {
+    0% { text-shadow: 0 0 20px #fff, 0 0 40px #FFD700, 0 0 60px #FFD700; }
+    50% { text-shadow: 0 0 30px #fff, 0 0 50px #FFD700, 0 0 70px #FFD700; }
+    100% { text-shadow: 0 0 20px #fff, 0 0 40px #FFD700, 0 0 60px #FFD700; }
+}
+
+.glowing-text {
+    animation: glow 2s infinite alternate;
+}
+
+/* 📂 File Upload Box */
+div.stFileUploader {
+    border: 3px solid white;
+    padding: 15px;
+    border-radius: 15px;
+    background: rgba(255, 255, 255, 0.2);
+    box-shadow: 0px 4px 15px rgba(0, 0, 0, 0.3);
+}
+
+/* 🔘 Button Styling */
+div.stButton>button {
+    background: linear-gradient(to right, #ff416c, #ff4b2b);
+    color: white;
+    border-radius: 10px;
+    padding: 12px;
+    font-size: 18px;
+    font-weight: bold;
+    transition: 0.3s;
+}
+div.stButton>button:hover {
+    background: #ff4b2b;
+    transform: scale(1.08);
+    box-shadow: 0px 4px 15px rgba(255, 75, 43, 0.5);
+}
+
+/* 📊 Metric Box Styling */
+.metric-container {
+    background: rgba(255, 255, 255, 0.1);
+    padding: 15px;
+    border-radius: 12px;
+    text-align: center;
+    box-shadow: 0px 4px 10px rgba(0, 0, 0, 0.3);
+    font-size: 18px;
+    font-weight: bold;
+}
+"""
+
+REGION_CSS = """
+/* 🌟 Section Title with Icon */
+.section-title {
+    font-size: 60px;
+    text-shadow: 3px 3px 15px rgba(0, 0, 0, 0.7);
+}
+
+/* 💜 Explanation Box */
+.explanation-box {
+    padding: 25px;
+    border-radius: 15px;
+    box-shadow: 0px 5px 12px rgba(0, 0, 0, 0.3);
+    font-size: 20px;
+    line-height: 1.7;
+    color: black;
+}
+
+/* 🎡 Chart Container */
+.chart-container {
+    padding: 25px;
+    border-radius: 15px;
+    box-shadow: 0px 5px 12px rgba(0, 0, 0, 0.3);
+    font-size: 22px;
+    font-weight: bold;
+    color: black;
+}
+
+.chart-container:hover {
+    transform: scale(1.03);
+}
+
+/* 🌟 Big Icons */
+.icon {
+    font-size: 80px;
+    display: block;
+    text-align: center;
+    margin-bottom: 10px;
+}
+"""
+
+THEMES = {
+    "home": Theme("linear-gradient(45deg, #0f2027, #203a43, #2c5364, #FFD700)", "white", extra_css=HOME_CSS),
+    "insights": Theme("linear-gradient(135deg, #1a1a40, #4b0082)", "white", "#FFD700"),  # Dark Blue & Dark Purple
+    "region": Theme("linear-gradient(135deg, #880e4f, #f8bbd0)", "black", "#f8bbd0", REGION_CSS),  # Dark & Light Pink
+    "treemap": Theme("linear-gradient(135deg, #ffcc80, #ff9800)", "black", "#6d4c41"),
+    "timeseries": Theme("linear-gradient(135deg, #6a1b9a, #d50000)", "white", "#ffebee"),
+    "hierarchy": Theme("linear-gradient(135deg, #fdd835, #1976d2)", "white", "#fff9c4"),  # Lemon Yellow + Deep Blue
+    "table": Theme("linear-gradient(135deg, #66bb6a, #e91e63)", "white", "#ffffff"),  # Green & Pink
+}
+
+
+def minify(css: str) -> str:
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    return re.sub(r"\s*([{};:,>])\s*", r"\1", css).strip()
+
+
+@functools.lru_cache(maxsize=None)
+def style_tag(name: str) -> str:
+    """``<style>`` element for theme ``name``, built once per process."""
+    theme = THEMES[name]
+    css = (
+        f'html, body, [data-testid="stAppViewContainer"] {{ background: {theme.background}; color: {theme.color}; }}'
+        + BASE_CSS
+        + f".section-title {{ color: {theme.title_color}; }}"
+        + theme.extra_css
+    )
+    return f"<style>{minify(css)}</style>"
@@ -0,0 +1,54 @@
+"""Daily sales series with prefix sums for constant-time moving averages."""
+import threading
+
+import numpy as np
+import pandas as pd
+
+from dashview.rollups import RollupCube
+
+
+class DailySeries:
+    """Sales per order day, built once from the rollup cube's daily rollup.
+
+    ``cumsum[i]`` is the total of the first ``i`` days, so the mean of any
+    window is ``(cumsum[end] - cumsum[start]) / window`` whatever its width.
+    """
+
+    def __init__(self, by_day: pd.DataFrame):
+        self.dates = by_day.index
+        self.sales = by_day["sum"].to_numpy(dtype="float64")
+        self.cumsum = np.concatenate([[0.0], np.cumsum(self.sales)])
+        self._averages = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_cube(cls, cube: RollupCube) -> "DailySeries":
+        return cls(cube.by_day)
+
+    @property
+    def nbytes(self) -> int:
+        return self.sales.nbytes + self.cumsum.nbytes + sum(a.nbytes for a in list(self._averages.values()))
+
+    def __len__(self) -> int:
+        return len(self.sales)
+
+    def moving_average(self, window: int) -> np.ndarray:
+        """Trailing ``window``-day mean, NaN until a full window is available (as ``rolling().mean()``)."""
+        with self._lock:
+            cached = self._averages.get(window)
+        if cached is not None:
+            return cached
+
+        averages = np.full(len(self.sales), np.nan)
+        if window <= len(self.sales):
+            averages[window - 1:] = (self.cumsum[window:] - self.cumsum[:-window]) / window
+        with self._lock:
+            self._averages[window] = averages
+        return averages
+
+    def frame(self, window: int = None) -> pd.DataFrame:
+        """``Order Date``/``Sales`` frame, plus ``Moving Average`` when ``window`` is given."""
+        frame = pd.DataFrame({"Order Date": self.dates, "Sales": self.sales})
+        if window is not None:
+            frame["Moving Average"] = self.moving_average(window)
+        return frame
@@ -1,108 +1,75 @@
 import streamlit as st
-import pandas as pd
 
-# ✅ Set Page Config (This should always be first)
-st.set_page_config(page_title="Superstore Dashboard", page_icon="📊", layout="wide")
+from dashview import append, bootstrap, ingest, outofcore, session
+from dashview.panels import timing_panel
 
-# ✅ Apply Custom CSS for Styling
-st.markdown("""
-    <style>
-    /* 🌟 Professional Gradient Background with Yellow */
-    html, body, [data-testid="stAppViewContainer"] {
-        background: linear-gradient(45deg, #0f2027, #203a43, #2c5364, #FFD700);
-        background-size: 300% 300%;
-        animation: gradientBG 8s ease infinite;
-        color: white;
-    }
-
-    /* 🌟 Smooth Background Animation */
-    @keyframes gradientBG {
-        0% { background-position: 0% 50%; }
-        50% { background-position: 100% 50%; }
-        100% { background-position: 0% 50%; }
-    }
-
-    /* 🔹 MASSIVE Title Styling */
-    .title {
-        text-align: center;
-        font-size: 200px; /* 9x the original size */
-        font-weight: bold;
-        color: white;
-        text-shadow: 5px 5px 25px rgba(0, 0, 0, 0.7);
-    }
-
-    /* ✨ Animated Heading Effect */
-    @keyframes glow {
-        0% { text-shadow: 0 0 20px #fff, 0 0 40px #FFD700, 0 0 60px #FFD700; }
-        50% { text-shadow: 0 0 30px #fff, 0 0 50px #FFD700, 0 0 70px #FFD700; }
-        100% { text-shadow: 0 0 20px #fff, 0 0 40px #FFD700, 0 0 60px #FFD700; }
-    }
-
-    .glowing-text {
-        animation: glow 2s infinite alternate;
-    }
-
-    /* 📂 File Upload Box */
-    div.stFileUploader {
-        border: 3px solid white;
-        padding: 15px;
-        border-radius: 15px;
-        background: rgba(255, 255, 255, 0.2);
-        box-shadow: 0px 4px 15px rgba(0, 0, 0, 0.3);
-    }
-
-    /* 🔘 Button Styling */
-    div.stButton>button {
-        background: linear-gradient(to right, #ff416c, #ff4b2b);
-        color: white;
-        border-radius: 10px;
-        padding: 12px;
-        font-size: 18px;
-        font-weight: bold;
-        transition: 0.3s;
-    }
-    div.stButton>button:hover {
-        background: #ff4b2b;
-        transform: scale(1.08);
-        box-shadow: 0px 4px 15px rgba(255, 75, 43, 0.5);
-    }
-
-    /* 📊 Metric Box Styling */
-    .metric-container {
-        background: rgba(255, 255, 255, 0.1);
-        padding: 15px;
-        border-radius: 12px;
-        text-align: center;
-        box-shadow: 0px 4px 10px rgba(0, 0, 0, 0.3);
-        font-size: 18px;
-        font-weight: bold;
-    }
-
-    </style>
-""", unsafe_allow_html=True)
-
-# ✅ Title with Animation (MASSIVE SIZE)
-st.markdown('<p class="title glowing-text">🌟 Superstore Dashboard</p>', unsafe_allow_html=True)
+# ✅ Page Config, Theme & Title (shared bootstrap; chart libraries are imported on first use)
+timer = bootstrap.start("Home", page_title="Superstore Dashboard", page_icon="📊", theme="home",
+                        header='<p class="title glowing-text">🌟 Superstore Dashboard</p>')
 
 # ✅ File Upload Section
 st.markdown("### 📂 Upload Your Data File")
 uploaded_file = st.file_uploader("Upload a CSV file", type=["csv"])
 
-# ✅ Data Handling with Encoding Fix
-if uploaded_file:
-    try:
-        df = pd.read_csv(uploaded_file, encoding="utf-8")
-    except UnicodeDecodeError:
-        df = pd.read_csv(uploaded_file, encoding="ISO-8859-1")
-
-    df["Order Date"] = pd.to_datetime(df["Order Date"], errors='coerce')
+# ✅ Processing Mode (out-of-core keeps the data on disk as Parquet and queries it with DuckDB)
+mode = "auto"
+if outofcore.available():
+    mode = st.radio("Processing mode", ingest.MODES, horizontal=True,
+                    format_func={"auto": "Auto", "memory": "In memory", "out-of-core": "Out-of-core (on disk)"}.get)
 
-    # Store DataFrame in session state
-    st.session_state["df"] = df
+# ✅ Data Handling (parsed once per distinct file, reruns reuse the cached frame)
+if uploaded_file:
+    upload_id = (getattr(uploaded_file, "file_id", None) or (uploaded_file.name, uploaded_file.size), mode)
+    if not session.is_loaded(st.session_state, upload_id):
+        # Parse (shared store) and store the dataset and its aggregates in session state
+        progress = st.progress(0.0, text="⏳ Reading file...")
+        session.receive_upload(
+            st.session_state, uploaded_file.getvalue(), upload_id, mode,
+            on_progress=lambda done: progress.progress(done, text=f"⏳ Reading file... {done:.0%}"),
+            timer=timer,
+        )
+        progress.empty()
+
+    # ✅ Append a Delta (merged into the loaded aggregates instead of re-aggregating the history)
+    delta_file = st.file_uploader("➕ Append rows with the same columns (e.g. a daily delta)", type=["csv"], key="delta_upload")
+    if delta_file:
+        delta_id = getattr(delta_file, "file_id", None) or (delta_file.name, delta_file.size)
+        if delta_id not in st.session_state.get("appended", []):
+            try:
+                with timer.phase("append"):
+                    handle = append.append_dataset(st.session_state["dataset_handle"], delta_file.getvalue())
+            except append.SchemaMismatch as exc:
+                st.error(f"❌ {exc}")
+            else:
+                with timer.phase("aggregate"):
+                    session.publish(st.session_state, handle, upload_id)
+                st.session_state["appended"] = st.session_state.get("appended", []) + [delta_id]
+
+    dataset = st.session_state["dataset"]
+    timer.attach(dataset)
 
     # ✅ Display Success Message
     st.success("🎉 File uploaded successfully! Now, navigate to different pages to see the visualizations.")
+    if st.session_state.get("appended"):
+        st.caption(f"➕ {len(st.session_state['appended'])} appended file(s), {dataset.rows:,} rows in total")
+    if dataset.encoding is not None:
+        st.caption(f"🔤 Encoding: {dataset.encoding.describe()}")
+    if isinstance(dataset, outofcore.OutOfCoreDataset):
+        st.caption(f"💽 Out-of-core: {dataset.rows:,} rows kept on disk as Parquet, pages query them with DuckDB")
+
+    # ✅ Memory Footprint (as read_csv would infer it vs. after compaction)
+    if dataset.memory is not None:
+        before_mb = dataset.memory.before_bytes / 1024 ** 2
+        after_mb = dataset.memory.after_bytes / 1024 ** 2
+        col_before, col_after = st.columns(2)
+        col_before.metric("🧮 Memory Before", f"{before_mb:,.1f} MB")
+        col_after.metric("🗜 Memory After", f"{after_mb:,.1f} MB", delta=f"{after_mb - before_mb:,.1f} MB", delta_color="inverse")
+        with st.expander("Per-column memory"):
+            st.dataframe(dataset.memory.frame())
 
     # ✅ Display Data Preview
     st.markdown('<div class="metric-container">📊 <strong>Data Preview:</strong></div>', unsafe_allow_html=True)
-    st.dataframe(df.head(5))  # Show first 5 rows of the uploaded CSV file
+    st.dataframe(dataset.preview(5))  # Show first 5 rows of the uploaded CSV file
+
+# ✅ Timing Breakdown
+timing_panel(timer)
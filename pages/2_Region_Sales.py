@@ -1,96 +1,42 @@
 import streamlit as st
-import plotly.express as px
-import pandas as pd
-
-# ✅ Page Config
-st.set_page_config(page_title="Region-wise Sales", page_icon="📍", layout="wide")
-
-# ✅ Apply Custom CSS for Styling & Animation
-st.markdown("""
-    <style>
-    /* 🎀 Dual Pink Gradient Background */
-    html, body, [data-testid="stAppViewContainer"] {
-        background: linear-gradient(135deg, #880e4f, #f8bbd0); /* Dark Pink + Light Pink */
-        color: black; /* Changed text color to black */
-    }
-
-    /* 🌟 Section Title with Icon (Heading Color Kept) */
-    .section-title {
-        text-align: center;
-        font-size: 60px;
-        font-weight: bold;
-        color: #f8bbd0; /* Light Pink */
-        text-shadow: 3px 3px 15px rgba(0, 0, 0, 0.7);
-        animation: fadeIn 2s ease-in-out;
-    }
-
-    /* 💜 Explanation Box */
-    .explanation-box {
-        background: rgba(255, 255, 255, 0.2);
-        padding: 25px;
-        border-radius: 15px;
-        box-shadow: 0px 5px 12px rgba(0, 0, 0, 0.3);
-        font-size: 20px;
-        line-height: 1.7;
-        text-align: justify;
-        margin-top: 20px;
-        color: black; /* Changed text color to black */
-    }
-
-    /* 🎡 Chart Container */
-    .chart-container {
-        background: rgba(255, 255, 255, 0.1);
-        padding: 25px;
-        border-radius: 15px;
-        box-shadow: 0px 5px 12px rgba(0, 0, 0, 0.3);
-        transition: 0.3s;
-        text-align: center;
-        font-size: 22px;
-        font-weight: bold;
-        color: black; /* Changed text color to black */
-    }
-
-    .chart-container:hover {
-        transform: scale(1.03);
-        background: rgba(255, 255, 255, 0.2);
-    }
-
-    /* 🌟 Big Icons */
-    .icon {
-        font-size: 80px;
-        display: block;
-        text-align: center;
-        margin-bottom: 10px;
-    }
-
-    /* 🛠️ Fade-In Animation */
-    @keyframes fadeIn {
-        0% { opacity: 0; transform: translateY(-20px); }
-        100% { opacity: 1; transform: translateY(0); }
-    }
-    </style>
-""", unsafe_allow_html=True)
-
-# ✅ Title with Animation & Icon
-st.markdown('<p class="icon">📍</p>', unsafe_allow_html=True)
-st.markdown('<p class="section-title">Region-wise Sales</p>', unsafe_allow_html=True)
+
+from dashview import bootstrap, charts
+from dashview.lazy import lazy
+from dashview.panels import chart_debug_panel, filter_bar, timing_panel, wait_for
+from dashview.rollups import sales_frame
+
+px = lazy("plotly.express")
+
+# ✅ Page Config, Theme & Title (shared bootstrap; chart libraries are imported on first use)
+timer = bootstrap.start("Region Sales", page_title="Region-wise Sales", page_icon="📍", theme="region",
+                        header='<p class="icon">📍</p><p class="section-title">Region-wise Sales</p>')
+
+# ✅ Global Filters (shared by every page; filtered aggregates are built once)
+with timer.phase("filter"):
+    dataset = filter_bar(st.session_state)
 
 # ✅ Check if Data Exists
-if "df" in st.session_state:
-    df = st.session_state["df"]
+if dataset is not None and dataset.rows:
+    timer.attach(dataset)
+    with timer.phase("prefetch"):
+        wait_for(dataset, "cube", "index")  # usually built in the background right after upload
+    cube = dataset.cube
+    budget = charts.ChartBudget(timer=timer)
+    index = dataset.index
 
     # ✅ Display Data Insights with Icon
     st.markdown('<div class="chart-container"><p class="icon">📊</p><strong>Regional Sales Overview:</strong></div>', unsafe_allow_html=True)
 
     # ✅ Calculate Sales per Region
-    region_sales = df.groupby("Region", as_index=False)["Sales"].sum()
+    with timer.phase("aggregate"):
+        region_sales = sales_frame(cube.by_region)
 
     # ✅ Show Summary with Icons
     st.markdown('<p class="icon">💰</p>', unsafe_allow_html=True)
-    st.write(f"**Total Sales Across All Regions:** ${df['Sales'].sum():,.2f}")
+    st.write(f"**Total Sales Across All Regions:** ${cube.total['sum']:,.2f}")
 
     st.markdown('<p class="icon">🌍</p>', unsafe_allow_html=True)
-    st.write(f"**Number of Unique Regions:** {df['Region'].nunique()}")
+    st.write(f"**Number of Unique Regions:** {len(cube.by_region)}")
 
     # ✅ Explanation Box with Icon
     st.markdown('<div class="explanation-box">', unsafe_allow_html=True)
@@ -107,19 +53,21 @@ if "df" in st.session_state:
 
     # ✅ Pie Chart Visualization with Icon
     st.markdown('<div class="chart-container"><p class="icon">📊</p><strong>Sales Distribution by Region:</strong></div>', unsafe_allow_html=True)
-    fig_region = px.pie(region_sales, values="Sales", names="Region", hole=0.5, title="Sales Distribution by Region")
-    fig_region.update_traces(textinfo='percent+label')
+    fig_region = budget.build("Region pie", px.pie, region_sales, values="Sales", names="Region", hole=0.5,
+                              title="Sales Distribution by Region",
+                              style=lambda fig: fig.update_traces(textinfo='percent+label'),
+                              reduce=charts.top_k_reducer("Region", "Sales"))
     st.plotly_chart(fig_region, use_container_width=True)
 
     # ✅ Dropdown for Region-wise Statistics
-    selected_region = st.selectbox("Select a region for more details", df["Region"].unique())
+    selected_region = st.selectbox("Select a region for more details", index.values("Region"))
 
     # ✅ Display Stats for Selected Region with Icon
     if selected_region:
-        region_data = df[df["Region"] == selected_region]
-        total_region_sales = region_data["Sales"].sum()
-        total_orders = region_data.shape[0]
-        avg_sales = region_data["Sales"].mean()
+        region_stats = index.totals("Region", selected_region)
+        total_region_sales = region_stats["sum"]
+        total_orders = int(region_stats["count"])
+        avg_sales = region_stats["mean"]
 
         st.markdown('<div class="chart-container"><p class="icon">📍</p><strong>Regional Sales Statistics:</strong></div>', unsafe_allow_html=True)
         st.write(f"**Region:** {selected_region}")
@@ -127,5 +75,13 @@ if "df" in st.session_state:
         st.write(f"**Total Orders:** {total_orders}")
         st.write(f"**Average Sales per Order:** ${avg_sales:,.2f}")
 
+    chart_debug_panel(budget)
+
+elif dataset is not None:
+    st.warning("⚠ No rows match the global filters. Widen them in the sidebar.")
+
 else:
     st.warning("⚠ No data found! Please upload a CSV file on the previous page.")
+
+# ✅ Timing Breakdown
+timing_panel(timer)
@@ -1,71 +1,28 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
 
-# ✅ Page Config
-st.set_page_config(page_title="Sales Treemap", page_icon="📊", layout="wide")
+from dashview import bootstrap, charts
+from dashview.lazy import lazy
+from dashview.panels import chart_debug_panel, filter_bar, timing_panel, wait_for
+from dashview.rollups import sales_frame
 
-# ✅ Apply Custom CSS for Styling & Animation
-st.markdown("""
-    <style>
-    /* 🌟 Background Styling */
-    html, body, [data-testid="stAppViewContainer"] {
-        background: linear-gradient(135deg, #ffcc80, #ff9800);
-        color: black;
-    }
+px = lazy("plotly.express")
 
-    /* ✨ Section Heading */
-    .section-title {
-        text-align: center;
-        font-size: 50px;
-        font-weight: bold;
-        color: #6d4c41;
-        text-shadow: 2px 2px 10px rgba(0, 0, 0, 0.7);
-        animation: fadeIn 2s ease-in-out;
-    }
+# ✅ Page Config, Theme & Title (shared bootstrap; chart libraries are imported on first use)
+timer = bootstrap.start("Treemap", page_title="Sales Treemap", page_icon="📊", theme="treemap",
+                        header='<p class="section-title">📊 Sales Treemap & Insights</p>')
 
-    /* 📜 Explanation Box */
-    .explanation-box {
-        background: rgba(255, 255, 255, 0.2);
-        padding: 20px;
-        border-radius: 12px;
-        box-shadow: 0px 4px 10px rgba(0, 0, 0, 0.3);
-        font-size: 18px;
-        line-height: 1.6;
-        text-align: justify;
-        margin-top: 20px;
-    }
-
-    /* 📊 Chart Container */
-    .chart-container {
-        background: rgba(255, 255, 255, 0.1);
-        padding: 20px;
-        border-radius: 12px;
-        box-shadow: 0px 4px 10px rgba(0, 0, 0, 0.3);
-        transition: 0.3s;
-        text-align: center;
-    }
-
-    .chart-container:hover {
-        transform: scale(1.02);
-        background: rgba(255, 255, 255, 0.2);
-    }
-
-    /* 🔄 Fade-In Animation */
-    @keyframes fadeIn {
-        0% { opacity: 0; transform: translateY(-20px); }
-        100% { opacity: 1; transform: translateY(0); }
-    }
-
-    </style>
-""", unsafe_allow_html=True)
-
-# ✅ Title with Animation
-st.markdown('<p class="section-title">📊 Sales Treemap & Insights</p>', unsafe_allow_html=True)
+# ✅ Global Filters (shared by every page; filtered aggregates are built once)
+with timer.phase("filter"):
+    dataset = filter_bar(st.session_state)
 
 # ✅ Check if Data Exists
-if "df" in st.session_state:
-    df = st.session_state["df"]
+if dataset is not None and dataset.rows:
+    timer.attach(dataset)
+    with timer.phase("prefetch"):
+        wait_for(dataset, "cube", "index")  # usually built in the background right after upload
+    cube = dataset.cube
+    index = dataset.index
+    budget = charts.ChartBudget(timer=timer)
 
     # ✅ Explanation Box
     st.markdown('<div class="explanation-box">', unsafe_allow_html=True)
@@ -82,19 +39,22 @@ if "df" in st.session_state:
 
     # ✅ Treemap Chart
     st.markdown('<div class="chart-container"><strong>📊 Sales Treemap Visualization:</strong></div>', unsafe_allow_html=True)
-    fig_treemap = px.treemap(df, path=['Category', 'Sub-Category'], values='Sales', title='Sales Treemap', color='Sales',
-                             color_continuous_scale='sunsetdark')
+    # One row per Category/Sub-Category so Plotly does not aggregate row-level data itself
+    with timer.phase("aggregate"):
+        subcategory_sales = sales_frame(cube.by_subcategory)
+    fig_treemap = budget.build("Treemap", px.treemap, subcategory_sales, path=['Category', 'Sub-Category'], values='Sales',
+                               title='Sales Treemap', color='Sales', color_continuous_scale='sunsetdark')
     st.plotly_chart(fig_treemap, use_container_width=True)
 
     # ✅ Dropdown for Category-wise Analysis
-    selected_category = st.selectbox("Select a category for detailed insights", df["Category"].unique())
+    selected_category = st.selectbox("Select a category for detailed insights", index.values("Category"))
 
     # ✅ Display Stats for Selected Category
     if selected_category:
-        category_data = df[df["Category"] == selected_category]
-        total_category_sales = category_data["Sales"].sum()
-        total_category_orders = category_data.shape[0]
-        avg_category_sales = category_data["Sales"].mean()
+        category_stats = index.totals("Category", selected_category)
+        total_category_sales = category_stats["sum"]
+        total_category_orders = int(category_stats["count"])
+        avg_category_sales = category_stats["mean"]
 
         st.markdown('<div class="chart-container"><strong>📊 Category Sales Statistics:</strong></div>', unsafe_allow_html=True)
         st.write(f"**Category:** {selected_category}")
@@ -104,9 +64,20 @@ if "df" in st.session_state:
 
         # ✅ Sub-Category Sales Breakdown
         st.markdown('<div class="chart-container"><strong>📂 Sub-Category Sales Breakdown:</strong></div>', unsafe_allow_html=True)
-        fig_subcategory = px.bar(category_data, x="Sub-Category", y="Sales", text_auto=True, title=f"Sales Breakdown for {selected_category}",
-                                 color="Sales", color_continuous_scale="sunsetdark")
+        category_sales = subcategory_sales[subcategory_sales["Category"] == str(selected_category)]
+        fig_subcategory = budget.build("Sub-category bars", px.bar, category_sales, x="Sub-Category", y="Sales", text_auto=True,
+                                       title=f"Sales Breakdown for {selected_category}",
+                                       color="Sales", color_continuous_scale="sunsetdark",
+                                       reduce=charts.top_k_reducer("Sub-Category", "Sales"))
         st.plotly_chart(fig_subcategory, use_container_width=True)
 
+    chart_debug_panel(budget)
+
+elif dataset is not None:
+    st.warning("⚠ No rows match the global filters. Widen them in the sidebar.")
+
 else:
     st.warning("⚠ No data found! Please upload a CSV file on the home page first.")
+
+# ✅ Timing Breakdown
+timing_panel(timer)
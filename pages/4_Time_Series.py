@@ -1,77 +1,32 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
 
-# ✅ Page Config
-st.set_page_config(page_title="Time Series Sales Analysis", page_icon="📈", layout="wide")
+from dashview import bootstrap, charts
+from dashview.downsample import downsample
+from dashview.lazy import lazy
+from dashview.panels import chart_debug_panel, filter_bar, timing_panel, wait_for
+from dashview.rollups import GRANULARITIES, sales_frame
 
-# ✅ Apply Custom CSS for Styling & Animation
-st.markdown("""
-    <style>
-    /* 🌟 Background Styling */
-    html, body, [data-testid="stAppViewContainer"] {
-        background: linear-gradient(135deg, #6a1b9a, #d50000);
-        color: white;
-    }
+px = lazy("plotly.express")
 
-    /* ✨ Section Heading */
-    .section-title {
-        text-align: center;
-        font-size: 50px;
-        font-weight: bold;
-        color: #ffebee;
-        text-shadow: 2px 2px 10px rgba(0, 0, 0, 0.7);
-        animation: fadeIn 2s ease-in-out;
-    }
+# ✅ Page Config, Theme & Title (shared bootstrap; chart libraries are imported on first use)
+timer = bootstrap.start("Time Series", page_title="Time Series Sales Analysis", page_icon="📈", theme="timeseries",
+                        header='<p class="section-title">📈 Time Series Sales Analysis</p>')
 
-    /* 📜 Explanation Box */
-    .explanation-box {
-        background: rgba(255, 255, 255, 0.2);
-        padding: 20px;
-        border-radius: 12px;
-        box-shadow: 0px 4px 10px rgba(0, 0, 0, 0.3);
-        font-size: 18px;
-        line-height: 1.6;
-        text-align: justify;
-        margin-top: 20px;
-    }
-
-    /* 📊 Chart Container */
-    .chart-container {
-        background: rgba(255, 255, 255, 0.1);
-        padding: 20px;
-        border-radius: 12px;
-        box-shadow: 0px 4px 10px rgba(0, 0, 0, 0.3);
-        transition: 0.3s;
-        text-align: center;
-    }
-
-    .chart-container:hover {
-        transform: scale(1.02);
-        background: rgba(255, 255, 255, 0.2);
-    }
-
-    /* 🔄 Fade-In Animation */
-    @keyframes fadeIn {
-        0% { opacity: 0; transform: translateY(-20px); }
-        100% { opacity: 1; transform: translateY(0); }
-    }
-
-    </style>
-""", unsafe_allow_html=True)
-
-# ✅ Title with Animation
-st.markdown('<p class="section-title">📈 Time Series Sales Analysis</p>', unsafe_allow_html=True)
+# ✅ Global Filters (shared by every page; filtered aggregates are built once)
+with timer.phase("filter"):
+    dataset = filter_bar(st.session_state)
 
 # ✅ Check if Data Exists
-if "df" in st.session_state:
-    df = st.session_state["df"]
+if dataset is not None and dataset.rows:
+    timer.attach(dataset)
+    with timer.phase("prefetch"):
+        wait_for(dataset, "cube", "timeseries")  # usually built in the background right after upload
+    cube = dataset.cube
+    daily_sales = dataset.timeseries
+    budget = charts.ChartBudget(timer=timer)
 
-    # ✅ Convert 'Order Date' to datetime if not already
-    df["Order Date"] = pd.to_datetime(df["Order Date"])
-
-    # ✅ Aggregate Sales Over Time
-    time_series_data = df.groupby("Order Date")["Sales"].sum().reset_index()
+    # ✅ Chart Point Budget (sales per day were aggregated once at upload)
+    max_points = 1500  # roughly one point per horizontal pixel of a wide chart
 
     # ✅ Explanation Box
     st.markdown('<div class="explanation-box">', unsafe_allow_html=True)
@@ -88,26 +43,40 @@ if "df" in st.session_state:
 
     # ✅ Time Series Sales Chart
     st.markdown('<div class="chart-container"><strong>📊 Sales Trend Over Time:</strong></div>', unsafe_allow_html=True)
-    fig_time_series = px.line(time_series_data, x="Order Date", y="Sales", title="Sales Trend Over Time",
-                              color_discrete_sequence=["#ff1744"])
-    fig_time_series.update_traces(mode='lines+markers', marker=dict(size=5))
+    granularity = st.radio("Granularity", list(GRANULARITIES), horizontal=True)
+    with timer.phase("aggregate"):
+        trend_data = downsample(sales_frame(cube.by_period(granularity)), "Order Date", "Sales", max_points)
+    fig_time_series = budget.build("Sales trend", px.line, trend_data, x="Order Date", y="Sales",
+                                   title=f"Sales Trend Over Time ({granularity})", color_discrete_sequence=["#ff1744"],
+                                   style=lambda fig: fig.update_traces(mode='lines+markers', marker=dict(size=5)),
+                                   reduce=charts.downsample_reducer("Order Date", "Sales"))
 
     st.plotly_chart(fig_time_series, use_container_width=True)
 
     # ✅ Moving Average Selection
     moving_avg_window = st.slider("Select Moving Average Window (Days)", min_value=7, max_value=90, step=7, value=30)
     
-    # ✅ Calculate & Plot Moving Average
-    time_series_data["Moving Average"] = time_series_data["Sales"].rolling(window=moving_avg_window).mean()
+    # ✅ Moving Average from the precomputed prefix sums
+    with timer.phase("aggregate"):
+        time_series_data = daily_sales.frame(moving_avg_window)
+        moving_avg_data = downsample(time_series_data, "Order Date", "Sales", max_points)
 
     st.markdown('<div class="chart-container"><strong>📈 Sales Moving Average Analysis:</strong></div>', unsafe_allow_html=True)
-    fig_moving_avg = px.line(time_series_data, x="Order Date", y=["Sales", "Moving Average"], 
-                             title=f"Sales vs {moving_avg_window}-Day Moving Average", 
-                             labels={"value": "Sales"},
-                             color_discrete_map={"Sales": "#ff1744", "Moving Average": "#651fff"})
-
-    fig_moving_avg.update_traces(mode='lines', line=dict(width=2))
+    fig_moving_avg = budget.build("Moving average", px.line, moving_avg_data, x="Order Date", y=["Sales", "Moving Average"],
+                                  title=f"Sales vs {moving_avg_window}-Day Moving Average",
+                                  labels={"value": "Sales"},
+                                  color_discrete_map={"Sales": "#ff1744", "Moving Average": "#651fff"},
+                                  style=lambda fig: fig.update_traces(mode='lines', line=dict(width=2)),
+                                  reduce=charts.downsample_reducer("Order Date", "Sales"))
     st.plotly_chart(fig_moving_avg, use_container_width=True)
 
+    chart_debug_panel(budget)
+
+elif dataset is not None:
+    st.warning("⚠ No rows match the global filters. Widen them in the sidebar.")
+
 else:
     st.warning("⚠ No data found! Please upload a CSV file on the home page first.")
+
+# ✅ Timing Breakdown
+timing_panel(timer)
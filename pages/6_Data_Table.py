@@ -1,71 +1,25 @@
 import streamlit as st
-import plotly.figure_factory as ff
-import pandas as pd
 
-# ✅ Page Config
-st.set_page_config(page_title="Sales Data Table", page_icon="📋", layout="wide")
+from dashview import bootstrap, export
+from dashview.lazy import lazy
+from dashview.panels import filter_bar, timing_panel, wait_for
 
-# ✅ Apply Custom CSS for Styling & Animation
-st.markdown("""
-    <style>
-    /* 🌟 Background Styling */
-    html, body, [data-testid="stAppViewContainer"] {
-        background: linear-gradient(135deg, #66bb6a, #e91e63); /* Green & Pink */
-        color: white;
-    }
+ff = lazy("plotly.figure_factory")
 
-    /* ✨ Section Heading */
-    .section-title {
-        text-align: center;
-        font-size: 50px;
-        font-weight: bold;
-        color: #ffffff;
-        text-shadow: 2px 2px 10px rgba(0, 0, 0, 0.7);
-        animation: fadeIn 2s ease-in-out;
-    }
+# ✅ Page Config, Theme & Title (shared bootstrap; chart libraries are imported on first use)
+timer = bootstrap.start("Data Table", page_title="Sales Data Table", page_icon="📋", theme="table",
+                        header='<p class="section-title">📋 Sales Data Table</p>')
 
-    /* 📜 Explanation Box */
-    .explanation-box {
-        background: rgba(255, 255, 255, 0.2);
-        padding: 20px;
-        border-radius: 12px;
-        box-shadow: 0px 4px 10px rgba(0, 0, 0, 0.3);
-        font-size: 18px;
-        line-height: 1.6;
-        text-align: justify;
-        margin-top: 20px;
-    }
-
-    /* 📊 Table Container */
-    .table-container {
-        background: rgba(255, 255, 255, 0.1);
-        padding: 20px;
-        border-radius: 12px;
-        box-shadow: 0px 4px 10px rgba(0, 0, 0, 0.3);
-        transition: 0.3s;
-        text-align: center;
-    }
-
-    .table-container:hover {
-        transform: scale(1.02);
-        background: rgba(255, 255, 255, 0.2);
-    }
-
-    /* 🔄 Fade-In Animation */
-    @keyframes fadeIn {
-        0% { opacity: 0; transform: translateY(-20px); }
-        100% { opacity: 1; transform: translateY(0); }
-    }
-
-    </style>
-""", unsafe_allow_html=True)
-
-# ✅ Title with Animation
-st.markdown('<p class="section-title">📋 Sales Data Table</p>', unsafe_allow_html=True)
+# ✅ Global Filters (shared by every page; filtered aggregates are built once)
+with timer.phase("filter"):
+    dataset = filter_bar(st.session_state)
 
 # ✅ Check if Data Exists
-if "df" in st.session_state and not st.session_state["df"].empty:
-    df = st.session_state["df"]
+if dataset is not None and dataset.rows:
+    timer.attach(dataset)
+    with timer.phase("prefetch"):
+        wait_for(dataset, "search")  # usually built in the background right after upload
+    search = dataset.search
 
     # ✅ Explanation Box
     st.markdown('<div class="explanation-box">', unsafe_allow_html=True)
@@ -84,20 +38,31 @@ if "df" in st.session_state and not st.session_state["df"].empty:
     
     # ✅ Filter Option - Search Data
     search_query = st.text_input("🔍 Search by State or Region", "")
-    if search_query:
-        filtered_df = df[df["State"].str.contains(search_query, case=False, na=False) | 
-                         df["Region"].str.contains(search_query, case=False, na=False)]
-    else:
-        filtered_df = df
 
     # ✅ Display the First Few Rows in a Styled Table
-    fig_table = ff.create_table(filtered_df[['Order Date', 'Sales', 'Region', 'State', 'Category']].head(), 
+    with timer.phase("search"):
+        preview = search.head(search_query)[['Order Date', 'Sales', 'Region', 'State', 'Category']]
+    fig_table = ff.create_table(preview, 
                                 colorscale="greens_r")  # Green Theme
     st.plotly_chart(fig_table)
 
-    # ✅ Download Data Button
-    csv = filtered_df.to_csv(index=False).encode("utf-8")
-    st.download_button(label="💾 Download Data as CSV", data=csv, file_name="sales_data.csv", mime="text/csv")
+    # ✅ Download Data Button (built only when requested, then served from cache)
+    export_format = st.selectbox("💾 Download format", export.available_formats(), format_func=lambda fmt: fmt.label)
+    payload = export.cached_export(dataset.key, search_query, export_format)
+    if payload is None and st.button("📦 Prepare download"):
+        with st.spinner("Preparing file..."):
+            with timer.phase("export"):
+                payload = export.export(dataset, search_query, export_format)
+
+    if payload is not None:
+        st.download_button(label=f"💾 Download Data as {export_format.label}", data=payload,
+                           file_name=f"sales_data.{export_format.extension}", mime=export_format.mime)
+
+elif dataset is not None:
+    st.warning("⚠ No rows match the global filters. Widen them in the sidebar.")
 
 else:
     st.warning("⚠ No data found! Please upload a CSV file on the home page first.")
+
+# ✅ Timing Breakdown
+timing_panel(timer)
@@ -0,0 +1,21 @@
+import os
+
+import pytest
+
+from bench.generate import generate
+
+
+@pytest.fixture(scope="session")
+def superstore_csv(tmp_path_factory) -> bytes:
+    """A small deterministic Superstore export (``bench.generate``), as uploaded bytes."""
+    path = generate(os.path.join(tmp_path_factory.mktemp("data"), "superstore.csv"), rows=3000, seed=7)
+    with open(path, "rb") as handle:
+        return handle.read()
+
+
+@pytest.fixture(scope="session")
+def superstore(superstore_csv):
+    """The parsed, compacted frame of ``superstore_csv``."""
+    from dashview.ingest import parse_dataset
+
+    return parse_dataset(superstore_csv, "superstore").df
@@ -0,0 +1,106 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from dashview.append import SchemaMismatch, _append_frame, coerce, validate
+from dashview.index import build_column_index
+from dashview.ingest import parse_csv
+from dashview.rollups import build_cube
+
+
+def _split(frame: pd.DataFrame, at: int):
+    base = frame.iloc[:at].reset_index(drop=True)
+    delta = frame.iloc[at:].reset_index(drop=True)
+    for col in base.columns:
+        if isinstance(base[col].dtype, pd.CategoricalDtype):
+            # As if each file had been parsed on its own: categories only from its own rows.
+            base[col] = base[col].cat.remove_unused_categories()
+            delta[col] = delta[col].cat.remove_unused_categories()
+    return base, delta
+
+
+def _assert_same_rollup(merged: pd.DataFrame, rebuilt: pd.DataFrame):
+    def normal(frame):
+        frame = frame.reset_index()
+        keys = [col for col in frame.columns if col not in ("sum", "count", "mean", "valid")]
+        frame[keys] = frame[keys].astype(str)
+        return frame.sort_values(keys).reset_index(drop=True)
+    pd.testing.assert_frame_equal(normal(merged), normal(rebuilt), check_dtype=False, rtol=1e-6)
+
+
+def test_merged_column_index_equals_a_rebuild():
+    base = pd.DataFrame({"Region": pd.Categorical(["a", "b", "a", None]), "Sales": [1.0, 2.0, np.nan, 4.0]})
+    delta = pd.DataFrame({"Region": pd.Categorical(["c", "a", "c"]), "Sales": [5.0, 6.0, 7.0]})
+    full = _append_frame(base, delta)
+
+    merged = build_column_index(base["Region"], base["Sales"]).merged(
+        build_column_index(delta["Region"], delta["Sales"]), len(base))
+    rebuilt = build_column_index(full["Region"], full["Sales"])
+
+    assert list(merged.values) == list(rebuilt.values) == ["a", "b", "c"]
+    for name in ("codes", "offsets", "positions", "sales_sum", "sales_count", "sales_valid"):
+        np.testing.assert_array_equal(getattr(merged, name), getattr(rebuilt, name), err_msg=name)
+
+
+@pytest.mark.parametrize("column", ["Region", "State", "Sub-Category"])
+def test_merged_column_index_equals_a_rebuild_on_superstore(superstore, column):
+    base, delta = _split(superstore, 2000)
+    full = _append_frame(base, delta)
+    merged = build_column_index(base[column], base["Sales"]).merged(
+        build_column_index(delta[column], delta["Sales"]), len(base))
+    rebuilt = build_column_index(full[column], full["Sales"])
+
+    assert list(merged.values) == list(rebuilt.values)
+    for name in ("codes", "offsets", "positions", "sales_count", "sales_valid"):
+        np.testing.assert_array_equal(getattr(merged, name), getattr(rebuilt, name), err_msg=name)
+    np.testing.assert_allclose(merged.sales_sum, rebuilt.sales_sum, rtol=1e-9)
+
+
+def test_merged_cube_equals_a_rebuild(superstore):
+    base, delta = _split(superstore, 2000)
+    merged = build_cube(base).merged(build_cube(delta))
+    rebuilt = build_cube(_append_frame(base, delta))
+
+    for name in ("by_region", "by_category", "by_subcategory", "by_product", "by_day"):
+        _assert_same_rollup(getattr(merged, name), getattr(rebuilt, name))
+    pd.testing.assert_series_equal(merged.total[["sum", "count", "valid"]].astype("float64"),
+                                   rebuilt.total[["sum", "count", "valid"]].astype("float64"), rtol=1e-6)
+
+
+def test_appended_frame_keeps_the_base_rows_first(superstore):
+    base, delta = _split(superstore, 2000)
+    full = _append_frame(base, delta)
+    assert len(full) == len(superstore)
+    pd.testing.assert_frame_equal(full.iloc[:len(base)].astype(str), base.astype(str))
+
+
+def test_delta_dates_use_the_base_format():
+    data = b"Order Date,Sales\n03/05/2018,1.0\n"
+    assert parse_csv(data)["Order Date"][0] == pd.Timestamp("2018-05-03")  # day-first on its own
+
+    formats = {"Order Date": "%m/%d/%Y"}
+    assert parse_csv(data, date_formats=formats)["Order Date"][0] == pd.Timestamp("2018-03-05")
+
+
+def test_parse_csv_records_the_date_format_it_picked():
+    formats = {}
+    parse_csv(b"Order Date,Sales\n2018-03-25,1.0\n", date_formats=formats)
+    assert formats == {"Order Date": "%Y-%m-%d"}
+
+
+def test_coerce_parses_text_the_base_holds_as_dates():
+    delta = pd.DataFrame({"Ship Date": ["03/05/2018", None], "Sales": [1.0, 2.0]})
+    kinds = {"Ship Date": "datetime", "Sales": "numeric"}
+    coerced = validate(kinds, coerce(kinds, {"Ship Date": "%m/%d/%Y"}, delta))
+    assert coerced["Ship Date"][0] == pd.Timestamp("2018-03-05")
+    assert pd.isna(coerced["Ship Date"][1])
+
+
+def test_validate_rejects_a_mismatched_delta():
+    kinds = {"Region": "categorical", "Sales": "numeric"}
+    with pytest.raises(SchemaMismatch, match="missing columns"):
+        validate(kinds, pd.DataFrame({"Region": ["West"]}))
+    with pytest.raises(SchemaMismatch, match="Sales"):
+        validate(kinds, pd.DataFrame({"Region": ["West"], "Sales": ["lots"]}))
+    with pytest.raises(SchemaMismatch, match="Ship Date"):
+        validate({"Ship Date": "datetime"}, coerce({"Ship Date": "datetime"}, {}, pd.DataFrame({"Ship Date": ["soon"]})))
@@ -0,0 +1,52 @@
+import pandas as pd
+import pytest
+
+from dashview.backend import PandasBackend, get_backend
+
+pytest.importorskip("polars")
+
+
+@pytest.fixture(scope="module")
+def backends():
+    polars = get_backend("polars")
+    assert polars.name == "polars"
+    return PandasBackend(), polars
+
+
+def _keyed(frame: pd.DataFrame) -> pd.DataFrame:
+    frame = frame.reset_index()
+    keys = [col for col in frame.columns if col not in ("sum", "count", "valid")]
+    frame[keys] = frame[keys].astype(str)
+    return frame
+
+
+@pytest.mark.parametrize("keys", [["Region"], ["State"], ["Category", "Sub-Category", "Product Name"]])
+def test_group_sales_matches_pandas(superstore, backends, keys):
+    pandas, polars = backends
+    expected, actual = pandas.group_sales(superstore, keys), polars.group_sales(superstore, keys)
+    assert list(actual.columns) == ["sum", "count", "valid"]
+    pd.testing.assert_frame_equal(_keyed(actual), _keyed(expected), check_dtype=False, rtol=1e-6)
+
+
+def test_daily_sales_matches_pandas(superstore, backends):
+    pandas, polars = backends
+    expected, actual = pandas.daily_sales(superstore), polars.daily_sales(superstore)
+    pd.testing.assert_frame_equal(actual, expected, check_dtype=False, check_index_type=False, rtol=1e-6)
+
+
+@pytest.mark.parametrize("column", ["Region", "Segment", "City", "Sales"])
+def test_value_counts_match_pandas_including_order(superstore, backends, column):
+    pandas, polars = backends
+    expected, actual = pandas.value_counts(superstore[column]), polars.value_counts(superstore[column])
+    assert list(map(str, actual.index)) == list(map(str, expected.index))
+    assert list(actual) == list(expected)
+
+
+def test_missing_keys_and_values(backends):
+    pandas, polars = backends
+    frame = pd.DataFrame({"Region": ["West", None, "East", "West"], "Sales": [1.0, 2.0, None, 4.0]})
+    for backend in (pandas, polars):
+        grouped = backend.group_sales(frame, ["Region"])
+        assert grouped.loc["West"].tolist() == [5.0, 2, 2]
+        assert grouped.loc["East"].tolist() == [0.0, 1, 0]
+        assert "None" not in map(str, grouped.index)
@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from dashview.downsample import downsample, lttb, min_max
+
+
+@pytest.fixture
+def series():
+    x = pd.date_range("2015-01-01", periods=5_000, freq="D")
+    y = np.sin(np.arange(5_000) / 50) + np.random.default_rng(1).normal(0, 0.1, 5_000)
+    y[2_345] = 25.0  # a spike a good reduction must not lose
+    return x, y
+
+
+@pytest.mark.parametrize("method", [lttb, min_max])
+@pytest.mark.parametrize("threshold", [4, 10, 333, 1_500])
+def test_keeps_endpoints_and_stays_within_the_threshold(series, method, threshold):
+    x, y = series
+    positions = method(x, y, threshold)
+    assert len(positions) <= threshold
+    assert positions[0] == 0 and positions[-1] == len(x) - 1
+    assert np.all(np.diff(positions) > 0)
+
+
+@pytest.mark.parametrize("method", [lttb, min_max])
+def test_keeps_a_spike(series, method):
+    x, y = series
+    assert 2_345 in method(x, y, 200)
+
+
+@pytest.mark.parametrize("method", [lttb, min_max])
+def test_short_series_are_left_alone(method):
+    x, y = np.arange(10), np.arange(10.0)
+    np.testing.assert_array_equal(method(x, y, 50), np.arange(10))
+
+
+def test_downsample_returns_rows_of_the_frame(series):
+    x, y = series
+    frame = pd.DataFrame({"day": x, "sales": y})
+    thinned = downsample(frame, "day", "sales", 100, method="minmax")
+    assert len(thinned) <= 100
+    pd.testing.assert_frame_equal(thinned, frame.loc[thinned.index])
+    assert downsample(frame, "day", "sales", 10_000) is frame
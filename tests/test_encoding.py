@@ -0,0 +1,49 @@
+import codecs
+
+import pandas as pd
+
+from dashview.encoding import FALLBACK_ERRORS, SNIFF_BYTES, sniff_encoding
+from dashview.ingest import parse_csv
+
+
+def _csv(rows: int, city: str = "Seattle") -> bytes:
+    header = "Region,City,Sales\n"
+    return (header + "".join(f"West,{city},{i}.5\n" for i in range(rows))).encode("utf-8")
+
+
+def test_utf8_prefix_decodes_with_the_latin1_fallback():
+    report = sniff_encoding(_csv(10))
+    assert (report.encoding, report.errors) == ("utf-8", FALLBACK_ERRORS)
+
+
+def test_non_utf8_byte_past_the_prefix_is_decoded_as_latin1():
+    data = _csv(SNIFF_BYTES // 10) + "West,Montréal,1.0\n".encode("latin-1")
+    assert data.find(b"\xe9") > SNIFF_BYTES
+    report = sniff_encoding(data)
+    assert report.encoding == "utf-8"
+
+    frame = parse_csv(data, report)
+    assert frame["City"].iloc[-1] == "Montréal"
+
+
+def test_a_character_split_at_the_prefix_boundary_is_not_an_error():
+    data = _csv(SNIFF_BYTES // 10)
+    cut = SNIFF_BYTES - 1
+    # Put a two-byte UTF-8 character so its first byte is the prefix's last byte.
+    data = data[:cut] + "é".encode("utf-8") + data[cut:]
+    report = sniff_encoding(data)
+    assert (report.encoding, report.errors) == ("utf-8", FALLBACK_ERRORS)
+    assert data.decode(report.encoding, errors=report.errors).count("é") == 1
+
+
+def test_latin1_in_the_prefix_switches_to_iso_8859_1():
+    data = "Region,City,Sales\nWest,Montréal,1.0\n".encode("latin-1")
+    report = sniff_encoding(data)
+    assert (report.encoding, report.errors) == ("ISO-8859-1", "strict")
+    assert parse_csv(data, report)["City"][0] == "Montréal"
+
+
+def test_a_bom_decides_the_encoding():
+    assert sniff_encoding(codecs.BOM_UTF8 + _csv(2)).encoding == "utf-8-sig"
+    assert sniff_encoding("Region\nWest\n".encode("utf-16")).encoding == "utf-16"
+    assert isinstance(parse_csv(codecs.BOM_UTF8 + _csv(2)), pd.DataFrame)
@@ -0,0 +1,35 @@
+import copy
+import gzip
+import io
+
+import pandas as pd
+import pytest
+
+from dashview import export
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame({"Region": ["West", "East", "South"], "Sales": [261.96, 731.94, 14.62]})
+
+
+@pytest.mark.parametrize("fmt", export.available_formats(), ids=lambda fmt: fmt.extension)
+def test_render_accepts_a_copied_format(frame, fmt):
+    # st.selectbox hands back a deepcopy of the chosen option, never the module constant itself.
+    selected = copy.deepcopy(fmt)
+    assert selected is not fmt
+
+    payload = export.render(frame, selected)
+
+    assert payload == export.render(frame, fmt)
+    if fmt == export.PARQUET:
+        restored = pd.read_parquet(io.BytesIO(payload))
+    else:
+        raw = gzip.decompress(payload) if fmt == export.CSV_GZIP else payload
+        restored = pd.read_csv(io.BytesIO(raw))
+    pd.testing.assert_frame_equal(restored, frame, check_dtype=False)
+
+
+def test_render_rejects_an_unknown_format(frame):
+    with pytest.raises(ValueError, match="Unknown export format"):
+        export.render(frame, export.ExportFormat("Excel", "xlsx", "application/vnd.ms-excel"))
@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from dashview.index import INDEXED_COLUMNS, GroupIndex, build_column_index
+
+
+@pytest.mark.parametrize("column", INDEXED_COLUMNS)
+def test_rows_are_the_positions_holding_each_value(superstore, column):
+    index = build_column_index(superstore[column], superstore["Sales"])
+    for value in index.values:
+        expected = np.flatnonzero((superstore[column] == value).to_numpy())
+        np.testing.assert_array_equal(np.sort(index.rows(value)), expected)
+
+
+def test_totals_match_a_groupby(superstore):
+    index = GroupIndex(superstore)
+    expected = superstore.groupby("Region", observed=True)["Sales"].agg(["sum", "size", "mean"])
+    for region, row in expected.iterrows():
+        totals = index.totals("Region", region)
+        assert totals["sum"] == pytest.approx(row["sum"], rel=1e-5)
+        assert totals["count"] == row["size"]
+        assert totals["mean"] == pytest.approx(row["mean"], rel=1e-5)
+
+
+def test_missing_values_belong_to_no_group():
+    column = pd.Series(["a", None, "b", "a"])
+    index = build_column_index(column, pd.Series([1.0, 2.0, np.nan, 4.0]))
+    assert list(index.rows("a")) == [0, 3]
+    assert list(index.rows("b")) == [2]
+    assert len(index.rows("missing")) == 0
+    totals = index.totals("b")
+    assert (totals["sum"], totals["count"]) == (0.0, 1)
+    assert np.isnan(totals["mean"])
@@ -0,0 +1,78 @@
+import os
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("duckdb")
+
+from dashview import outofcore  # noqa: E402
+from dashview.ingest import parse_dataset  # noqa: E402
+
+
+def _normal(frame: pd.DataFrame) -> pd.DataFrame:
+    frame = frame.reset_index()
+    keys = [col for col in frame.columns if col not in ("sum", "count", "mean", "valid")]
+    frame[keys] = frame[keys].astype(str)
+    return frame.sort_values(keys).reset_index(drop=True)
+
+
+@pytest.fixture(scope="module")
+def datasets(superstore_csv, tmp_path_factory):
+    spill_dir = str(tmp_path_factory.mktemp("spill"))
+    return parse_dataset(superstore_csv, "memory"), outofcore.spill(superstore_csv, "ooc", spill_dir=spill_dir)
+
+
+@pytest.mark.parametrize("name", ["by_region", "by_category", "by_subcategory", "by_product", "by_day"])
+def test_rollups_match_the_in_memory_backend(datasets, name):
+    memory, spilled = datasets
+    pd.testing.assert_frame_equal(_normal(getattr(spilled.cube, name)), _normal(getattr(memory.cube, name)),
+                                  check_dtype=False, rtol=1e-5)
+
+
+def test_totals_and_counts_match_the_in_memory_backend(datasets):
+    memory, spilled = datasets
+    assert spilled.rows == memory.rows
+    assert spilled.columns == memory.columns
+    assert spilled.cube.total["sum"] == pytest.approx(memory.cube.total["sum"], rel=1e-5)
+    for region in memory.index.values("Region"):
+        expected, actual = memory.index.totals("Region", region), spilled.index.totals("Region", str(region))
+        assert actual["count"] == expected["count"]
+        assert actual["sum"] == pytest.approx(expected["sum"], rel=1e-5)
+
+    for column in ("Region", "Segment", "Ship Mode"):
+        expected, actual = memory.value_counts(column), spilled.value_counts(column)
+        assert list(map(str, actual.index)) == list(map(str, expected.index))
+        assert list(actual) == list(expected)
+
+
+def test_search_matches_the_in_memory_backend(datasets):
+    memory, spilled = datasets
+    for query in ("cal", "west", "tex", ""):
+        expected = memory.search.filter(query)
+        assert len(spilled.search.filter(query)) == len(expected)
+
+
+def test_preview_is_the_first_rows_of_the_file(datasets):
+    memory, spilled = datasets
+    assert list(spilled.preview(5)["Row ID"]) == list(memory.preview(5)["Row ID"]) == [1, 2, 3, 4, 5]
+
+
+def test_close_drops_the_connection_and_the_next_query_reopens_it(datasets):
+    _, spilled = datasets
+    spilled.close()
+    assert "_conn" not in spilled.__dict__
+    assert spilled.query("SELECT count(*) AS n FROM sales")["n"].iloc[0] == spilled.rows
+
+
+def test_prune_keeps_directories_in_use(superstore_csv, tmp_path):
+    spill_dir = str(tmp_path)
+    kept = outofcore.spill(superstore_csv, "kept", spill_dir=spill_dir)
+    stale = os.path.join(spill_dir, "stale")
+    os.makedirs(stale)
+    with open(os.path.join(stale, "part.parquet"), "wb") as handle:
+        handle.write(b"x" * 1024)
+
+    removed = outofcore.prune(spill_dir, budget_bytes=0)
+
+    assert removed == [os.path.abspath(stale)]
+    assert os.path.isdir(kept.path) and kept.rows > 0
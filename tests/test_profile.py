@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from dashview.profile import ColumnProfile, HyperLogLog, build_profile
+
+
+def _hashes(values) -> np.ndarray:
+    return pd.util.hash_pandas_object(pd.Series(values), index=False).to_numpy()
+
+
+@pytest.mark.parametrize("distinct", [100, 5_000, 200_000])
+def test_hyperloglog_stays_within_its_error_bound(distinct):
+    sketch = HyperLogLog()
+    sketch.add_hashes(_hashes([f"ID-{i}" for i in range(distinct)]))
+    # ~0.8% standard error at precision 14; 4% is five standard errors.
+    assert abs(sketch.estimate() - distinct) <= max(0.04 * distinct, 2)
+
+
+def test_hyperloglog_ignores_repeats_and_merges_to_the_union():
+    left, right, union = HyperLogLog(), HyperLogLog(), HyperLogLog()
+    left.add_hashes(_hashes([f"ID-{i}" for i in range(30_000)] * 3))
+    right.add_hashes(_hashes([f"ID-{i}" for i in range(20_000, 50_000)]))
+    union.add_hashes(_hashes([f"ID-{i}" for i in range(50_000)]))
+
+    left.merge(right)
+    np.testing.assert_array_equal(left.registers, union.registers)
+    assert abs(left.estimate() - 50_000) <= 0.04 * 50_000
+
+
+def test_chunked_mean_and_variance_match_numpy():
+    values = np.random.default_rng(3).lognormal(3.0, 1.5, 10_001)
+    values[::97] = np.nan
+    column = ColumnProfile(name="Sales", kind="numeric")
+    for start in range(0, len(values), 1_234):
+        column.update(pd.Series(values[start:start + 1_234]))
+
+    present = values[~np.isnan(values)]
+    assert column.count == len(present)
+    assert column.nulls == len(values) - len(present)
+    assert column.mean == pytest.approx(present.mean(), rel=1e-12)
+    assert column.variance == pytest.approx(present.var(ddof=1), rel=1e-9)
+    assert (column.minimum, column.maximum) == (present.min(), present.max())
+
+
+def test_profile_of_the_superstore_frame(superstore):
+    profile = build_profile(superstore, chunk_rows=700)
+    assert profile.rows == len(superstore)
+
+    region = profile.columns["Region"]
+    assert region.distinct_is_exact and region.distinct == superstore["Region"].nunique()
+
+    sales = profile.columns["Sales"]
+    assert sales.mean == pytest.approx(superstore["Sales"].astype("float64").mean(), rel=1e-9)
+    assert sales.variance == pytest.approx(superstore["Sales"].astype("float64").var(), rel=1e-6)
+
+
+def test_free_text_distinct_counts_are_sketched():
+    frame = pd.DataFrame({"Order ID": [f"US-{i:09d}" for i in range(20_000)] * 2})
+    column = build_profile(frame, chunk_rows=3_000).columns["Order ID"]
+    assert column.kind == "text" and not column.distinct_is_exact
+    assert column.distinct == pytest.approx(20_000, rel=0.04)
@@ -0,0 +1,96 @@
+import threading
+import time
+
+import pytest
+
+from dashview.store import DatasetStore
+
+
+class FakeDataset:
+    def __init__(self, key: str, footprint: int = 10):
+        self.key = key
+        self.footprint = footprint
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def test_a_key_is_loaded_once_and_shared():
+    store = DatasetStore(budget_bytes=100)
+    loads = []
+
+    def load():
+        loads.append(1)
+        return FakeDataset("a")
+
+    first, second = store.acquire("a", load), store.acquire("a", load)
+    assert first.dataset is second.dataset
+    assert len(loads) == 1
+    assert store.stats()["hits"] == 1 and store.stats()["misses"] == 1
+    assert store.stats()["handles"] == 2
+
+
+def test_concurrent_sessions_wait_for_a_single_load():
+    store = DatasetStore(budget_bytes=100)
+    loads = []
+
+    def load():
+        loads.append(1)
+        time.sleep(0.05)
+        return FakeDataset("a")
+
+    handles = []
+    threads = [threading.Thread(target=lambda: handles.append(store.acquire("a", load))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(loads) == 1
+    assert len({id(handle.dataset) for handle in handles}) == 1
+
+
+def test_eviction_skips_referenced_datasets_and_goes_least_recent_first():
+    store = DatasetStore(budget_bytes=35)
+    held = store.acquire("held", lambda: FakeDataset("held"))
+    old = store.acquire("old", lambda: FakeDataset("old"))
+    old.release()
+    recent = store.acquire("recent", lambda: FakeDataset("recent"))
+    recent.release()
+    evicted = old.dataset
+
+    store.acquire("new", lambda: FakeDataset("new")).release()  # 40 bytes stored: one unreferenced must go
+
+    assert "held" in store  # referenced, although least recently used
+    assert "old" not in store and evicted.closed
+    assert "recent" in store and "new" in store
+    assert store.stats()["evictions"] == 1
+    assert not held.released
+
+
+def test_released_handles_make_a_dataset_evictable():
+    store = DatasetStore(budget_bytes=15)
+    handle = store.acquire("a", lambda: FakeDataset("a"))
+    store.acquire("b", lambda: FakeDataset("b")).release()
+    assert "a" in store and "b" not in store
+
+    handle.release()
+    assert handle.released
+    store.acquire("c", lambda: FakeDataset("c"))
+    assert "a" not in store
+
+
+def test_a_failed_load_leaves_nothing_behind():
+    store = DatasetStore(budget_bytes=100)
+
+    def fail():
+        raise ValueError("bad upload")
+
+    with pytest.raises(ValueError):
+        store.acquire("a", fail)
+    assert "a" not in store
+    assert store._loading == {}
+    assert store.stats()["handles"] == 0
+
+    # The next attempt loads again instead of finding a stale entry.
+    assert store.acquire("a", lambda: FakeDataset("a")).dataset.key == "a"